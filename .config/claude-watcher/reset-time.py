@@ -13,9 +13,20 @@ no pip deps. The clock time and the timezone are captured by *separate* regexes
 IANA/offset zone in parens).
 
 Usage: reset-time.py [--now EPOCH] [--margin SECONDS]   (banner on stdin)
+       reset-time.py --batch [-z] [--now EPOCH] [--margin SECONDS]
+
+--batch keeps one process alive for many banners (e.g. as a coprocess): each
+stdin line is one banner, optionally prefixed "EPOCH<TAB>" to override --now
+for that line, and each gets exactly one stdout line back, flushed at once -
+the epoch, or an empty line where the single-banner mode would exit non-zero.
+A pane capture spans several lines (the banner wraps across TUI box lines),
+so a caller feeding captures either flattens each to one line or passes -z:
+banners are then NUL-terminated (`printf '%s\0' "$stripped"`) and may hold
+newlines. The answers stay one line each.
 """
 
 import argparse
+import functools
 import re
 import sys
 import time
@@ -67,6 +78,12 @@ def strip_ansi(text):
     return _ANSI.sub("", text)
 
 
+@functools.cache
+def zone(name):
+    """ZoneInfo by IANA name, memoised so a --batch process resolves each zone once."""
+    return ZoneInfo(name)
+
+
 def resolve_tz(banner):
     """Return a tzinfo from the banner, or None if none present/parseable.
 
@@ -75,7 +92,7 @@ def resolve_tz(banner):
     """
     m = _TZ_IANA.search(banner)
     if m:
-        return ZoneInfo(m.group(1))  # may raise ZoneInfoNotFoundError
+        return zone(m.group(1))  # may raise ZoneInfoNotFoundError
     m = _TZ_OFFSET.search(banner)
     if m:
         hours = int(m.group(1))
@@ -83,7 +100,7 @@ def resolve_tz(banner):
         sign = 1 if hours >= 0 else -1
         return timezone(timedelta(hours=hours, minutes=sign * mins))
     if _TZ_BARE.search(banner):
-        return ZoneInfo("UTC")
+        return zone("UTC")
     return None
 
 
@@ -160,20 +177,63 @@ def compute(banner, now_epoch, margin):
     return None
 
 
+def safe_compute(banner, now_epoch, margin):
+    """compute(), with every unparseable/unknown-zone failure folded into None."""
+    try:
+        return compute(banner, now_epoch, margin)
+    except (ZoneInfoNotFoundError, ValueError, OverflowError, OSError):
+        return None
+
+
+def split_now(line):
+    """Split an optional leading "EPOCH<TAB>" off a --batch line -> (epoch or None, banner)."""
+    head, tab, rest = line.partition("\t")
+    try:
+        return (int(head), rest) if tab else (None, line)
+    except ValueError:
+        return None, line
+
+
+def nul_records(stream):
+    """NUL-terminated records from `stream`, each yielded as soon as its NUL arrives."""
+    record = []
+    while char := stream.read(1):
+        if char == "\0":
+            yield "".join(record)
+            record = []
+        else:
+            record.append(char)
+    if record:
+        yield "".join(record)
+
+
+def run_batch(lines, out, now, margin):
+    for line in lines:
+        line_now, banner = split_now(line.rstrip("\n"))
+        if line_now is None:
+            line_now = now if now is not None else int(time.time())
+        result = safe_compute(banner, line_now, margin)
+        out.write(f"{result}\n" if result is not None else "\n")
+        out.flush()  # a coprocess caller is blocked reading this line
+    return 0
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--now", type=int, default=None, help="epoch seconds (default: real now)")
     ap.add_argument("--margin", type=int, default=60, help="seconds added to the reset time")
+    ap.add_argument("--batch", action="store_true", help="one banner per stdin line, one epoch out")
+    ap.add_argument(
+        "-z", "--null", action="store_true", help="with --batch, banners are NUL-terminated"
+    )
     args = ap.parse_args()
 
-    now_epoch = args.now if args.now is not None else int(time.time())
-    banner = sys.stdin.read()
-
-    try:
-        result = compute(banner, now_epoch, args.margin)
-    except (ZoneInfoNotFoundError, ValueError, OverflowError, OSError):
-        return 1
+    if args.batch:
+        banners = nul_records(sys.stdin) if args.null else sys.stdin
+        return run_batch(banners, sys.stdout, args.now, args.margin)
 
+    now_epoch = args.now if args.now is not None else int(time.time())
+    result = safe_compute(sys.stdin.read(), now_epoch, args.margin)
     if result is None:
         return 1
     print(result)
@@ -122,6 +122,58 @@ check_fail("garbage", "the quick brown fox", now)
 # 7. Unknown/bogus zone -> non-zero.
 check_fail("bogus-zone", "resets 3pm (Bogus/Zone)", now)
 
+# 8. --batch: one banner per line, optional per-line "EPOCH<TAB>" --now override,
+#    one output line each (empty where single mode would exit non-zero), in order.
+now = epoch(2026, 5, 31, 12, 0, "America/Santiago")
+later = epoch(2026, 5, 31, 16, 0, "America/Santiago")
+lines = [
+    "reset at 3pm (America/Santiago).",  # uses --now
+    f"{later}\treset at 3pm (America/Santiago).",  # past 3pm -> tomorrow
+    "the quick brown fox",
+    "resets 3pm (Bogus/Zone)",
+    f"{now}\ttry again in 3 hours",
+]
+p = subprocess.run(
+    [sys.executable, str(SCRIPT), "--batch", "--now", str(now), "--margin", "60"],
+    input="".join(line + "\n" for line in lines),
+    capture_output=True,
+    text=True,
+    check=False,
+)
+expected = [
+    str(epoch(2026, 5, 31, 15, 0, "America/Santiago") + 60),
+    str(epoch(2026, 6, 1, 15, 0, "America/Santiago") + 60),
+    "",
+    "",
+    str(now + 3 * 3600 + 60),
+]
+if p.returncode != 0 or p.stdout.split("\n")[:-1] != expected:
+    failures.append(f"batch: expected {expected} (exit 0), got {p.stdout!r} (exit {p.returncode})")
+
+# 9. --batch -z: NUL-terminated banners, so a multi-line pane capture (the zone
+#    wrapped onto the next TUI box line) is one banner, answered on one line.
+records = [
+    "5-hour limit reached\n│ resets 3pm\n│ (America/Santiago)\n",
+    f"{later}\treset at 3pm\n(America/Santiago).",
+    "the quick\nbrown fox",
+]
+p = subprocess.run(
+    [sys.executable, str(SCRIPT), "--batch", "-z", "--now", str(now), "--margin", "60"],
+    input="".join(record + "\0" for record in records),
+    capture_output=True,
+    text=True,
+    check=False,
+)
+expected = [
+    str(epoch(2026, 5, 31, 15, 0, "America/Santiago") + 60),
+    str(epoch(2026, 6, 1, 15, 0, "America/Santiago") + 60),
+    "",
+]
+if p.returncode != 0 or p.stdout.split("\n")[:-1] != expected:
+    failures.append(
+        f"batch -z: expected {expected} (exit 0), got {p.stdout!r} (exit {p.returncode})"
+    )
+
 if failures:
     print("FAIL:")
     for f in failures:
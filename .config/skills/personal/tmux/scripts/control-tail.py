@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Follow one tmux pane through control mode and optionally wait for a regex."""
+"""Follow tmux panes through control mode and optionally wait for a regex."""
 
 from __future__ import annotations
 
@@ -7,15 +7,24 @@ import argparse
 import codecs
 import os
 import re
-import select
+import selectors
 import subprocess
 import sys
 import time
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from itertools import islice
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
 OSC_RE = re.compile(r"\x1b\][^\x07]*(?:\x07|\x1b\\)")
+OCTAL_ESCAPE_RE = re.compile(rb"\\[0-7]{3}")
+# Byte for every \ooo escape that fits in one. tmux only escapes bytes below
+# 0o40 and the backslash itself; anything past 0o377 is left literal.
+OCTAL_ESCAPES = {b"\\%03o" % value: bytes([value]) for value in range(0o400)}
+# Completed lines re-searched alongside new output, so a --pattern spanning a
+# line break still matches when the break and the rest arrive separately.
+MATCH_LOOKBACK_LINES = 8
 
 
 @dataclass(frozen=True)
@@ -52,7 +61,14 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Tail tmux pane output via control mode.",
     )
-    parser.add_argument("-t", "--target", required=True, help="tmux target pane/window/session")
+    parser.add_argument(
+        "-t",
+        "--target",
+        action="append",
+        dest="targets",
+        required=True,
+        help="tmux target pane/window/session; repeat to follow several panes at once",
+    )
     socket_group = parser.add_mutually_exclusive_group()
     socket_group.add_argument("-L", "--socket-name", help="tmux socket name")
     socket_group.add_argument("-S", "--socket-path", help="tmux socket path")
@@ -87,37 +103,27 @@ def run_tmux(args: argparse.Namespace, command: Sequence[str]) -> subprocess.Com
     )
 
 
-def resolve_target(args: argparse.Namespace) -> Target:
+def resolve_target(args: argparse.Namespace, target: str) -> Target:
     completed = run_tmux(
         args,
-        ["display-message", "-p", "-t", args.target, "#{pane_id}|#{session_id}"],
+        ["display-message", "-p", "-t", target, "#{pane_id}|#{session_id}"],
     )
     if completed.returncode != 0:
-        message = completed.stderr.strip() or f"tmux target not found: {args.target}"
+        message = completed.stderr.strip() or f"tmux target not found: {target}"
         raise CliError(message, completed.returncode or 1)
 
     pane_id, separator, session_id = completed.stdout.strip().partition("|")
     if not separator or not pane_id.startswith("%") or not session_id.startswith("$"):
-        raise CliError(f"could not resolve tmux target: {args.target}")
+        raise CliError(f"could not resolve tmux target: {target}")
     return Target(pane_id=pane_id, session_id=session_id)
 
 
 def decode_tmux_payload(payload: bytes) -> bytes:
-    decoded = bytearray()
-    index = 0
-    while index < len(payload):
-        byte = payload[index]
-        if (
-            byte == 0x5C
-            and index + 3 < len(payload)
-            and all(0x30 <= payload[index + offset] <= 0x37 for offset in (1, 2, 3))
-        ):
-            decoded.append(int(payload[index + 1 : index + 4], 8))
-            index += 4
-            continue
-        decoded.append(byte)
-        index += 1
-    return bytes(decoded)
+    # One C-level scan per payload instead of a Python loop per byte: this is
+    # the hot path when following a pane that prints a lot.
+    if b"\\" not in payload:
+        return payload
+    return OCTAL_ESCAPE_RE.sub(lambda match: OCTAL_ESCAPES.get(match[0], match[0]), payload)
 
 
 def normalise_terminal_text(text: str) -> str:
@@ -134,13 +140,47 @@ def trim_lines(text: str, max_lines: int) -> str:
     return "".join(lines[-max_lines:])
 
 
-def seed_buffer(args: argparse.Namespace, regex: re.Pattern[str] | None) -> SeedResult:
+class LineWindow:
+    """The last max_lines lines of normalised output, searched incrementally.
+
+    feed() returns only what a new chunk can have changed - the lines it
+    completed, the still-open last line, and a short lookback - so matching a
+    chatty pane costs per chunk, not per chunk times buffer size.
+    """
+
+    def __init__(self, max_lines: int, lookback: int = MATCH_LOOKBACK_LINES) -> None:
+        self.lines: deque[str] = deque(maxlen=max(max_lines, 0))
+        self.partial = ""
+        self.lookback = lookback
+
+    def feed(self, text: str) -> str:
+        pieces = (self.partial + text).split("\n")
+        self.partial = pieces.pop()
+        completed = [piece + "\n" for piece in pieces]
+        context = list(islice(reversed(self.lines), self.lookback))
+        context.reverse()
+        self.lines.extend(completed)
+        return "".join(context) + "".join(completed) + self.partial
+
+    def text(self) -> str:
+        lines = list(self.lines)
+        if self.partial:
+            # The open line counts towards max_lines, as it did in trim_lines.
+            if len(lines) == self.lines.maxlen:
+                lines = lines[1:]
+            lines.append(self.partial)
+        return "".join(lines)
+
+
+def seed_buffer(
+    args: argparse.Namespace, target: Target, regex: re.Pattern[str] | None
+) -> SeedResult:
     if args.no_seed or regex is None:
         return SeedResult(buffer="", matched=False)
 
     completed = run_tmux(
         args,
-        ["capture-pane", "-p", "-S", f"-{args.lines}", "-t", args.target],
+        ["capture-pane", "-p", "-S", f"-{args.lines}", "-t", target.pane_id],
     )
     if completed.returncode != 0:
         return SeedResult(buffer="", matched=False)
@@ -190,11 +230,14 @@ def stop_control_client(process: subprocess.Popen[bytes]) -> None:
             process.kill()
 
 
-def print_timeout(args: argparse.Namespace, buffer: str) -> None:
+def print_timeout(args: argparse.Namespace, buffers: dict[str, str]) -> None:
+    """Report the timeout and each pane's last output (named when several)."""
     print(f"Timeout after {args.timeout:g}s waiting for pattern {args.pattern!r}", file=sys.stderr)
-    if buffer:
-        print("Last normalised output:", file=sys.stderr)
-        print(buffer.rstrip("\n"), file=sys.stderr)
+    for pane, buffer in buffers.items():
+        if buffer:
+            of = f" of {pane}" if len(buffers) > 1 else ""
+            print(f"Last normalised output{of}:", file=sys.stderr)
+            print(buffer.rstrip("\n"), file=sys.stderr)
 
 
 def control_deadline(args: argparse.Namespace) -> float | None:
@@ -208,93 +251,171 @@ def raise_if_exited(process: subprocess.Popen[bytes]) -> None:
     raise ControlClientExited(process.returncode or 0, stderr)
 
 
-def iter_pane_text(args: argparse.Namespace, target: Target):
-    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-    pane_id_bytes = target.pane_id.encode()
-    deadline = control_deadline(args)
+class ControlClient:
+    """A `tmux -C attach` client whose stdout is read without blocking.
 
-    process = subprocess.Popen(
-        tmux_command(args, ["-C", "attach", "-t", target.session_id]),
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+    os.read on a non-blocking fd returns whatever the pipe holds, split into
+    lines here; nothing sits in a Python-side buffer that select cannot see.
+    """
 
-    try:
-        assert process.stdout is not None
+    def __init__(self, args: argparse.Namespace, session_id: str) -> None:
+        self.process = subprocess.Popen(
+            tmux_command(args, ["-C", "attach", "-t", session_id]),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert self.process.stdout is not None
+        self.fd = self.process.stdout.fileno()
+        os.set_blocking(self.fd, False)
+        self.pending = b""
+
+    def read_lines(self) -> list[bytes]:
+        """Complete lines read so far; raises ControlClientExited at EOF."""
+        try:
+            chunk = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        if not chunk:
+            self.process.wait()
+            raise_if_exited(self.process)
+        *lines, self.pending = (self.pending + chunk).split(b"\n")
+        return lines
+
+    def stop(self) -> None:
+        stop_control_client(self.process)
+
+
+def iter_control_output(
+    clients: Sequence[ControlClient], deadline: float | None
+) -> Iterator[tuple[bytes, bytes]]:
+    """(pane id, raw payload) for every %output line any client reports."""
+    with selectors.DefaultSelector() as selector:
+        for client in clients:
+            selector.register(client.fd, selectors.EVENT_READ, client)
         while True:
-            remaining = None
+            timeout = None
             if deadline is not None:
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
                     raise ControlTimeout
-
-            wait_time = 0.1 if remaining is None else min(0.1, max(0.0, remaining))
-            ready, _, _ = select.select([process.stdout], [], [], wait_time)
-            if not ready:
-                raise_if_exited(process)
+            for key, _ in selector.select(timeout):
+                client: ControlClient = key.data
+                for line in client.read_lines():
+                    parsed = parse_output_line(line)
+                    if parsed is not None:
+                        yield parsed
+
+
+def iter_panes_text(
+    args: argparse.Namespace, targets: Sequence[Target]
+) -> Iterator[tuple[str, str]]:
+    """(pane id, decoded text) for every target pane.
+
+    One control client per distinct session - a single connection when the
+    panes share one - multiplexed with selectors, one decoder per pane.
+    """
+    decoders = {
+        target.pane_id.encode(): codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for target in targets
+    }
+    sessions = dict.fromkeys(target.session_id for target in targets)
+    clients: list[ControlClient] = []
+    try:
+        for session_id in sessions:
+            clients.append(ControlClient(args, session_id))
+        for pane, payload in iter_control_output(clients, control_deadline(args)):
+            decoder = decoders.get(pane)
+            if decoder is None:
                 continue
+            text = decoder.decode(decode_tmux_payload(payload))
+            if text:
+                yield pane.decode(), text
+    finally:
+        for client in clients:
+            client.stop()
 
-            if deadline is not None and time.monotonic() >= deadline:
-                raise ControlTimeout
 
-            line = process.stdout.readline()
-            if not line:
-                raise_if_exited(process)
-                time.sleep(0.05)
-                continue
+def stream_panes_text(args: argparse.Namespace, targets: Sequence[Target]) -> int:
+    # Whole lines only, each tagged with its pane, so interleaved output from
+    # several panes stays readable.
+    partial = {target.pane_id: "" for target in targets}
 
-            parsed = parse_output_line(line)
-            if parsed is None:
-                continue
+    def flush(pane: str, text: str) -> None:
+        *lines, partial[pane] = (partial[pane] + text).split("\n")
+        for line in lines:
+            sys.stdout.write(f"[{pane}] {line}\n")
+        sys.stdout.flush()
 
-            output_pane, payload = parsed
-            if output_pane != pane_id_bytes:
-                continue
+    try:
+        for pane, text in iter_panes_text(args, targets):
+            flush(pane, text)
+    except ControlTimeout:
+        pass
+    except ControlClientExited as error:
+        if error.stderr.strip():
+            print(error.stderr.strip(), file=sys.stderr)
+        return error.exit_code
+    for pane, text in partial.items():
+        if text:
+            flush(pane, text + "\n")
+    return 0
 
-            text = decoder.decode(decode_tmux_payload(payload))
-            if not text:
-                continue
-            yield text
-    finally:
-        stop_control_client(process)
 
+def wait_for_pattern_in_panes(
+    args: argparse.Namespace, targets: Sequence[Target], regex: re.Pattern[str]
+) -> int:
+    # Messages name the pane only when there is more than one to tell apart.
+    def where(pane: str, preposition: str) -> str:
+        return f" {preposition} {pane}" if len(targets) > 1 else ""
+
+    windows: dict[str, LineWindow] = {}
+    for target in targets:
+        seed = seed_buffer(args, target, regex)
+        if seed.matched:
+            print(f"Pattern {args.pattern!r} found in existing output{where(target.pane_id, 'of')}")
+            return 0
+        windows[target.pane_id] = LineWindow(args.lines)
+        windows[target.pane_id].feed(seed.buffer)
 
-def stream_text(args: argparse.Namespace, target: Target) -> int:
     try:
-        for text in iter_pane_text(args, target):
-            sys.stdout.write(text)
-            sys.stdout.flush()
-        return 0
+        for pane, text in iter_panes_text(args, targets):
+            if regex.search(windows[pane].feed(normalise_terminal_text(text))):
+                print(f"Pattern {args.pattern!r} found{where(pane, 'in')}")
+                return 0
     except ControlTimeout:
-        return 0
+        print_timeout(args, {pane: window.text() for pane, window in windows.items()})
+        return 1
     except ControlClientExited as error:
         if error.stderr.strip():
             print(error.stderr.strip(), file=sys.stderr)
         return error.exit_code
+    return 0
 
 
-def wait_for_pattern(args: argparse.Namespace, target: Target, regex: re.Pattern[str]) -> int:
-    seed = seed_buffer(args, regex)
-    if seed.matched:
-        print(f"Pattern {args.pattern!r} found in existing output")
-        return 0
+def iter_pane_text(args: argparse.Namespace, target: Target) -> Iterator[str]:
+    # Event-driven: the selector wakes only on pipe data or the deadline, so a
+    # match is seen as soon as tmux writes it and an idle pane costs nothing.
+    for _, text in iter_panes_text(args, [target]):
+        yield text
 
-    buffer = seed.buffer
+
+def stream_text(args: argparse.Namespace, target: Target) -> int:
     try:
         for text in iter_pane_text(args, target):
-            buffer = trim_lines(buffer + normalise_terminal_text(text), args.lines)
-            if regex.search(buffer):
-                print(f"Pattern {args.pattern!r} found")
-                return 0
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        return 0
     except ControlTimeout:
-        print_timeout(args, buffer)
-        return 1
+        return 0
     except ControlClientExited as error:
         if error.stderr.strip():
             print(error.stderr.strip(), file=sys.stderr)
         return error.exit_code
-    return 0
+
+
+def wait_for_pattern(args: argparse.Namespace, target: Target, regex: re.Pattern[str]) -> int:
+    return wait_for_pattern_in_panes(args, [target], regex)
 
 
 def compile_pattern(pattern: str) -> re.Pattern[str]:
@@ -304,16 +425,23 @@ def compile_pattern(pattern: str) -> re.Pattern[str]:
         raise CliError(f"invalid regex {pattern!r}: {error}", 2) from error
 
 
-def follow(args: argparse.Namespace, target: Target) -> int:
+def follow(args: argparse.Namespace, targets: Sequence[Target]) -> int:
+    if len(targets) > 1:
+        if args.pattern:
+            return wait_for_pattern_in_panes(args, targets, compile_pattern(args.pattern))
+        return stream_panes_text(args, targets)
     if args.pattern:
-        return wait_for_pattern(args, target, compile_pattern(args.pattern))
-    return stream_text(args, target)
+        return wait_for_pattern(args, targets[0], compile_pattern(args.pattern))
+    return stream_text(args, targets[0])
 
 
 def main() -> int:
     args = parse_args()
     try:
-        return follow(args, resolve_target(args))
+        resolved = [resolve_target(args, target) for target in args.targets]
+        # Two spellings of one pane (%3, work:0.1) are one pane to follow.
+        targets = list({target.pane_id: target for target in resolved}.values())
+        return follow(args, targets)
     except CliError as error:
         print(error.message, file=sys.stderr)
         return error.exit_code
@@ -0,0 +1,58 @@
+"""Micro-benchmark: control-tail's %output decoding over a captured stream.
+
+Not collected by pytest (no test_ prefix). Run by hand after touching the
+decoder:
+
+    python3 tests/bench_control_tail.py [capture.log ...]
+
+With no arguments it replays fixtures/control-build.log, a real
+`tmux -C attach` capture. Pass your own captures (e.g. `tmux -C attach -t
+build > noisy.log`) to measure a specific workload.
+"""
+
+import importlib.util
+import sys
+import timeit
+from pathlib import Path
+
+from test_control_tail import byte_loop_decode
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "control-tail.py"
+spec = importlib.util.spec_from_file_location("control_tail", SCRIPT)
+control_tail = importlib.util.module_from_spec(spec)
+sys.modules["control_tail"] = control_tail  # dataclasses resolves the module by name
+spec.loader.exec_module(control_tail)
+
+
+def payloads(paths: list[Path]) -> list[bytes]:
+    result = []
+    for path in paths:
+        for line in path.read_bytes().splitlines(keepends=True):
+            parsed = control_tail.parse_output_line(line)
+            if parsed:
+                result.append(parsed[1])
+    return result
+
+
+def bench(name: str, decode, data: list[bytes], total: int) -> float:
+    runs = 5
+    best = min(timeit.repeat(lambda: [decode(p) for p in data], number=1, repeat=runs))
+    print(f"{name:>10}: {best * 1000:8.2f} ms  {total / best / 1e6:8.1f} MB/s")
+    return best
+
+
+def main() -> int:
+    paths = [Path(arg) for arg in sys.argv[1:]] or [
+        Path(__file__).parent / "fixtures" / "control-build.log"
+    ]
+    data = payloads(paths)
+    total = sum(map(len, data))
+    print(f"{len(data)} %output payloads, {total} bytes")
+    loop = bench("byte loop", byte_loop_decode, data, total)
+    current = bench("current", control_tail.decode_tmux_payload, data, total)
+    print(f"{'speedup':>10}: {loop / current:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,15 @@
-"""Unit tests for control-tail.py's pure parsing helpers."""
+"""Unit tests for control-tail.py's parsing and control-client reading helpers."""
 
 import importlib.util
+import os
 import sys
+import time
 from pathlib import Path
 
+import pytest
+
 SCRIPT = Path(__file__).parent.parent / "scripts" / "control-tail.py"
+FIXTURES = Path(__file__).parent / "fixtures"
 spec = importlib.util.spec_from_file_location("control_tail", SCRIPT)
 control_tail = importlib.util.module_from_spec(spec)
 sys.modules["control_tail"] = control_tail  # dataclasses resolves the module by name
@@ -12,6 +17,9 @@ spec.loader.exec_module(control_tail)
 
 decode_tmux_payload = control_tail.decode_tmux_payload
 parse_output_line = control_tail.parse_output_line
+LineWindow = control_tail.LineWindow
+ControlClient = control_tail.ControlClient
+iter_control_output = control_tail.iter_control_output
 
 
 class TestDecodeTmuxPayload:
@@ -36,6 +44,40 @@ class TestDecodeTmuxPayload:
     def test_consecutive_escapes(self):
         assert decode_tmux_payload(b"\\015\\012") == b"\r\n"
 
+    def test_decoded_backslash_does_not_start_a_new_escape(self):
+        assert decode_tmux_payload(b"\\134015") == b"\\015"
+
+    def test_out_of_byte_range_escape_stays_literal(self):
+        assert decode_tmux_payload(b"\\400") == b"\\400"
+
+    def test_matches_byte_loop_on_captured_stream(self):
+        # fixtures/control-build.log is a real `tmux -C attach` capture of a
+        # pane printing a coloured build log.
+        lines = (FIXTURES / "control-build.log").read_bytes().splitlines(keepends=True)
+        payloads = [parsed[1] for parsed in map(parse_output_line, lines) if parsed]
+        assert payloads
+        for payload in payloads:
+            assert decode_tmux_payload(payload) == byte_loop_decode(payload)
+
+
+def byte_loop_decode(payload: bytes) -> bytes:
+    """The original per-byte decoder, kept as the parity oracle."""
+    decoded = bytearray()
+    index = 0
+    while index < len(payload):
+        byte = payload[index]
+        if (
+            byte == 0x5C
+            and index + 3 < len(payload)
+            and all(0x30 <= payload[index + offset] <= 0x37 for offset in (1, 2, 3))
+        ):
+            decoded.append(int(payload[index + 1 : index + 4], 8))
+            index += 4
+            continue
+        decoded.append(byte)
+        index += 1
+    return bytes(decoded)
+
 
 class TestParseOutputLine:
     def test_output_line(self):
@@ -66,3 +108,73 @@ class TestParseOutputLine:
 
     def test_truncated_output_line_is_none(self):
         assert parse_output_line(b"%output %1\n") is None
+
+
+class TestLineWindow:
+    def test_open_last_line_is_searched_before_its_newline_arrives(self):
+        window = LineWindow(40)
+        assert window.feed("Pass") == "Pass"
+        assert window.feed("word: ") == "Password: "
+
+    def test_search_text_is_new_lines_plus_lookback_not_whole_buffer(self):
+        window = LineWindow(40, lookback=2)
+        window.feed("".join(f"line {n}\n" for n in range(10)))
+        assert window.feed("next\n") == "line 8\nline 9\nnext\n"
+
+    def test_pattern_split_across_chunks_and_lines_still_matches(self):
+        regex = control_tail.compile_pattern(r"^BUILD\nOK$")
+        window = LineWindow(40)
+        assert not regex.search(window.feed("BUILD\n"))
+        assert regex.search(window.feed("OK\n"))
+
+    def test_keeps_only_the_last_max_lines_for_the_timeout_report(self):
+        window = LineWindow(3)
+        window.feed("a\nb\nc\nd\ne")
+        assert window.text() == "c\nd\ne"
+
+
+@pytest.fixture
+def pipe_clients():
+    """ControlClients reading plain pipes instead of a tmux -C process."""
+    writers = []
+
+    def make():
+        read_fd, write_fd = os.pipe()
+        writers.append(write_fd)
+        client = ControlClient.__new__(ControlClient)
+        client.fd = read_fd
+        client.pending = b""
+        os.set_blocking(read_fd, False)
+        return client, write_fd
+
+    yield make
+    for fd in writers:
+        os.close(fd)
+
+
+def collect_until_timeout(clients, seconds=0.2):
+    seen = []
+    with pytest.raises(control_tail.ControlTimeout):
+        for pane, payload in iter_control_output(clients, time.monotonic() + seconds):
+            seen.append((pane, payload))
+    return seen
+
+
+class TestIterControlOutput:
+    def test_demultiplexes_output_lines_from_several_clients(self, pipe_clients):
+        first, first_w = pipe_clients()
+        second, second_w = pipe_clients()
+        os.write(first_w, b"%output %1 one\n%begin 1 2 0\n%output %2 two\n")
+        os.write(second_w, b"%output %3 three\n")
+
+        seen = collect_until_timeout([first, second])
+
+        assert sorted(seen) == [(b"%1", b"one"), (b"%2", b"two"), (b"%3", b"three")]
+
+    def test_line_split_across_reads_is_reassembled(self, pipe_clients):
+        client, write_fd = pipe_clients()
+        os.write(write_fd, b"%output %1 hel")
+        assert client.read_lines() == []
+        os.write(write_fd, b"lo\n%output %1 ne")
+        assert client.read_lines() == [b"%output %1 hello"]
+        assert client.pending == b"%output %1 ne"
@@ -2,17 +2,24 @@
 """Resolve a live Claude Code process to a session id.
 
 This is intentionally read-only. It combines Claude's pid registry, launch
-arguments, open transcript files, and pane-content verification.
+arguments, open transcript files, and pane-content verification. The only
+thing it writes is its own shingle index under ~/.cache, which content
+matching rebuilds from the transcripts whenever it is missing or stale.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shlex
+import sqlite3
 import subprocess
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
@@ -21,6 +28,15 @@ SESSION_ID_RE = re.compile(
     r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
 )
 ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
+MAX_HITS = 8
+# Tail-first scoring reads at most this much of each transcript, and content
+# matching as a whole stops taking on new candidates after the time budget.
+TAIL_BLOCK_SIZE = 64 * 1024
+TAIL_BYTE_BUDGET = 8 * 1024 * 1024
+MATCH_TIME_BUDGET = 1.5
+# Bump when chunking, hashing or what a row records changes: a mismatched
+# index is dropped whole.
+INDEX_VERSION = 2
 
 
 # These aliases are quoted strings, not bare `str | int | ...`, because this
@@ -71,12 +87,17 @@ def home_path(*parts: str) -> Path:
     return Path(os.environ.get("HOME", str(Path.home()))).joinpath(*parts)
 
 
-def run(args: list[str]) -> str:
+def run(args: list[str], allow_fail: bool = False) -> str:
+    """A command's stdout, or "" if it fails.
+
+    allow_fail keeps the stdout of a non-zero exit: `lsof -p a,b` and
+    `ps -p a,b` exit 1 when any one pid is gone, yet still report the rest.
+    """
     try:
         proc = subprocess.run(args, check=False, text=True, capture_output=True)
     except OSError:
         return ""
-    if proc.returncode != 0:
+    if proc.returncode != 0 and not allow_fail:
         return ""
     return proc.stdout
 
@@ -133,7 +154,51 @@ def registry_result(pid: str, config_dir: Path) -> ResolveResult | None:
     )
 
 
+def proc_path(pid: str, *parts: str) -> Path:
+    # Linux procfs (RESURRECT_PROC_ROOT overrides for tests). Each proc_*
+    # reader returns None when the pid has no readable entry - always the case
+    # on macOS - and the caller falls back to ps/lsof.
+    return Path(os.environ.get("RESURRECT_PROC_ROOT", "/proc"), pid, *parts)
+
+
+def proc_command(pid: str) -> str | None:
+    try:
+        raw = proc_path(pid, "cmdline").read_bytes()
+    except OSError:
+        return None
+    args = raw.rstrip(b"\0").split(b"\0") if raw else []
+    # Quoted so parse_session_id_from_command splits it back into exact argv.
+    return shlex.join(arg.decode(errors="replace") for arg in args)
+
+
+def proc_cwd(pid: str) -> str | None:
+    try:
+        return os.readlink(proc_path(pid, "cwd"))
+    except OSError:
+        return None
+
+
+def proc_open_files(pid: str) -> list[str] | None:
+    fd_dir = proc_path(pid, "fd")
+    try:
+        fds = os.listdir(fd_dir)
+    except OSError:
+        return None
+    names: list[str] = []
+    for fd in fds:
+        try:
+            target = os.readlink(fd_dir / fd)
+        except OSError:
+            continue
+        if target.startswith("/"):
+            names.append(target)
+    return names
+
+
 def command_for_pid(pid: str) -> str:
+    command = proc_command(pid)
+    if command is not None:
+        return command
     return run(["ps", "-o", "command=", "-p", pid]).strip()
 
 
@@ -153,6 +218,9 @@ def parse_session_id_from_command(command: str) -> str:
 
 
 def cwd_for_pid(pid: str) -> str:
+    cwd = proc_cwd(pid)
+    if cwd is not None:
+        return cwd
     field_out = run(["lsof", "-a", "-p", pid, "-d", "cwd", "-Fn"])
     for line in field_out.splitlines():
         if line.startswith("n/"):
@@ -166,8 +234,7 @@ def cwd_for_pid(pid: str) -> str:
     return ""
 
 
-def launch_arg_result(pid: str, cwd: str) -> ResolveResult | None:
-    command = command_for_pid(pid)
+def launch_arg_result(pid: str, cwd: str, command: str) -> ResolveResult | None:
     sid = parse_session_id_from_command(command)
     if not sid:
         return None
@@ -176,7 +243,7 @@ def launch_arg_result(pid: str, cwd: str) -> ResolveResult | None:
         pid=int(pid),
         session_id=sid,
         source="launch-args",
-        cwd=cwd or cwd_for_pid(pid),
+        cwd=cwd,
         evidence=(f"command:{command}",),
     )
 
@@ -196,18 +263,25 @@ def session_id_from_jsonl(path: Path) -> str:
     return path.stem if SESSION_ID_RE.match(path.stem) else ""
 
 
-def open_jsonl_result(pid: str, cwd: str, config_dir: Path) -> ResolveResult | None:
-    paths: list[Path] = []
-    seen: set[str] = set()
-
+def open_files_for_pid(pid: str) -> list[str]:
+    names = proc_open_files(pid)
+    if names is not None:
+        return names
     field_out = run(["lsof", "-p", pid, "-Fn"])
     candidates = [line[1:] for line in field_out.splitlines() if line.startswith("n/")]
     if not candidates:
         out = run(["lsof", "-p", pid])
         candidates = [line.split()[-1] for line in out.splitlines() if line.split()]
+    return candidates
+
 
+def open_jsonl_result(
+    pid: str, cwd: str, config_dir: Path, open_files: list[str]
+) -> ResolveResult | None:
+    paths: list[Path] = []
+    seen: set[str] = set()
     projects_prefix = f"{config_dir}/projects/"
-    for candidate in candidates:
+    for candidate in open_files:
         if projects_prefix not in candidate or not candidate.endswith(".jsonl"):
             continue
         if candidate not in seen:
@@ -223,7 +297,7 @@ def open_jsonl_result(pid: str, cwd: str, config_dir: Path) -> ResolveResult | N
         pid=int(pid),
         session_id=sid,
         source="open-jsonl",
-        cwd=cwd or cwd_for_pid(pid),
+        cwd=cwd,
         evidence=(f"open-jsonl:{paths[0]}",),
     )
 
@@ -288,45 +362,345 @@ def chunk_windows(text: str) -> list[str]:
     return chunks
 
 
+def line_chunks(line: bytes) -> tuple[str, int, list[str]]:
+    """Return (sessionId, weight, chunks) for one raw transcript line."""
+    obj = json_line_object(line.decode(errors="replace"))
+    if obj is None:
+        return "", 0, []
+    weight = 2 if obj.get("type") == "user" else 1
+    chunks: list[str] = []
+    for part in text_parts(obj):
+        chunks.extend(chunk_windows(normalise(part)))
+    return object_str(obj, "sessionId"), weight, chunks
+
+
+def tail_lines(path: Path, byte_budget: int = TAIL_BYTE_BUDGET) -> Iterator[bytes]:
+    """Yield a file's lines newest-first, reading backwards from EOF in blocks.
+
+    Stops after byte_budget bytes; a line cut by the budget is dropped rather
+    than yielded half-read.
+    """
+    with path.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        remaining = byte_budget
+        head = b""
+        while pos > 0 and remaining > 0:
+            size = min(TAIL_BLOCK_SIZE, pos, remaining)
+            pos -= size
+            remaining -= size
+            fh.seek(pos)
+            lines = (fh.read(size) + head).split(b"\n")
+            head = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if pos == 0 and head:
+            yield head
+
+
 def score_jsonl(path: Path, capture_norm: str) -> JsonObject:
+    # Pane text is almost always the newest messages, so score from the tail:
+    # the hit cap usually lands within the first block or two.
     score = 0
-    sid = ""
     hits: list[str] = []
     seen_hits: set[str] = set()
     try:
-        with path.open(errors="replace") as fh:
-            for line in fh:
-                obj = json_line_object(line)
-                if obj is None:
-                    continue
-                if not sid:
-                    sid = object_str(obj, "sessionId")
-                weight = 2 if obj.get("type") == "user" else 1
-                for part in text_parts(obj):
-                    for chunk in chunk_windows(normalise(part)):
-                        if chunk in capture_norm and chunk not in seen_hits:
-                            seen_hits.add(chunk)
-                            score += weight
-                            hits.append(chunk[:120])
-                            if len(hits) >= 8:
-                                return {
-                                    "path": str(path),
-                                    "sessionId": sid or path.stem,
-                                    "score": score,
-                                    "hits": hits,
-                                }
+        for line in tail_lines(path):
+            _, weight, chunks = line_chunks(line)
+            for chunk in reversed(chunks):
+                if chunk in capture_norm and chunk not in seen_hits:
+                    seen_hits.add(chunk)
+                    score += weight
+                    hits.append(chunk[:120])
+                    if len(hits) >= MAX_HITS:
+                        break
+            if len(hits) >= MAX_HITS:
+                break
     except OSError:
         pass
-    return {"path": str(path), "sessionId": sid or path.stem, "score": score, "hits": hits}
+    sid = session_id_from_jsonl(path) or path.stem
+    return {"path": str(path), "sessionId": sid, "score": score, "hits": hits}
+
+
+def index_path() -> Path:
+    override = os.environ.get("CLAUDE_SESSION_INDEX", "")
+    return Path(override) if override else home_path(".cache", "claude-session-index.sqlite")
+
+
+def shingle_hash(chunk: str) -> int:
+    # Stable across processes (unlike hash()) and sized for an SQLite INTEGER.
+    digest = hashlib.blake2b(chunk.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class ShingleIndex:
+    """Persistent inverted index from hashed transcript chunks to transcripts.
+
+    Each (file, chunk) row keeps its newest occurrence's position and weight,
+    and a lookup counts the newest hits first, as score_jsonl does reading
+    from the tail. Files are indexed from the byte offset where the last run
+    stopped: a growing transcript only costs its new lines, and a truncated or
+    replaced one is reindexed. A refresh reads at most TAIL_BYTE_BUDGET bytes
+    of a file, its newest, and stops between lines at the deadline; a file it
+    leaves out of date is reported back rather than scored, since what the
+    index lacks is its newest lines. Unlike score_jsonl, lines indexed on
+    earlier runs still count once they fall outside the newest
+    TAIL_BYTE_BUDGET bytes.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        # Paths already brought up to date by this process (batch mode shares
+        # one index across pids that often live in the same project).
+        self.fresh: set[Path] = set()
+
+    @classmethod
+    def open(cls, path: Path) -> ShingleIndex | None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), timeout=2)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_VERSION:
+                conn.executescript(
+                    """
+                    DROP TABLE IF EXISTS shingles;
+                    DROP TABLE IF EXISTS sizes;
+                    DROP TABLE IF EXISTS files;
+                    CREATE TABLE files (
+                        id INTEGER PRIMARY KEY,
+                        path TEXT UNIQUE NOT NULL,
+                        inode INTEGER NOT NULL,
+                        offset INTEGER NOT NULL,
+                        next_seq INTEGER NOT NULL,
+                        session_id TEXT NOT NULL
+                    );
+                    CREATE TABLE shingles (
+                        file_id INTEGER NOT NULL,
+                        hash INTEGER NOT NULL,
+                        seq INTEGER NOT NULL,
+                        weight INTEGER NOT NULL,
+                        PRIMARY KEY (file_id, hash)
+                    ) WITHOUT ROWID;
+                    CREATE INDEX shingles_hash ON shingles (hash);
+                    CREATE TABLE sizes (words INTEGER PRIMARY KEY);
+                    """
+                )
+                conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+                conn.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        return cls(conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def refresh(self, paths: list[Path], deadline: float) -> list[Path]:
+        """Index whatever each transcript gained since the last refresh.
+
+        Returns the files still out of date, in `paths` order: the one the
+        deadline cut short and any changed file it never reached. Committing
+        per file means the next run carries on from where this one stopped.
+        """
+        stale: list[Path] = []
+        for path in paths:
+            if path in self.fresh:
+                continue
+            if self._refresh_file(path, deadline):
+                self.fresh.add(path)
+            else:
+                stale.append(path)
+            self.conn.commit()
+        # Transcripts deleted from a project dir we just listed drop out too.
+        live = {str(path) for path in paths}
+        parents = {path.parent for path in paths}
+        for file_id, stored in self.conn.execute("SELECT id, path FROM files").fetchall():
+            if stored not in live and Path(stored).parent in parents:
+                self._forget(file_id)
+        self.conn.commit()
+        return stale
+
+    def _forget(self, file_id: int) -> None:
+        self.conn.execute("DELETE FROM shingles WHERE file_id = ?", (file_id,))
+        self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def _refresh_file(self, path: Path, deadline: float) -> bool:
+        """Index the file's new whole lines; False if the deadline cut it short.
+
+        Past the deadline this only checks whether the file is already up to date.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return True
+        row = self.conn.execute(
+            "SELECT id, inode, offset, next_seq, session_id FROM files WHERE path = ?",
+            (str(path),),
+        ).fetchone()
+        if row is not None and (row[1] != st.st_ino or st.st_size < row[2]):
+            self._forget(row[0])
+            row = None
+        if row is None:
+            cur = self.conn.execute(
+                "INSERT INTO files (path, inode, offset, next_seq, session_id) "
+                "VALUES (?, ?, 0, 0, '')",
+                (str(path), st.st_ino),
+            )
+            file_id, offset, seq, sid = cur.lastrowid, 0, 0, ""
+        else:
+            file_id, _, offset, seq, sid = row
+        if st.st_size == offset:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        # Like tail_lines, read no more than the newest TAIL_BYTE_BUDGET bytes.
+        start = max(offset, st.st_size - TAIL_BYTE_BUDGET)
+        try:
+            with path.open("rb") as fh:
+                fh.seek(start)
+                data = fh.read(st.st_size - start)
+        except OSError:
+            return True
+        # A line cut by the budget is dropped rather than indexed half-read.
+        pos = 0
+        if start > offset:
+            pos = data.find(b"\n") + 1
+        # Only whole lines: a line still being written is picked up next time.
+        end = data.rfind(b"\n") + 1
+        rows: list[tuple[int, int, int, int]] = []
+        sizes: set[int] = set()
+        complete = True
+        while pos < end:
+            if time.monotonic() >= deadline:
+                complete = False
+                break
+            newline = data.index(b"\n", pos)
+            line_sid, weight, chunks = line_chunks(data[pos:newline])
+            pos = newline + 1
+            if not sid and line_sid:
+                sid = line_sid
+            for chunk in chunks:
+                rows.append((file_id, shingle_hash(chunk), seq, weight))
+                seq += 1
+                sizes.add(len(chunk.split()))
+        # A chunk seen again moves to its newest position and weight.
+        self.conn.executemany(
+            "INSERT INTO shingles (file_id, hash, seq, weight) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (file_id, hash) "
+            "DO UPDATE SET seq = excluded.seq, weight = excluded.weight",
+            rows,
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO sizes (words) VALUES (?)", [(n,) for n in sizes]
+        )
+        self.conn.execute(
+            "UPDATE files SET inode = ?, offset = ?, next_seq = ?, session_id = ? WHERE id = ?",
+            (st.st_ino, start + pos, seq, sid, file_id),
+        )
+        return complete
+
+    def capture_windows(self, capture_norm: str) -> dict[int, str]:
+        """Hash every pane word window as long as some indexed chunk."""
+        words = capture_norm.split()
+        sizes = [row[0] for row in self.conn.execute("SELECT words FROM sizes")]
+        windows: dict[int, str] = {}
+        for size in sizes:
+            for i in range(len(words) - size + 1):
+                window = " ".join(words[i : i + size])
+                if len(window) >= 35:
+                    windows[shingle_hash(window)] = window
+        return windows
+
+    def score(self, paths: list[Path], capture_norm: str) -> list[JsonObject]:
+        windows = self.capture_windows(capture_norm)
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS probe (hash INTEGER PRIMARY KEY)")
+        self.conn.execute("DELETE FROM probe")
+        self.conn.executemany("INSERT INTO probe (hash) VALUES (?)", [(h,) for h in windows])
+        files: dict[int, tuple[Path, str]] = {}
+        for path in paths:
+            row = self.conn.execute(
+                "SELECT id, session_id FROM files WHERE path = ?", (str(path),)
+            ).fetchone()
+            if row is not None:
+                files[row[0]] = (path, row[1])
+        # Probe-driven: cost tracks the pane's window count, not transcript size.
+        matches: dict[int, list[tuple[int, int, int]]] = {file_id: [] for file_id in files}
+        for file_id, shingle, seq, weight in self.conn.execute(
+            "SELECT s.file_id, s.hash, s.seq, s.weight "
+            "FROM probe p CROSS JOIN shingles s ON s.hash = p.hash"
+        ):
+            if file_id in matches:
+                matches[file_id].append((seq, shingle, weight))
+        scored: list[JsonObject] = []
+        for file_id, (path, sid) in files.items():
+            first = sorted(matches[file_id], reverse=True)[:MAX_HITS]
+            scored.append(
+                {
+                    "path": str(path),
+                    "sessionId": sid or path.stem,
+                    "score": sum(weight for _, _, weight in first),
+                    "hits": [windows[shingle][:120] for _, shingle, _ in first],
+                }
+            )
+        return scored
+
+
+class TranscriptMatcher:
+    """Content-match state shared by every pid one process resolves.
+
+    The shingle index is opened on first use (a run that resolves from the
+    registry or launch args never touches it) and each project's transcript
+    list is globbed once.
+    """
+
+    def __init__(self, config_dir: Path) -> None:
+        self.config_dir = config_dir
+        self.index: ShingleIndex | None = None
+        self.opened = False
+        self.listed: dict[str, list[Path]] = {}
+
+    def candidates(self, cwd: str) -> list[Path]:
+        if cwd not in self.listed:
+            self.listed[cwd] = candidate_jsonls(cwd, self.config_dir)
+        return self.listed[cwd]
+
+    def scores(self, paths: list[Path], capture_norm: str, deadline: float) -> list[JsonObject]:
+        if not self.opened:
+            self.opened = True
+            self.index = ShingleIndex.open(index_path())
+        if self.index is not None:
+            try:
+                stale = self.index.refresh(paths, deadline)
+                scored = self.index.score([p for p in paths if p not in stale], capture_norm)
+            except sqlite3.Error:
+                # Unusable mid-run (locked, disk full): scan for the rest.
+                self.close()
+            else:
+                # The index lacks the newest lines of a stale file, which are what
+                # the pane shows: scan the newest stale file's tail instead. Older
+                # ones are dropped, as a spent budget drops them in the scan below.
+                return scored + [score_jsonl(path, capture_norm) for path in stale[:1]]
+        scored: list[JsonObject] = []
+        for path in paths:
+            if time.monotonic() >= deadline:
+                break
+            scored.append(score_jsonl(path, capture_norm))
+        return scored
+
+    def close(self) -> None:
+        if self.index is not None:
+            self.index.close()
+            self.index = None
 
 
 def content_match_result(
-    pid: str, pane: str, cwd: str, capture_file: str, config_dir: Path
+    pid: str, cwd: str, capture: str, matcher: TranscriptMatcher
 ) -> ResolveResult | None:
-    capture_norm = normalise(capture_text(pane, capture_file))
+    capture_norm = normalise(capture)
     if len(capture_norm) < 40:
         return None
-    scored = [score_jsonl(path, capture_norm) for path in candidate_jsonls(cwd, config_dir)]
+    deadline = time.monotonic() + MATCH_TIME_BUDGET
+    # Newest transcripts first, so a spent budget only drops the stale ones.
+    scored = matcher.scores(matcher.candidates(cwd), capture_norm, deadline)
     scored = [item for item in scored if object_int(item, "score") > 0]
     if not scored:
         return ResolveResult(
@@ -362,17 +736,140 @@ def content_match_result(
     )
 
 
-def resolve(args: argparse.Namespace) -> ResolveResult:
-    pid = str(args.pid)
-    cwd = args.cwd or cwd_for_pid(pid)
-    config_dir = Path(args.config_dir) if args.config_dir else home_path(".claude")
+@dataclass(frozen=True)
+class Probes:
+    """Process and pane facts the non-registry strategies resolve from."""
+
+    cwd: str
+    command: str
+    open_files: tuple[str, ...]
+    capture: str
+
+
+def probe(pid: str, pane: str, cwd: str, capture_file: str) -> Probes:
+    # Each probe is a subprocess (ps, lsof, tmux) costing tens of milliseconds
+    # and none depends on another, so run them side by side rather than paying
+    # for them one strategy at a time.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        cwd_future = None if cwd else pool.submit(cwd_for_pid, pid)
+        command = pool.submit(command_for_pid, pid)
+        open_files = pool.submit(open_files_for_pid, pid)
+        capture = pool.submit(capture_text, pane, capture_file)
+        return Probes(
+            cwd=cwd_future.result() if cwd_future else cwd,
+            command=command.result(),
+            open_files=tuple(open_files.result()),
+            capture=capture.result(),
+        )
+
+
+def lsof_names_by_pid(pids: list[str], *selectors: str) -> dict[str, list[str]]:
+    """One lsof across every pid, its file names split out per process."""
+    names: dict[str, list[str]] = {pid: [] for pid in pids}
+    joined = ",".join(pids)
+    current = ""
+    for line in run(["lsof", *selectors, "-p", joined, "-Fpn"], allow_fail=True).splitlines():
+        if line.startswith("p"):
+            current = line[1:]
+        elif line.startswith("n/") and current in names:
+            names[current].append(line[1:])
+    if any(names.values()):
+        return names
+    for line in run(["lsof", *selectors, "-p", joined], allow_fail=True).splitlines():
+        parts = line.split()
+        if len(parts) > 1 and parts[1] in names and parts[-1].startswith("/"):
+            names[parts[1]].append(parts[-1])
+    return names
+
+
+def commands_for_pids(pids: list[str]) -> dict[str, str]:
+    commands: dict[str, str] = {}
+    rest: list[str] = []
+    for pid in pids:
+        command = proc_command(pid)
+        if command is None:
+            rest.append(pid)
+        else:
+            commands[pid] = command
+    if not rest:
+        return commands
+    ps = ["ps", "-o", "pid=,command=", "-p", ",".join(rest)]
+    for line in run(ps, allow_fail=True).splitlines():
+        pid, _, command = line.strip().partition(" ")
+        if pid in rest:
+            commands[pid] = command.strip()
+    return commands
+
+
+def cwds_for_pids(pids: list[str]) -> dict[str, str]:
+    cwds: dict[str, str] = {}
+    rest: list[str] = []
+    for pid in pids:
+        cwd = proc_cwd(pid)
+        if cwd is None:
+            rest.append(pid)
+        else:
+            cwds[pid] = cwd
+    if rest:
+        for pid, names in lsof_names_by_pid(rest, "-a", "-d", "cwd").items():
+            cwds[pid] = next(iter(names), "")
+    return cwds
+
+
+def open_files_for_pids(pids: list[str]) -> dict[str, list[str]]:
+    files: dict[str, list[str]] = {}
+    rest: list[str] = []
+    for pid in pids:
+        names = proc_open_files(pid)
+        if names is None:
+            rest.append(pid)
+        else:
+            files[pid] = names
+    if rest:
+        files.update(lsof_names_by_pid(rest))
+    return files
+
+
+def probe_many(pairs: list[tuple[str, str]]) -> dict[str, Probes]:
+    """Probe many processes via procfs, or one ps and two lsof calls shared by all."""
+    pids = list(dict.fromkeys(pid for pid, _ in pairs))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        cwds = pool.submit(cwds_for_pids, pids)
+        commands = pool.submit(commands_for_pids, pids)
+        open_files = pool.submit(open_files_for_pids, pids)
+        captures = {pid: pool.submit(capture_text, pane, "") for pid, pane in pairs}
+        return {
+            pid: Probes(
+                cwd=cwds.result().get(pid, ""),
+                command=commands.result().get(pid, ""),
+                open_files=tuple(open_files.result().get(pid, [])),
+                capture=captures[pid].result(),
+            )
+            for pid in pids
+        }
+
+
+def registry_results(pids: list[str], config_dir: Path) -> dict[str, ResolveResult]:
+    """Registry hits for many pids from a single listing of sessions/."""
+    try:
+        present = {entry.name for entry in os.scandir(config_dir / "sessions")}
+    except OSError:
+        return {}
+    results: dict[str, ResolveResult] = {}
+    for pid in pids:
+        if f"{pid}.json" not in present:
+            continue
+        registered = registry_result(pid, config_dir)
+        if registered:
+            results[pid] = registered
+    return results
+
+
+def resolve_probed(pid: str, facts: Probes, matcher: TranscriptMatcher) -> ResolveResult:
     for resolver in (
-        lambda: registry_result(pid, config_dir),
-        lambda: launch_arg_result(pid, cwd),
-        lambda: open_jsonl_result(pid, cwd, config_dir),
-        lambda: content_match_result(
-            pid, args.pane or "", cwd, args.capture_file or "", config_dir
-        ),
+        lambda: launch_arg_result(pid, facts.cwd, facts.command),
+        lambda: open_jsonl_result(pid, facts.cwd, matcher.config_dir, list(facts.open_files)),
+        lambda: content_match_result(pid, facts.cwd, facts.capture, matcher),
     ):
         resolved = resolver()
         if not resolved:
@@ -386,9 +883,64 @@ def resolve(args: argparse.Namespace) -> ResolveResult:
     )
 
 
+def config_dir_for(args: argparse.Namespace) -> Path:
+    return Path(args.config_dir) if args.config_dir else home_path(".claude")
+
+
+def resolve(args: argparse.Namespace) -> ResolveResult:
+    pid = str(args.pid)
+    config_dir = config_dir_for(args)
+    # The registry is a single file read; only probe the process when it misses.
+    registered = registry_result(pid, config_dir)
+    if registered:
+        return registered
+    facts = probe(pid, args.pane or "", args.cwd or "", args.capture_file or "")
+    matcher = TranscriptMatcher(config_dir)
+    try:
+        return resolve_probed(pid, facts, matcher)
+    finally:
+        matcher.close()
+
+
+def resolve_many(pairs: list[tuple[str, str]], config_dir: Path) -> list[ResolveResult]:
+    """Resolve (pid, pane) pairs in input order.
+
+    Every pid shares one registry listing, one probe round and one transcript
+    index, instead of paying for each in its own process.
+    """
+    pids = [pid for pid, _ in pairs]
+    registered = registry_results(pids, config_dir)
+    unresolved = [(pid, pane) for pid, pane in pairs if pid not in registered]
+    facts = probe_many(unresolved) if unresolved else {}
+    matcher = TranscriptMatcher(config_dir)
+    try:
+        return [
+            registered[pid] if pid in registered else resolve_probed(pid, facts[pid], matcher)
+            for pid in pids
+        ]
+    finally:
+        matcher.close()
+
+
+def pid_pane(value: str) -> tuple[str, str]:
+    # Split on the first colon only: tmux targets like work:1.2 carry their own.
+    pid, _, pane = value.partition(":")
+    if not pid.isdigit():
+        raise argparse.ArgumentTypeError(f"expected PID[:PANE], got {value!r}")
+    return pid, pane
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--pid", required=True, type=int)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--pid", type=int)
+    target.add_argument(
+        "--pids",
+        nargs="+",
+        type=pid_pane,
+        metavar="PID[:PANE]",
+        help="batch mode: resolve every pid, printing one JSON result per line",
+    )
     parser.add_argument("--pane", default="")
     parser.add_argument("--cwd", default="")
     parser.add_argument("--config-dir", default="")
@@ -396,6 +948,14 @@ def main() -> int:
     parser.add_argument("--format", choices=["json", "session-id"], default="json")
     args = parser.parse_args()
 
+    if args.pids:
+        if args.format != "json" or args.pane or args.cwd or args.capture_file:
+            parser.error("--pids takes panes inline and only supports --format json")
+        results = resolve_many(args.pids, config_dir_for(args))
+        for resolved in results:
+            print(json.dumps(resolved.to_json(), sort_keys=True))
+        return 0 if all(resolved.status == "resolved" for resolved in results) else 1
+
     resolved = resolve(args)
     if args.format == "session-id":
         if resolved.status == "resolved":
@@ -115,6 +115,23 @@ claude_session_resolve_for_pid() {
 	"$resolver" "${args[@]}"
 }
 
+# claude_session_resolve_many <config_dir> <pid[:pane_id]>...
+# Emit one resolver JSON line per pid, in argument order, from a single
+# resolver process (one registry listing, one ps/lsof round, one index).
+claude_session_resolve_many() {
+	local config_dir="${1:-}"
+	shift || true
+	local resolver="${CLAUDE_SESSION_RESOLVER:-$HOME/.config/tmux/scripts/claude-session-resolve.py}"
+
+	[ "$#" -gt 0 ] || return 1
+	[ -x "$resolver" ] || return 1
+
+	local -a args
+	args=(--pids "$@")
+	[ -n "$config_dir" ] && args+=(--config-dir "$config_dir")
+	"$resolver" "${args[@]}"
+}
+
 # agent_lsof_command
 # Resolve lsof, falling back to its macOS home /usr/sbin/lsof
 # (AGENT_LSOF_FALLBACK overrides for tests). Callers run from sanitised
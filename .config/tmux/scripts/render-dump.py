@@ -5,15 +5,48 @@
 # panes contain.
 #
 # Usage: uv run --with pyte render-dump.py <logfile> [WxH]
+#          [--every BYTES] [--marker TEXT]... [--frames]
 #   WxH must match the client size the log was recorded at (pyte does not
 #   parse resize escapes); default 80x24, the bats/`script` pty default.
 #
+# The log is fed in fixed-size chunks, so memory stays bounded however long
+# the recorded session ran. --every and --marker also dump intermediate
+# screens - every BYTES of log, and right after each occurrence of TEXT
+# (Python escapes allowed, e.g. '\x1b[?2026l') - so one replay can answer
+# assertions about several frames. Each dumped screen, the final one
+# included, is then preceded by a `=== frame N @ OFFSET` header line.
+#
+# --frames swaps the text dumps for a JSONL frame log: one object per
+# distinct screen state at those boundaries, holding only the rows that
+# changed since the previous frame -
+# {"frame": N, "offset": OFFSET, "rows": {"ROW": "text", ...}}. Frame 1 is a
+# diff against a blank screen. Rows come from pyte's `dirty` set, so a frame
+# costs what changed, not the whole screen, and animations (status-bar
+# ticks, popups) can be asserted on from a single replay. Without --every or
+# --marker, --frames cuts where tmux finishes a redraw: after each
+# synchronized-update end (CSI ?2026l, sent when the outer terminal has the
+# `sync` feature) and each cursor show (CSI ?25h - tmux hides the cursor
+# while it draws and shows it again once the update is out). A redraw that
+# leaves the cursor hidden (a pane running a TUI that hides it) and has no
+# sync end runs on to the next boundary; EOF always closes the last frame.
+#
 # Stock pyte raises on tmux's private DSR query (CSI ?996n, colour-scheme
 # report) because Screen.report_device_status asserts on known modes only;
 # no-op the report hooks so the replay survives real tmux output.
+from __future__ import annotations
+
+import argparse
+import json
 import sys
+from collections.abc import Iterator
+from typing import BinaryIO
 
 import pyte
+from wcwidth import wcwidth  # pyte's own dependency
+
+CHUNK_SIZE = 1 << 16
+# --frames' default boundaries: the ends of a tmux redraw (see the header).
+REDRAW_ENDS = (b"\x1b[?2026l", b"\x1b[?25h")
 
 
 class TolerantScreen(pyte.Screen):
@@ -24,25 +57,158 @@ class TolerantScreen(pyte.Screen):
         pass
 
 
+def parse_size(value: str) -> tuple[int, int]:
+    try:
+        w, h = value.lower().split("x", 1)
+        return int(w), int(h)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}, expected WxH") from None
+
+
+def parse_marker(value: str) -> bytes:
+    # unicode_escape reads bytes as latin-1, so the round trip keeps UTF-8 text intact.
+    marker = value.encode().decode("unicode_escape").encode("latin-1")
+    if not marker:
+        raise argparse.ArgumentTypeError("marker must not be empty")
+    return marker
+
+
+def replay(
+    log: BinaryIO,
+    stream: pyte.ByteStream,
+    every: int | None = None,
+    markers: tuple[bytes, ...] = (),
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[int]:
+    """Feed `log` into `stream` chunk by chunk, pausing at each frame boundary.
+
+    Yields the byte offset of every boundary - each multiple of `every`, and
+    the end of each marker occurrence - with the stream fed exactly up to it,
+    so the caller can snapshot the screen there. A marker split across two
+    chunks is still found: the last len(marker)-1 bytes carry over.
+    """
+    keep = max(map(len, markers), default=1) - 1
+    offset, tail = 0, b""
+    next_every = every
+    while chunk := log.read(chunk_size):
+        end = offset + len(chunk)
+        cuts = set()
+        while every is not None and next_every is not None and next_every <= end:
+            cuts.add(next_every)
+            next_every += every
+        window, base = tail + chunk, offset - len(tail)
+        for marker in markers:
+            i = window.find(marker)
+            while i != -1:
+                if base + i + len(marker) > offset:  # not already cut in the last chunk
+                    cuts.add(base + i + len(marker))
+                i = window.find(marker, i + 1)
+        pos = offset
+        for cut in sorted(cuts):
+            stream.feed(chunk[pos - offset : cut - offset])
+            pos = cut
+            yield cut
+        stream.feed(chunk[pos - offset :])
+        offset = end
+        tail = window[-keep:] if keep else b""
+
+
+def print_screen(screen: pyte.Screen) -> None:
+    for line in screen.display:
+        print(line)
+
+
+def row_text(screen: pyte.Screen, y: int) -> str:
+    """One row of `screen.display`, without rendering the rest of the screen."""
+    line = screen.buffer[y]
+    chars = []
+    x = 0
+    while x < screen.columns:
+        char = line[x].data
+        chars.append(char)
+        # Skip a wide char's stub cell. [:1], not [0]: a wide char overwritten by a
+        # narrow one leaves an orphaned empty stub, on which pyte's display raises.
+        x += 2 if wcwidth(char[:1]) == 2 else 1
+    return "".join(chars)
+
+
+def frame_diff(screen: pyte.Screen, previous: list[str]) -> dict[int, str]:
+    """Rows that differ from `previous` (updated in place), checking only dirty ones."""
+    changed = {}
+    for y in sorted(screen.dirty):
+        if y < screen.lines:
+            text = row_text(screen, y)
+            if text != previous[y]:
+                changed[y] = previous[y] = text
+    screen.dirty.clear()
+    return changed
+
+
+def dump_frames(
+    log: BinaryIO, screen: pyte.Screen, every: int | None, markers: tuple[bytes, ...]
+) -> None:
+    """Write the JSONL frame log: one line per boundary at which the screen changed."""
+    stream = pyte.ByteStream(screen)
+    previous = [" " * screen.columns] * screen.lines
+    frame = 0
+
+    def emit(offset: int) -> None:
+        nonlocal frame
+        rows = frame_diff(screen, previous)
+        if rows:
+            frame += 1
+            record = {"frame": frame, "offset": offset, "rows": {str(y): rows[y] for y in rows}}
+            print(json.dumps(record, ensure_ascii=False))
+
+    if every is None and not markers:
+        markers = REDRAW_ENDS
+    for cut in replay(log, stream, every, markers):
+        emit(cut)
+    emit(log.tell())
+
+
 def main() -> int:
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print(__doc__ or "usage: render-dump.py <logfile> [WxH]", file=sys.stderr)
-        return 2
-    logfile = sys.argv[1]
-    width, height = 80, 24
-    if len(sys.argv) == 3:
-        try:
-            w, h = sys.argv[2].lower().split("x", 1)
-            width, height = int(w), int(h)
-        except ValueError:
-            print(f"invalid size {sys.argv[2]!r}, expected WxH", file=sys.stderr)
-            return 2
+    parser = argparse.ArgumentParser(
+        prog="render-dump.py", description="Replay a recorded tmux client tty stream."
+    )
+    parser.add_argument("logfile")
+    parser.add_argument("size", nargs="?", type=parse_size, default=(80, 24), metavar="WxH")
+    parser.add_argument("--every", type=int, metavar="BYTES", help="dump a screen every BYTES")
+    parser.add_argument(
+        "--frames", action="store_true", help="write a JSONL log of changed rows per frame"
+    )
+    parser.add_argument(
+        "--marker",
+        action="append",
+        default=[],
+        type=parse_marker,
+        metavar="TEXT",
+        help="dump a screen after each occurrence of this byte sequence (repeatable)",
+    )
+    args = parser.parse_args()
+    if args.every is not None and args.every <= 0:
+        parser.error("--every must be positive")
+
+    width, height = args.size
     screen = TolerantScreen(width, height)
+    if args.frames:
+        with open(args.logfile, "rb") as f:
+            dump_frames(f, screen, args.every, tuple(args.marker))
+        return 0
     stream = pyte.ByteStream(screen)
-    with open(logfile, "rb") as f:
-        stream.feed(f.read())
-    for line in screen.display:
-        print(line)
+    framed = args.every is not None or bool(args.marker)
+    frame, cut = 0, None
+    with open(args.logfile, "rb") as f:
+        for cut in replay(f, stream, args.every, tuple(args.marker)):
+            frame += 1
+            print(f"=== frame {frame} @ {cut}")
+            print_screen(screen)
+        end = f.tell()
+    if cut == end:
+        return 0  # the last boundary was EOF: the final screen is already out
+    if framed:
+        print(f"=== frame {frame + 1} @ {end}")
+    print_screen(screen)
     return 0
 
 
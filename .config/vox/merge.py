@@ -7,6 +7,10 @@ usable on its own (`mw … --format json | …`) and testable without any audio.
 
     merge.py --me mic.json --them sys.json [--vocab vocabulary.tsv] > transcript.md
 
+Further tracks (say, one per remote speaker) join with `--track NAME=PATH`.
+`--follow` merges while transcription is still writing the tracks, emitting
+each line once no track can still change it (see LiveMerge).
+
 Input schema (`mw transcribe --format json`):
 
     {"segments": [{"id", "start", "end", "text", "words": [...]}]}
@@ -15,7 +19,8 @@ Input schema (`mw transcribe --format json`):
 transcription ran with `--speakers`, so it is treated as optional throughout —
 vox transcribes the mic track with `--no-speakers` (it is definitionally you).
 
-Output is one line per utterance, sorted by start time:
+Output is one line per utterance, sorted by start time and written as it is
+merged rather than after the whole timeline is built:
 
     [00:00:04] Me: right, shall we start
     [00:00:07] Speaker 1: yes, go ahead
@@ -27,9 +32,13 @@ filter runnable from any Python on the machine with nothing installed.
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import re
+import signal
 import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any, NamedTuple
 
@@ -98,57 +107,153 @@ def parse_vocabulary(text: str) -> list[tuple[str, str]]:
     return pairs
 
 
-def apply_vocabulary(text: str, pairs: list[tuple[str, str]]) -> str:
-    """Replace each whole-word `wrong` with `right`, ignoring case.
+def compile_vocabulary(pairs: list[tuple[str, str]]) -> Callable[[str], str]:
+    """Build a corrector replacing each whole-word `wrong` with `right`, ignoring case.
 
     Whole-word so "admit" does not rewrite the inside of another word, and
     case-insensitive because the model capitalises inconsistently mid-sentence.
+
+    Every pair goes into one alternation compiled once, so a transcript costs one
+    regex pass per segment however long the vocabulary grows. Longer entries are
+    tried first so a multi-word name beats a shorter entry it starts with, and the
+    first pair wins when two spell the same word. A replacement is inserted
+    literally and never re-scanned, so one correction cannot feed another.
     """
+    replacements: dict[str, str] = {}
     for wrong, right in pairs:
-        text = re.sub(rf"\b{re.escape(wrong)}\b", right, text, flags=re.IGNORECASE)
-    return text
+        replacements.setdefault(wrong.lower(), right)
+    if not replacements:
+        return lambda text: text
+
+    alternatives = sorted({wrong for wrong, _ in pairs}, key=len, reverse=True)
+    pattern = re.compile(rf"\b(?:{'|'.join(map(re.escape, alternatives))})\b", flags=re.IGNORECASE)
+
+    def replace(match: re.Match[str]) -> str:
+        word = match[0]
+        right = replacements.get(word.lower())
+        if right is None:  # IGNORECASE folds a few characters str.lower() leaves alone
+            right = next(
+                r for w, r in pairs if re.fullmatch(re.escape(w), word, flags=re.IGNORECASE)
+            )
+        return right
+
+    return lambda text: pattern.sub(replace, text)
+
 
+def timeline_key(segment: Segment) -> tuple[int, int]:
+    """Timeline order: by start, then end."""
+    return segment.start, segment.end
 
-def interleave(tracks: list[list[Segment]]) -> list[Segment]:
-    """Merge the tracks into one timeline, ordered by start then end.
 
-    Python's sort is stable, so segments sharing a start keep their track order
-    rather than shuffling between runs.
+def interleave(tracks: Iterable[Iterable[Segment]]) -> Iterator[Segment]:
+    """Merge time-ordered tracks into one timeline, ordered by start then end.
+
+    A lazy k-way merge, so any number of tracks (one per remote speaker, say)
+    costs O(n log k) and the first line is ready before the last is read.
+    Segments sharing a start keep their track order rather than shuffling
+    between runs: `heapq.merge` breaks ties by input position.
     """
-    combined = [segment for track in tracks for segment in track]
-    return sorted(combined, key=lambda s: (s.start, s.end))
+    return heapq.merge(*tracks, key=timeline_key)
+
+
+class GapMerger:
+    """Incremental `merge_gaps`: feed segments in timeline order, collect utterances.
 
+    Only the utterance still being extended is held; `push` hands back the one
+    it displaces, and `release` gives it up early once nothing can extend it.
+    """
 
-def merge_gaps(segments: list[Segment], gap_ms: int = DEFAULT_GAP_MS) -> list[Segment]:
+    def __init__(self, gap_ms: int = DEFAULT_GAP_MS) -> None:
+        self.gap_ms = gap_ms
+        self.pending: Segment | None = None
+
+    def push(self, segment: Segment) -> Segment | None:
+        """Add the next segment; return the utterance it completes, if any."""
+        pending = self.pending
+        if (
+            pending is not None
+            and pending.speaker == segment.speaker
+            and segment.start - pending.end < self.gap_ms
+        ):
+            self.pending = pending._replace(
+                end=max(pending.end, segment.end),
+                text=f"{pending.text} {segment.text}",
+            )
+            return None
+        self.pending = segment
+        return pending
+
+    def release(self, watermark: int) -> Segment | None:
+        """Give up the held utterance if no segment starting at `watermark` or later can join it."""
+        pending = self.pending
+        if pending is None or watermark - pending.end < self.gap_ms:
+            return None
+        self.pending = None
+        return pending
+
+    def flush(self) -> Segment | None:
+        """Give up the held utterance unconditionally: the input has ended."""
+        pending, self.pending = self.pending, None
+        return pending
+
+
+def merge_gaps(segments: Iterable[Segment], gap_ms: int = DEFAULT_GAP_MS) -> Iterator[Segment]:
     """Join runs of same-speaker segments separated by less than `gap_ms`.
 
     Applied *after* interleaving, so an interjection from the other side sits
     between two of your segments and correctly stops them merging across it.
+    Lazy: only the utterance still being extended is held back.
     """
-    merged: list[Segment] = []
+    merger = GapMerger(gap_ms)
     for segment in segments:
-        if merged:
-            previous = merged[-1]
-            if previous.speaker == segment.speaker and segment.start - previous.end < gap_ms:
-                merged[-1] = previous._replace(
-                    end=max(previous.end, segment.end),
-                    text=f"{previous.text} {segment.text}",
-                )
-                continue
-        merged.append(segment)
-    return merged
+        done = merger.push(segment)
+        if done is not None:
+            yield done
+    done = merger.flush()
+    if done is not None:
+        yield done
+
 
+def render_lines(segments: Iterable[Segment]) -> Iterator[str]:
+    """Render each segment as a `[hh:mm:ss] Speaker: text` line, as it arrives."""
+    for s in segments:
+        yield f"[{format_timestamp(s.start)}] {s.speaker}: {s.text}\n"
 
-def render(segments: list[Segment]) -> str:
+
+def render(segments: Iterable[Segment]) -> str:
     """Render the timeline as `[hh:mm:ss] Speaker: text` lines."""
-    return "".join(f"[{format_timestamp(s.start)}] {s.speaker}: {s.text}\n" for s in segments)
+    return "".join(render_lines(segments))
 
 
 def read_track(path: Path | None, speaker: str) -> list[Segment]:
-    """Load one track's segments; a missing or empty path contributes nothing."""
+    """Load one track's segments in timeline order; a missing or empty path contributes nothing.
+
+    mw emits segments in time order already, so the sort is a linear check
+    rather than real work - it only guards `interleave`'s precondition.
+    """
     if path is None or not path.is_file() or path.stat().st_size == 0:
         return []
-    return load_segments(json.loads(path.read_text(encoding="utf-8")), speaker)
+    segments = load_segments(json.loads(path.read_text(encoding="utf-8")), speaker)
+    return sorted(segments, key=timeline_key)
+
+
+def load_corrector(vocab: Path | None) -> Callable[[str], str] | None:
+    """Compile the vocabulary file, or None when there is nothing to correct."""
+    pairs = parse_vocabulary(vocab.read_text(encoding="utf-8")) if vocab and vocab.is_file() else []
+    return compile_vocabulary(pairs) if pairs else None
+
+
+def stream(
+    tracks: Iterable[tuple[Path | None, str]],
+    vocab: Path | None,
+    gap_ms: int = DEFAULT_GAP_MS,
+) -> Iterator[str]:
+    """The whole filter as a pipeline: (path, speaker) tracks in, markdown lines out."""
+    timeline = merge_gaps(interleave(read_track(path, name) for path, name in tracks), gap_ms)
+    correct = load_corrector(vocab)
+    if correct is not None:
+        timeline = (s._replace(text=correct(s.text)) for s in timeline)
+    return render_lines(timeline)
 
 
 def build(
@@ -160,19 +265,177 @@ def build(
     gap_ms: int = DEFAULT_GAP_MS,
 ) -> str:
     """The whole filter as one pure-ish function: paths in, markdown out."""
-    timeline = merge_gaps(
-        interleave([read_track(me, me_name), read_track(them, them_name)]), gap_ms
-    )
-    pairs = parse_vocabulary(vocab.read_text(encoding="utf-8")) if vocab and vocab.is_file() else []
-    if pairs:
-        timeline = [s._replace(text=apply_vocabulary(s.text, pairs)) for s in timeline]
-    return render(timeline)
+    return "".join(stream([(me, me_name), (them, them_name)], vocab, gap_ms))
+
+
+class TrackFeed:
+    """A track file that is still being written: `poll` returns what is new.
+
+    A `.jsonl` path is an append-only stream of segment objects, one per line,
+    read from where the last poll stopped. Anything else is the usual
+    `{"segments": [...]}` document, re-read whenever its size or mtime moves;
+    a document caught mid-write fails to parse and is simply retried next poll.
+    """
+
+    def __init__(self, path: Path, speaker: str) -> None:
+        self.path = path
+        self.speaker = speaker
+        self.stamp: tuple[int, int] | None = None
+        self.offset = 0
+        self.seen = 0
+        self.last_start: int | None = None
+
+    def poll(self) -> list[Segment]:
+        """New segments since the last poll, in timeline order."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return []
+        if (st.st_size, st.st_mtime_ns) == self.stamp:
+            return []
+        new = self._read_stream() if self.path.suffix == ".jsonl" else self._read_document()
+        if new is None:
+            return []
+        self.stamp = (st.st_size, st.st_mtime_ns)
+        if new:
+            self.last_start = new[-1].start
+        return new
+
+    def _read_stream(self) -> list[Segment]:
+        with self.path.open("rb") as fh:
+            fh.seek(self.offset)
+            data = fh.read()
+        complete = data[: data.rfind(b"\n") + 1]  # a half-written last line waits
+        self.offset += len(complete)
+        items = []
+        for line in complete.splitlines():
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                continue
+        return sorted(load_segments({"segments": items}, self.speaker), key=timeline_key)
+
+    def _read_document(self) -> list[Segment] | None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        segments = sorted(load_segments(payload, self.speaker), key=timeline_key)
+        new, self.seen = segments[self.seen :], max(self.seen, len(segments))
+        return new
+
+
+class LiveMerge:
+    """The merge run incrementally, emitting only what later input cannot change.
+
+    Tracks are time-ordered, so once every track has produced a segment
+    starting at or after some time, nothing earlier can still arrive: that
+    minimum is the watermark. Segments starting before it are interleaved and
+    fed to a GapMerger, which holds back only the trailing utterance that a
+    segment within `gap_ms` of its end could still extend.
+    """
+
+    def __init__(self, tracks: int, gap_ms: int = DEFAULT_GAP_MS) -> None:
+        self.queues: list[list[Segment]] = [[] for _ in range(tracks)]
+        self.progress: list[int | None] = [None] * tracks
+        self.merger = GapMerger(gap_ms)
+
+    def advance(self, batches: list[list[Segment]]) -> list[Segment]:
+        """Take each track's new segments; return the utterances that are now final."""
+        for i, batch in enumerate(batches):
+            if batch:
+                self.queues[i].extend(batch)
+                self.progress[i] = batch[-1].start
+        if any(p is None for p in self.progress):
+            return []
+        watermark = min(p for p in self.progress if p is not None)
+        ready = []
+        for i, queue in enumerate(self.queues):
+            cut = next((n for n, s in enumerate(queue) if s.start >= watermark), len(queue))
+            ready.append(queue[:cut])
+            self.queues[i] = queue[cut:]
+        done = self._push(interleave(ready))
+        released = self.merger.release(watermark)
+        return [*done, released] if released is not None else done
+
+    def finish(self) -> list[Segment]:
+        """The input has ended: everything still held is final."""
+        done = self._push(interleave(self.queues))
+        self.queues = [[] for _ in self.queues]
+        flushed = self.merger.flush()
+        return [*done, flushed] if flushed is not None else done
+
+    def _push(self, segments: Iterable[Segment]) -> list[Segment]:
+        return [done for s in segments if (done := self.merger.push(s)) is not None]
+
+
+def follow(
+    tracks: list[tuple[Path, str]],
+    vocab: Path | None,
+    gap_ms: int = DEFAULT_GAP_MS,
+    poll: float = 1.0,
+    idle: float | None = None,
+) -> int:
+    """Merge tracks while they are still being transcribed, writing lines as they settle.
+
+    Runs until interrupted (Ctrl-C or SIGTERM), or until no track has changed
+    for `idle` seconds, then flushes what was held back. Only new segments
+    are merged on each poll; the emitted history is never revisited. A track
+    that has not spoken yet holds the watermark, so a silent side delays
+    output until the end rather than letting it arrive out of order.
+    """
+    feeds = [TrackFeed(path, name) for path, name in tracks]
+    live = LiveMerge(len(feeds), gap_ms)
+    correct = load_corrector(vocab)
+
+    def emit(segments: list[Segment]) -> None:
+        if correct is not None:
+            segments = [s._replace(text=correct(s.text)) for s in segments]
+        sys.stdout.write(render(segments))
+        sys.stdout.flush()
+
+    def stop(signum: int, frame: object) -> None:
+        raise KeyboardInterrupt
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    try:
+        quiet_since = time.monotonic()
+        while True:
+            batches = [feed.poll() for feed in feeds]
+            if any(batches):
+                quiet_since = time.monotonic()
+                emit(live.advance(batches))
+            elif idle is not None and time.monotonic() - quiet_since >= idle:
+                break
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+    emit(live.advance([feed.poll() for feed in feeds]) + live.finish())
+    return 0
+
+
+def parse_track(value: str) -> tuple[Path, str]:
+    """Parse a `--track NAME=PATH` argument."""
+    name, sep, path = value.partition("=")
+    if not sep or not name.strip() or not path:
+        raise argparse.ArgumentTypeError(f"expected NAME=PATH, got {value!r}")
+    return Path(path), name.strip()
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument("--me", type=Path, help="JSON transcript of the mic track")
     parser.add_argument("--them", type=Path, help="JSON transcript of the system track")
+    parser.add_argument(
+        "--track",
+        action="append",
+        default=[],
+        type=parse_track,
+        metavar="NAME=PATH",
+        help="another JSON transcript to interleave, labelled NAME (repeatable)",
+    )
     parser.add_argument("--vocab", type=Path, help="wrong<TAB>right substitutions")
     parser.add_argument("--me-name", default="Me", help="label for the mic track")
     parser.add_argument("--them-name", default="Them", help="label for the system track")
@@ -182,14 +445,30 @@ def main(argv: list[str] | None = None) -> int:
         default=DEFAULT_GAP_MS,
         help=f"join same-speaker segments closer than this (default {DEFAULT_GAP_MS})",
     )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="keep merging while the tracks are still being written (.jsonl = segment stream)",
+    )
+    parser.add_argument(
+        "--poll", type=float, default=1.0, help="--follow: seconds between polls (default 1)"
+    )
+    parser.add_argument(
+        "--idle",
+        type=float,
+        help="--follow: stop once no track has changed for this many seconds",
+    )
     args = parser.parse_args(argv)
 
-    if args.me is None and args.them is None:
-        parser.error("at least one of --me/--them is required")
+    if args.me is None and args.them is None and not args.track:
+        parser.error("at least one of --me/--them/--track is required")
 
-    sys.stdout.write(
-        build(args.me, args.them, args.vocab, args.me_name, args.them_name, args.gap_ms)
-    )
+    tracks = [(args.me, args.me_name), (args.them, args.them_name), *args.track]
+    if args.follow:
+        live = [(path, name) for path, name in tracks if path is not None]
+        return follow(live, args.vocab, args.gap_ms, args.poll, args.idle)
+    for line in stream(tracks, args.vocab, args.gap_ms):
+        sys.stdout.write(line)
     return 0
 
 
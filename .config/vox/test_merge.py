@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import json
 import random
+import re
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -19,18 +21,23 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent))
 
 from merge import (
+    GapMerger,
+    LiveMerge,
     Segment,
-    apply_vocabulary,
+    TrackFeed,
     build,
+    compile_vocabulary,
     format_timestamp,
     interleave,
     load_segments,
     merge_gaps,
     parse_vocabulary,
+    read_track,
     render,
 )
 
 MERGE_PY = Path(__file__).parent / "merge.py"
+VOCABULARY_TSV = Path(__file__).parent / "vocabulary.tsv"
 
 
 def seg(start: int, end: int, speaker: str, text: str) -> Segment:
@@ -96,41 +103,66 @@ def test_interleave_orders_both_tracks_by_start() -> None:
     assert [s.text for s in interleave([me, them])] == ["one", "two", "three"]
 
 
-def test_interleave_is_order_invariant_under_shuffle() -> None:
+def test_interleave_is_order_invariant_under_shuffle(tmp_path: Path) -> None:
     """Interleaving is a sort/merge, so shuffling the input must not change it.
 
     A fixed-seed shuffle rather than a property-test library: merge.py stays
     stdlib-only to remain eligible for the pyrefly gate, and the two invariants
     below - output non-decreasing in start, every input text present exactly
-    once - are most of what a generator would check.
+    once - are most of what a generator would check. The shuffle goes in
+    through a track file, since read_track is what puts a track in order for
+    the merge.
     """
     segments = [seg(i * 1000, i * 1000 + 500, "Me", f"line {i}") for i in range(25)]
     shuffled = list(segments)
     random.Random(20260728).shuffle(shuffled)
+    track = write_track(tmp_path / "mic.json", [s._asdict() for s in shuffled])
 
-    result = interleave([shuffled])
+    result = list(interleave([read_track(track, "Me")]))
 
     starts = [s.start for s in result]
     assert starts == sorted(starts)
     assert sorted(s.text for s in result) == sorted(s.text for s in segments)
 
 
+def test_interleave_k_tracks_matches_a_stable_sort_of_their_concatenation() -> None:
+    rng = random.Random(20261019)
+    tracks: list[list[Segment]] = [[] for _ in range(5)]
+    for i in range(200):
+        start = rng.randrange(0, 60_000, 250)  # coarse, so starts collide across tracks
+        k = rng.randrange(len(tracks))
+        tracks[k].append(seg(start, start + rng.randrange(1, 3000), f"Speaker {k}", f"line {i}"))
+    for track in tracks:
+        track.sort(key=lambda s: (s.start, s.end))
+
+    expected = sorted((s for track in tracks for s in track), key=lambda s: (s.start, s.end))
+    assert list(interleave(tracks)) == expected
+
+
+def test_interleave_is_lazy() -> None:
+    def track() -> Iterator[Segment]:
+        yield seg(0, 1000, "Me", "first")
+        raise AssertionError("read past the first segment")
+
+    assert next(interleave([track()])).text == "first"
+
+
 # --- gap merging ------------------------------------------------------------
 
 
 def test_same_speaker_segments_within_the_gap_become_one_line() -> None:
     segments = [seg(0, 1000, "Me", "right"), seg(2000, 3000, "Me", "shall we start")]
-    assert merge_gaps(segments) == [seg(0, 3000, "Me", "right shall we start")]
+    assert list(merge_gaps(segments)) == [seg(0, 3000, "Me", "right shall we start")]
 
 
 def test_same_speaker_segments_beyond_the_gap_stay_separate() -> None:
     segments = [seg(0, 1000, "Me", "right"), seg(9000, 9500, "Me", "anyway")]
-    assert len(merge_gaps(segments)) == 2
+    assert len(list(merge_gaps(segments))) == 2
 
 
 def test_different_speakers_never_merge() -> None:
     segments = [seg(0, 1000, "Me", "right"), seg(1100, 2000, "Them", "yes")]
-    assert len(merge_gaps(segments)) == 2
+    assert len(list(merge_gaps(segments))) == 2
 
 
 def test_an_interjection_stops_a_merge_across_it() -> None:
@@ -151,16 +183,55 @@ def test_parse_vocabulary_ignores_blanks_and_comments() -> None:
 
 
 def test_vocabulary_substitution_is_case_insensitive() -> None:
-    assert apply_vocabulary("Admit and admit", [("admit", "Admyt")]) == "Admyt and Admyt"
+    assert compile_vocabulary([("admit", "Admyt")])("Admit and admit") == "Admyt and Admyt"
 
 
 def test_vocabulary_substitution_is_whole_word_only() -> None:
-    assert apply_vocabulary("admittedly", [("admit", "Admyt")]) == "admittedly"
+    assert compile_vocabulary([("admit", "Admyt")])("admittedly") == "admittedly"
 
 
 def test_vocabulary_handles_regex_metacharacters_literally() -> None:
-    assert apply_vocabulary("a.b works", [("a.b", "AB")]) == "AB works"
-    assert apply_vocabulary("axb works", [("a.b", "AB")]) == "axb works"
+    assert compile_vocabulary([("a.b", "AB")])("a.b works") == "AB works"
+    assert compile_vocabulary([("a.b", "AB")])("axb works") == "axb works"
+
+
+def test_vocabulary_prefers_the_longer_of_two_overlapping_entries() -> None:
+    correct = compile_vocabulary([("ascend", "Ascent"), ("ascend c", "Ascendx")])
+    assert correct("the Ascend C team and ascend") == "the Ascendx team and Ascent"
+
+
+def test_vocabulary_replacements_are_literal_and_not_rescanned() -> None:
+    correct = compile_vocabulary([("foo", r"a\1b"), ("a", "nope")])
+    assert correct("foo") == r"a\1b"
+
+
+def test_empty_vocabulary_is_the_identity() -> None:
+    assert compile_vocabulary([])("Admit it") == "Admit it"
+
+
+def sequential_vocabulary(text: str, pairs: list[tuple[str, str]]) -> str:
+    """The original corrector: one `re.sub` per pair, kept as the parity reference."""
+    for wrong, right in pairs:
+        text = re.sub(rf"\b{re.escape(wrong)}\b", right, text, flags=re.IGNORECASE)
+    return text
+
+
+def test_compiled_vocabulary_matches_the_per_pair_substitution() -> None:
+    """The single alternation must agree with applying each pair in turn.
+
+    Sentences mix the shipped vocabulary (in assorted casings and with attached
+    punctuation) with near misses that must survive, over a fixed seed.
+    """
+    pairs = parse_vocabulary(VOCABULARY_TSV.read_text(encoding="utf-8"))
+    pairs += [("mac whisper", "MacWhisper"), ("vox", "Vox")]
+    words = [w for wrong, _ in pairs for w in (wrong, wrong.upper(), wrong.title())]
+    words += ["admittedly", "readmit", "Deceras", "vox-like", "whisper", "mac", "the", "and"]
+    rng = random.Random(20261019)
+    correct = compile_vocabulary(pairs)
+
+    for _ in range(500):
+        text = " ".join(rng.choice(words) + rng.choice(["", "", ",", ".", "?"]) for _ in range(12))
+        assert correct(text) == sequential_vocabulary(text, pairs)
 
 
 # --- rendering --------------------------------------------------------------
@@ -201,6 +272,87 @@ def test_a_missing_track_file_contributes_nothing(tmp_path: Path) -> None:
     assert build(me, tmp_path / "absent.json", None, "Me", "Them") == "[00:00:00] Me: just me\n"
 
 
+# --- live merging ----------------------------------------------------------
+
+
+def test_live_merge_waits_until_every_track_has_spoken() -> None:
+    live = LiveMerge(2)
+    assert live.advance([[seg(0, 1000, "Me", "hello"), seg(3000, 4000, "Me", "so")], []]) == []
+    assert live.advance([[], [seg(5000, 6000, "Them", "hi")]]) == [seg(0, 1000, "Me", "hello")]
+
+
+def test_live_merge_holds_back_only_what_could_still_merge() -> None:
+    live = LiveMerge(2, gap_ms=1500)
+    me = [seg(0, 1000, "Me", "so"), seg(3000, 4000, "Me", "the plan")]
+    assert live.advance([me, [seg(4500, 5000, "Them", "ok")]]) == [seg(0, 1000, "Me", "so")]
+
+    # The watermark is 4400, only 400ms past "the plan": a Me segment could still join it.
+    assert live.advance([[seg(4400, 4800, "Me", "is")], [seg(9000, 9500, "Them", "go on")]]) == []
+
+    assert live.advance([[seg(12000, 13000, "Me", "right")], []]) == [
+        seg(3000, 4800, "Me", "the plan is"),
+        seg(4500, 5000, "Them", "ok"),
+    ]
+    assert live.finish() == [seg(9000, 9500, "Them", "go on"), seg(12000, 13000, "Me", "right")]
+
+
+def test_gap_merger_release_respects_the_gap() -> None:
+    merger = GapMerger(gap_ms=1500)
+    merger.push(seg(0, 1000, "Me", "hi"))
+    assert merger.release(2000) is None
+    assert merger.release(2500) == seg(0, 1000, "Me", "hi")
+
+
+def test_live_merge_in_arbitrary_chunks_matches_the_batch_merge() -> None:
+    rng = random.Random(20261019)
+    tracks: list[list[Segment]] = []
+    for k, speaker in enumerate(["Me", "Them", "Ann"]):
+        t, track = k * 300, []
+        for i in range(80):
+            t += rng.randrange(100, 4000)
+            track.append(seg(t, t + rng.randrange(200, 2500), speaker, f"{speaker} {i}"))
+            t = track[-1].end
+        tracks.append(track)
+    expected = list(merge_gaps(interleave(tracks)))
+
+    for _ in range(20):
+        live, cursors, got = LiveMerge(len(tracks)), [0] * len(tracks), []
+        while any(c < len(t) for c, t in zip(cursors, tracks, strict=True)):
+            batches = []
+            for i, track in enumerate(tracks):
+                step = rng.randrange(0, 6)
+                batches.append(track[cursors[i] : cursors[i] + step])
+                cursors[i] += step
+            got += live.advance(batches)
+        got += live.finish()
+        assert got == expected
+
+
+def test_track_feed_reads_a_segment_stream_a_whole_line_at_a_time(tmp_path: Path) -> None:
+    path = tmp_path / "mic.jsonl"
+    path.write_text('{"start": 0, "end": 900, "text": "one"}\n{"start": 10', encoding="utf-8")
+    feed = TrackFeed(path, "Me")
+    assert feed.poll() == [seg(0, 900, "Me", "one")]
+
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('00, "end": 1900, "text": "two"}\n')
+    assert feed.poll() == [seg(1000, 1900, "Me", "two")]
+    assert feed.poll() == []
+
+
+def test_track_feed_rereads_a_growing_document(tmp_path: Path) -> None:
+    path = tmp_path / "mic.json"
+    path.write_text('{"segments": [{"start": 0, "end": 900, "text": "one"}', encoding="utf-8")
+    feed = TrackFeed(path, "Me")
+    assert feed.poll() == []  # caught mid-write
+
+    write_track(path, [{"start": 0, "end": 900, "text": "one"}])
+    assert [s.text for s in feed.poll()] == ["one"]
+    two = {"start": 1000, "end": 1900, "text": "two"}
+    write_track(path, [{"start": 0, "end": 900, "text": "one"}, two])
+    assert [s.text for s in feed.poll()] == ["two"]
+
+
 # --- the CLI ----------------------------------------------------------------
 
 
@@ -219,6 +371,40 @@ def test_cli_writes_markdown_to_stdout(tmp_path: Path) -> None:
     assert result.stdout == "[00:00:00] Me: hello\n"
 
 
+def test_cli_interleaves_extra_tracks(tmp_path: Path) -> None:
+    me = write_track(tmp_path / "mic.json", [{"start": 0, "end": 1000, "text": "hello"}])
+    them = write_track(tmp_path / "sys.json", [{"start": 4000, "end": 5000, "text": "bye"}])
+    ann = write_track(tmp_path / "ann.json", [{"start": 2000, "end": 3000, "text": "hi"}])
+
+    result = run_cli("--me", str(me), "--them", str(them), "--track", f"Ann={ann}")
+
+    assert result.returncode == 0
+    assert result.stdout == "[00:00:00] Me: hello\n[00:00:02] Ann: hi\n[00:00:04] Them: bye\n"
+
+
+def test_cli_follow_flushes_everything_once_the_tracks_go_idle(tmp_path: Path) -> None:
+    me = write_track(tmp_path / "mic.json", [{"start": 0, "end": 1000, "text": "hello admit"}])
+    them = tmp_path / "sys.jsonl"
+    them.write_text('{"start": 2000, "end": 3000, "text": "hi"}\n', encoding="utf-8")
+    vocab = tmp_path / "v.tsv"
+    vocab.write_text("admit\tAdmyt\n", encoding="utf-8")
+
+    result = run_cli(
+        "--me", str(me), "--them", str(them), "--vocab", str(vocab),
+        "--follow", "--poll", "0.05", "--idle", "0.2",
+    )  # fmt: skip
+
+    assert result.returncode == 0
+    assert result.stdout == "[00:00:00] Me: hello Admyt\n[00:00:02] Them: hi\n"
+
+
+def test_cli_rejects_a_malformed_track() -> None:
+    result = run_cli("--track", "no-label.json")
+
+    assert result.returncode != 0
+    assert "NAME=PATH" in result.stderr
+
+
 def test_cli_requires_at_least_one_track() -> None:
     result = run_cli()
 
@@ -179,6 +179,25 @@ EOF
   grep -qF '</tmp/work space>' "$TEST_LOG"
 }
 
+@test "claude_session_resolve_many passes every pid:pane pair to one resolver run" {
+  resolver="$HOME/resolver"
+  write_executable "$resolver" <<'EOF'
+#!/usr/bin/env bash
+printf '<%s>\n' "$@" >>"$TEST_LOG"
+printf '{"pid":711,"status":"resolved"}\n{"pid":712,"status":"unresolved"}\n'
+EOF
+  export CLAUDE_SESSION_RESOLVER="$resolver"
+
+  run claude_session_resolve_many "" "711:%1" "712:%2"
+
+  [ "$status" -eq 0 ]
+  [ "${#lines[@]}" -eq 2 ]
+  [ "$(grep -c '^<--pids>$' "$TEST_LOG")" -eq 1 ]
+  grep -qF '<711:%1>' "$TEST_LOG"
+  grep -qF '<712:%2>' "$TEST_LOG"
+  ! grep -qF '<--config-dir>' "$TEST_LOG"
+}
+
 @test "agent_foreground_pid_for_tty finds the foreground claude on the tty" {
   write_stub ps <<'EOF'
 #!/usr/bin/env bash
@@ -122,3 +122,17 @@ PY
   [ "$status" -eq 1 ]
   [[ "$output" == *"found no files to check"* ]]
 }
+
+@test "violations are reported in sorted path order" {
+  fixture_tree
+  for name in c b a; do
+    printf '#!/usr/bin/env bash\necho %s\n' "$name" >".config/tmux/scripts/$name.sh"
+    chmod +x ".config/tmux/scripts/$name.sh"
+  done
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [ "${#lines[@]}" -eq 3 ]
+  [[ "${lines[0]}" == "bash5-preamble: .config/tmux/scripts/a.sh: "* ]]
+  [[ "${lines[1]}" == "bash5-preamble: .config/tmux/scripts/b.sh: "* ]]
+  [[ "${lines[2]}" == "bash5-preamble: .config/tmux/scripts/c.sh: "* ]]
+}
@@ -11,6 +11,7 @@ setup() {
   export REPO="$BATS_TEST_TMPDIR/repo"
   mkdir -p "$REPO/.hk-hooks"
   cp "$GUARD" "$REPO/.hk-hooks/claude-profile-leak-guard.py"
+  cp "$(dirname "$GUARD")/_hktime.py" "$REPO/.hk-hooks/"
   cd "$REPO" || exit
   git init -q
   git config user.email test@example.com
@@ -130,3 +131,40 @@ EOF
   [ "$status" -eq 1 ]
   [[ "$output" == *"staged concrete .claude-profiles path"* ]]
 }
+
+@test "guard attributes each finding to its own file in a multi-file commit" {
+  echo 'clean' >a.md
+  printf 'clean\nalias ccw=%s\n' "'claude-code-profile work'" >b.md
+  echo 'also clean' >c.md
+  git add a.md b.md c.md
+
+  run_guard
+
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"b.md:diff-line-8: staged concrete Claude profile alias/call"* ]]
+  [[ "$output" != *"a.md:"* ]]
+  [[ "$output" != *"c.md:"* ]]
+}
+
+@test "guard reports every check a single line trips" {
+  echo 'claude-code-profile sk-ant-abc' >README.md
+  git add README.md
+
+  run_guard
+
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"staged Anthropic token pattern"* ]]
+  [[ "$output" == *"staged concrete Claude profile alias/call"* ]]
+}
+
+@test "guard scans a renamed file whole" {
+  echo "alias ccw='claude-code-profile work'" >notes.md
+  git add notes.md
+  git -c core.hooksPath=/dev/null commit -qm seed
+  git mv notes.md moved.md
+
+  run_guard
+
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"moved.md:diff-line-"*"profile alias/call"* ]]
+}
@@ -10,6 +10,9 @@ RESOLVER="$BATS_TEST_DIRNAME/../../tmux/scripts/claude-session-resolve.py"
 setup() {
   setup_test_home
   mkdir -p "$HOME/.claude/sessions" "$HOME/.claude/projects/-tmp-work"
+  # An empty fake procfs: on a Linux host the resolver would otherwise read the
+  # real /proc/711 (if that pid happens to exist) instead of the ps/lsof stubs.
+  export RESURRECT_PROC_ROOT="$BATS_TEST_TMPDIR/proc"
 }
 
 # Portability guard: the resolver runs under `env python3`, which is macOS
@@ -216,3 +219,286 @@ EOF
   [ "$(printf '%s' "$output" | jq -r '.status')" = "ambiguous" ]
   [ "$(printf '%s' "$output" | jq -r '.reason')" = "multiple transcripts matched equally" ]
 }
+
+@test "content matching indexes transcript lines appended after the first resolve" {
+  local transcript="$HOME/.claude/projects/-tmp-work/session-grow.jsonl"
+  cat >"$transcript" <<'EOF'
+{"sessionId":"session-grow","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}
+EOF
+  capture="$BATS_TEST_TMPDIR/capture.txt"
+  cat >"$capture" <<'EOF'
+Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes
+EOF
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+
+  run python3 "$RESOLVER" --pid 711 --cwd /tmp/work --capture-file "$capture"
+  [ "$status" -eq 0 ]
+  [ -s "$HOME/.cache/claude-session-index.sqlite" ]
+
+  cat >>"$transcript" <<'EOF'
+{"sessionId":"session-grow","type":"user","message":{"content":"Now please wire the status bar popup so it reopens the last picker position after detach"}}
+EOF
+  cat >"$capture" <<'EOF'
+Now please wire the status bar popup so it reopens the last picker position after detach
+EOF
+
+  run python3 "$RESOLVER" --pid 711 --cwd /tmp/work --capture-file "$capture"
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.source')" = "content-match" ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-grow" ]
+}
+
+@test "content matching scans a transcript the deadline left out of date" {
+  local transcript="$HOME/.claude/projects/-tmp-work/session-late.jsonl"
+  cat >"$transcript" <<'EOF'
+{"sessionId":"session-late","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}
+EOF
+  # An already-spent deadline: the refresh indexes nothing, so only a scan of
+  # the out-of-date transcript can find the pane text.
+  run -0 python3 - "$RESOLVER" "$transcript" <<'PY'
+import importlib.util, sys, time
+from pathlib import Path
+spec = importlib.util.spec_from_file_location("resolver", sys.argv[1])
+mod = importlib.util.module_from_spec(spec)
+sys.modules["resolver"] = mod  # dataclasses on 3.9 needs the module registered
+spec.loader.exec_module(mod)
+matcher = mod.TranscriptMatcher(Path("/nonexistent"))
+pane = mod.normalise(
+    "Could you look into reverse engineering claude maybe in order to devise"
+    " some way of always getting the pid from sandboxed panes"
+)
+for item in matcher.scores([Path(sys.argv[2])], pane, time.monotonic()):
+    print(item["sessionId"], item["score"])
+PY
+
+  [ "$output" = "session-late 8" ]
+}
+
+@test "content matching falls back to scanning transcripts when the index is unusable" {
+  cat >"$HOME/.claude/projects/-tmp-work/session-content.jsonl" <<'EOF'
+{"sessionId":"session-content","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}
+EOF
+  capture="$BATS_TEST_TMPDIR/capture.txt"
+  cat >"$capture" <<'EOF'
+Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes
+EOF
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  # A regular file where the index's parent dir should be: mkdir fails.
+  : >"$BATS_TEST_TMPDIR/not-a-dir"
+
+  CLAUDE_SESSION_INDEX="$BATS_TEST_TMPDIR/not-a-dir/index.sqlite" \
+    run python3 "$RESOLVER" --pid 711 --cwd /tmp/work --capture-file "$capture"
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.source')" = "content-match" ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-content" ]
+}
+
+@test "fallback scanning reads transcripts from the tail, including an unterminated last line" {
+  local transcript="$HOME/.claude/projects/-tmp-work/session-tail.jsonl"
+  for _ in 1 2 3; do
+    printf '%s\n' '{"sessionId":"session-tail","type":"assistant","message":{"content":"unrelated earlier output that never reaches the visible pane at all"}}'
+  done >"$transcript"
+  printf '%s' '{"sessionId":"session-tail","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}' >>"$transcript"
+  capture="$BATS_TEST_TMPDIR/capture.txt"
+  cat >"$capture" <<'EOF'
+Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes
+EOF
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  : >"$BATS_TEST_TMPDIR/not-a-dir"
+
+  CLAUDE_SESSION_INDEX="$BATS_TEST_TMPDIR/not-a-dir/index.sqlite" \
+    run python3 "$RESOLVER" --pid 711 --cwd /tmp/work --capture-file "$capture"
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-tail" ]
+  [ "$(printf '%s' "$output" | jq -r '.candidates[0].score')" = "8" ]
+}
+
+@test "concurrent probes keep strategy precedence: an open transcript beats content match" {
+  cat >"$HOME/.claude/projects/-tmp-work/session-open.jsonl" <<'EOF'
+{"sessionId":"session-open","type":"user","message":{"content":"hello"}}
+EOF
+  cat >"$HOME/.claude/projects/-tmp-work/session-content.jsonl" <<'EOF'
+{"sessionId":"session-content","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}
+EOF
+  capture="$BATS_TEST_TMPDIR/capture.txt"
+  cat >"$capture" <<'EOF'
+Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes
+EOF
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  write_stub lsof <<EOF
+#!/usr/bin/env bash
+case "\$*" in
+  *"-d cwd"*) printf 'n/tmp/work\n' ;;
+  *) printf 'n%s/.claude/projects/-tmp-work/session-open.jsonl\n' "$HOME" ;;
+esac
+EOF
+
+  run python3 "$RESOLVER" --pid 711 --capture-file "$capture"
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.source')" = "open-jsonl" ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-open" ]
+  [ "$(printf '%s' "$output" | jq -r '.cwd')" = "/tmp/work" ]
+}
+
+@test "--pids resolves a batch of pid:pane pairs, one JSON line per pid in input order" {
+  cat >"$HOME/.claude/sessions/711.json" <<'EOF'
+{"pid":711,"sessionId":"session-registry","cwd":"/tmp/work"}
+EOF
+  cat >"$HOME/.claude/projects/-tmp-work/session-content.jsonl" <<'EOF'
+{"sessionId":"session-content","type":"user","message":{"content":"Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes"}}
+EOF
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+printf '%s\n' "$*" >>"$TEST_LOG"
+case "$*" in
+  *"-o pid=,command= -p 712,713"*) printf '  712 claude --resume session-from-args\n  713 claude\n' ;;
+  *) exit 1 ;;
+esac
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+printf 'lsof %s\n' "$*" >>"$TEST_LOG"
+case "$*" in
+  *"-d cwd"*) printf 'p712\nfcwd\nn/tmp/work\np713\nfcwd\nn/tmp/work\n' ;;
+  *) exit 1 ;;
+esac
+EOF
+  write_stub tmux <<'EOF'
+#!/usr/bin/env bash
+case "$*" in
+  *"-t %3"*) printf 'Could you look into reverse engineering claude maybe in order to devise some way of always getting the pid from sandboxed panes\n' ;;
+esac
+EOF
+
+  run python3 "$RESOLVER" --pids 711:%1 712:%2 713:%3
+
+  [ "$status" -eq 0 ]
+  [ "${#lines[@]}" -eq 3 ]
+  [ "$(printf '%s' "${lines[0]}" | jq -r '[.pid, .source, .sessionId] | join(" ")')" = "711 registry session-registry" ]
+  [ "$(printf '%s' "${lines[1]}" | jq -r '[.pid, .source, .sessionId] | join(" ")')" = "712 launch-args session-from-args" ]
+  [ "$(printf '%s' "${lines[2]}" | jq -r '[.pid, .source, .sessionId] | join(" ")')" = "713 content-match session-content" ]
+  # One ps and one lsof per probe kind for the whole batch, not one per pid.
+  [ "$(grep -c -- '-o pid=,command=' "$TEST_LOG")" -eq 1 ]
+  [ "$(grep -c -- '-d cwd' "$TEST_LOG")" -eq 1 ]
+}
+
+@test "--pids exits non-zero when any pid stays unresolved" {
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+
+  run python3 "$RESOLVER" --pids 711 712 --config-dir "$HOME/.claude"
+
+  [ "$status" -eq 1 ]
+  [ "${#lines[@]}" -eq 2 ]
+  [ "$(printf '%s' "${lines[1]}" | jq -r '[.pid, .status] | join(" ")')" = "712 unresolved" ]
+}
+
+@test "reads launch arguments and cwd from procfs without ps or lsof" {
+  local proc="$RESURRECT_PROC_ROOT/711"
+  mkdir -p "$proc/fd"
+  printf 'claude\0--resume\0session-from-proc\0' >"$proc/cmdline"
+  ln -s /tmp/work "$proc/cwd"
+  write_stub ps <<'EOF'
+#!/usr/bin/env bash
+printf 'ps %s\n' "$*" >>"$TEST_LOG"
+exit 1
+EOF
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+printf 'lsof %s\n' "$*" >>"$TEST_LOG"
+exit 1
+EOF
+
+  run python3 "$RESOLVER" --pid 711
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.source')" = "launch-args" ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-from-proc" ]
+  [ "$(printf '%s' "$output" | jq -r '.cwd')" = "/tmp/work" ]
+  [ ! -s "$TEST_LOG" ]
+}
+
+@test "resolves an open transcript from procfs fd links" {
+  local proc="$RESURRECT_PROC_ROOT/711"
+  mkdir -p "$proc/fd"
+  printf 'claude\0' >"$proc/cmdline"
+  cat >"$HOME/.claude/projects/-tmp-work/session-open.jsonl" <<'EOF'
+{"sessionId":"session-open","type":"user","message":{"content":"hello"}}
+EOF
+  ln -s "$HOME/.claude/projects/-tmp-work/session-open.jsonl" "$proc/fd/7"
+  ln -s /dev/null "$proc/fd/0"
+  write_stub lsof <<'EOF'
+#!/usr/bin/env bash
+printf 'lsof %s\n' "$*" >>"$TEST_LOG"
+exit 1
+EOF
+
+  run python3 "$RESOLVER" --pid 711 --cwd /tmp/work
+
+  [ "$status" -eq 0 ]
+  [ "$(printf '%s' "$output" | jq -r '.source')" = "open-jsonl" ]
+  [ "$(printf '%s' "$output" | jq -r '.sessionId')" = "session-open" ]
+  [ ! -s "$TEST_LOG" ]
+}
+
+@test "--pids keeps the live pids' probes when one pid in the batch is gone" {
+  cat >"$HOME/.claude/projects/-tmp-work/session-open.jsonl" <<'EOF2'
+{"sessionId":"session-open","type":"user","message":{"content":"hello"}}
+EOF2
+  # lsof and ps exit 1 when any listed pid is gone, but still report the rest.
+  write_stub ps <<'EOF2'
+#!/usr/bin/env bash
+case "$*" in
+  *"-o pid=,command= -p 712,799"*) printf '  712 claude\n'; exit 1 ;;
+  *) exit 1 ;;
+esac
+EOF2
+  write_stub lsof <<EOF2
+#!/usr/bin/env bash
+case "\$*" in
+  *"-d cwd -p 712,799 -Fpn"*) printf 'p712\nfcwd\nn/tmp/work\n' ;;
+  *"-p 712,799 -Fpn"*) printf 'p712\nn%s/.claude/projects/-tmp-work/session-open.jsonl\n' "$HOME" ;;
+esac
+exit 1
+EOF2
+
+  run python3 "$RESOLVER" --pids 712 799 --config-dir "$HOME/.claude"
+
+  [ "$status" -eq 1 ]
+  [ "$(printf '%s' "${lines[0]}" | jq -r '[.pid, .source, .sessionId, .cwd] | join(" ")')" = "712 open-jsonl session-open /tmp/work" ]
+  [ "$(printf '%s' "${lines[1]}" | jq -r '[.pid, .status] | join(" ")')" = "799 unresolved" ]
+}
@@ -10,6 +10,11 @@ load test_helper
 # under one scanned root via the checker's cwd-relative resolve.
 CHECK="$HOME/.hk-hooks/fzf-bind-lint.py"
 
+setup() {
+  # Results are cached by content hash; keep the suite out of the real cache.
+  export HK_HOOKS_CACHE_DIR="$BATS_TEST_TMPDIR/cache"
+}
+
 @test "real fzf invocations are collision-free today" {
   cd "$HOME"
   run python3 "$CHECK"
@@ -69,3 +74,36 @@ EOF
   [[ "$output" == *"ctrl-m"* ]]
   [[ "$output" == *"enter"* ]]
 }
+
+@test "staged files: only the named files under a root are checked" {
+  cd "$BATS_TEST_TMPDIR"
+  mkdir -p .config/tmux/scripts notes
+  cat >.config/tmux/scripts/bad.sh <<'EOF'
+fzf --bind 'enter:accept' --expect 'ctrl-m'
+EOF
+  cp .config/tmux/scripts/bad.sh notes/bad.sh
+  printf 'echo fine\n' >.config/tmux/scripts/ok.sh
+
+  run python3 "$CHECK" .config/tmux/scripts/ok.sh notes/bad.sh
+  [ "$status" -eq 0 ]
+  [ -z "$output" ]
+
+  run python3 "$CHECK" .config/tmux/scripts/ok.sh .config/tmux/scripts/bad.sh
+  [ "$status" -eq 1 ]
+  [[ "$output" == *".config/tmux/scripts/bad.sh:1 ctrl-m"* ]]
+}
+
+@test "a cached collision still blocks on the next run" {
+  cd "$BATS_TEST_TMPDIR"
+  mkdir -p .config/tmux/scripts
+  cat >.config/tmux/scripts/bad.sh <<'EOF'
+fzf --bind 'enter:accept' --expect 'ctrl-m'
+EOF
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [ -s "$HK_HOOKS_CACHE_DIR/fzf-bind-lint.json" ]
+
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"ctrl-m"* ]]
+}
@@ -0,0 +1,108 @@
+#!/usr/bin/env bats
+
+bats_require_minimum_version 1.5.0
+
+# shellcheck disable=SC1091
+source "$BATS_TEST_DIRNAME/test_helper.bash"
+
+RENDER_DUMP="$BATS_TEST_DIRNAME/../../tmux/scripts/render-dump.py"
+
+# Hand-written tty streams rather than a recorded tmux client: what is under test
+# is the replay (chunking, frame boundaries), which tmux-render-smoke.bats covers
+# end to end against a real client.
+setup() {
+  command -v uv >/dev/null 2>&1 || skip "uv unavailable"
+  LOG="$BATS_TEST_TMPDIR/tty.log"
+}
+
+render_dump() {
+  uv run --quiet --with pyte "$RENDER_DUMP" "$@"
+}
+
+@test "prints only the final screen by default" {
+  printf 'hello\r\nworld' >"$LOG"
+
+  run -0 render_dump "$LOG" 10x2
+
+  [ "${lines[0]}" = "hello     " ]
+  [ "${lines[1]}" = "world     " ]
+  [ "${#lines[@]}" -eq 2 ]
+}
+
+@test "--marker dumps the screen after each occurrence, then the final one" {
+  # Synchronized-update ends (CSI ?2026l) are where a client frame is complete.
+  printf 'one\033[?2026l\033[Htwo\033[?2026l\033[Hsix' >"$LOG"
+
+  run -0 render_dump "$LOG" 5x1 --marker '\x1b[?2026l'
+
+  [ "${lines[0]}" = "=== frame 1 @ 11" ]
+  [ "${lines[1]}" = "one  " ]
+  [ "${lines[2]}" = "=== frame 2 @ 25" ]
+  [ "${lines[3]}" = "two  " ]
+  [ "${lines[4]}" = "=== frame 3 @ 31" ]
+  [ "${lines[5]}" = "six  " ]
+}
+
+@test "--every dumps a screen per N bytes without repeating the final screen" {
+  printf 'abcdef' >"$LOG"
+
+  run -0 render_dump "$LOG" 6x1 --every 3
+
+  [ "${lines[0]}" = "=== frame 1 @ 3" ]
+  [ "${lines[1]}" = "abc   " ]
+  [ "${lines[2]}" = "=== frame 2 @ 6" ]
+  [ "${lines[3]}" = "abcdef" ]
+  [ "${#lines[@]}" -eq 4 ]
+}
+
+@test "rejects a malformed size" {
+  printf 'x' >"$LOG"
+
+  run -2 render_dump "$LOG" 80by24
+
+  [[ "$output" == *"expected WxH"* ]]
+}
+
+@test "--frames logs only the rows each distinct frame changed" {
+  # The third marker follows no drawing at all, so it yields no frame; the
+  # last frame is the tail after the final marker.
+  printf 'one\r\nsame\033[?2026l\033[Htwo\033[?2026l\033[?2026l\033[2;1Hnew!' >"$LOG"
+
+  run -0 render_dump "$LOG" 5x2 --frames --marker '\x1b[?2026l'
+
+  [ "${#lines[@]}" -eq 3 ]
+  [ "$(jq -c . <<<"${lines[0]}")" = '{"frame":1,"offset":17,"rows":{"0":"one  ","1":"same "}}' ]
+  [ "$(jq -c . <<<"${lines[1]}")" = '{"frame":2,"offset":31,"rows":{"0":"two  "}}' ]
+  [ "$(jq -c .rows <<<"${lines[2]}")" = '{"1":"new! "}' ]
+}
+
+@test "--frames cuts at tmux's redraw ends by default" {
+  # A sync end and a cursor show each close a redraw; the tail after the last
+  # one is closed by EOF.
+  printf 'a\033[?2026l\033[Hb\033[?25h\033[Hc' >"$LOG"
+
+  run -0 render_dump "$LOG" 2x1 --frames
+
+  [ "${#lines[@]}" -eq 3 ]
+  [ "$(jq -c . <<<"${lines[0]}")" = '{"frame":1,"offset":9,"rows":{"0":"a "}}' ]
+  [ "$(jq -c . <<<"${lines[1]}")" = '{"frame":2,"offset":19,"rows":{"0":"b "}}' ]
+  [ "$(jq -c . <<<"${lines[2]}")" = '{"frame":3,"offset":23,"rows":{"0":"c "}}' ]
+}
+
+@test "--frames with --marker cuts only at the marker" {
+  printf 'a\033[?25h\033[Hb\033[?2026l\033[Hc' >"$LOG"
+
+  run -0 render_dump "$LOG" 2x1 --frames --marker '\x1b[?2026l'
+
+  [ "${#lines[@]}" -eq 2 ]
+  [ "$(jq -c . <<<"${lines[0]}")" = '{"frame":1,"offset":19,"rows":{"0":"b "}}' ]
+  [ "$(jq -c . <<<"${lines[1]}")" = '{"frame":2,"offset":23,"rows":{"0":"c "}}' ]
+}
+
+@test "--frames with no redraw ends records the final state" {
+  printf 'a\033[Hb' >"$LOG"
+
+  run -0 render_dump "$LOG" 2x1 --frames
+
+  [ "$(jq -c . <<<"$output")" = '{"frame":1,"offset":5,"rows":{"0":"b "}}' ]
+}
@@ -10,6 +10,10 @@ load test_helper
 # the checker's cwd-relative resolve.
 CHECK="$HOME/.hk-hooks/tmux-bind-lint.py"
 
+setup() {
+  export HK_HOOKS_CACHE_DIR="$BATS_TEST_TMPDIR/cache"
+}
+
 @test "real tmux.conf is collision-free today" {
   cd "$HOME"
   run python3 "$CHECK"
@@ -66,3 +70,45 @@ EOF
   run python3 "$CHECK"
   [ "$status" -eq 0 ]
 }
+
+@test "a clean verdict is cached, and an edit is linted again" {
+  cd "$BATS_TEST_TMPDIR"
+  mkdir -p .config/tmux
+  echo 'bind -N "Next window" n next-window' >.config/tmux/tmux.conf
+  run python3 "$CHECK"
+  [ "$status" -eq 0 ]
+  [ -s "$HK_HOOKS_CACHE_DIR/tmux-bind-lint.json" ]
+
+  echo 'bind -N "dup" n other-cmd' >>.config/tmux/tmux.conf
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"duplicate"* ]]
+}
+
+@test "a sourced config is linted and named in the finding" {
+  cd "$BATS_TEST_TMPDIR"
+  mkdir -p .config/tmux
+  echo "source-file -q '$BATS_TEST_TMPDIR/extra.conf'" >.config/tmux/tmux.conf
+  echo 'bind n next-window' >extra.conf
+  run python3 "$CHECK"
+  [ "$status" -eq 0 ]
+
+  echo 'bind n other-cmd' >>extra.conf
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"$BATS_TEST_TMPDIR/extra.conf: duplicate"* ]]
+}
+
+@test "a key bound in tmux.conf and again in a sourced file blocks" {
+  cd "$BATS_TEST_TMPDIR"
+  mkdir -p .config/tmux
+  cat >.config/tmux/tmux.conf <<EOF2
+bind n next-window
+source-file -q '$BATS_TEST_TMPDIR/extra.conf'
+EOF2
+  echo 'bind n other-cmd' >extra.conf
+  run python3 "$CHECK"
+  [ "$status" -eq 1 ]
+  [[ "$output" == *"duplicate bind: key 'n'"* ]]
+  [[ "$output" == *".config/tmux/tmux.conf:1, $BATS_TEST_TMPDIR/extra.conf:1"* ]]
+}
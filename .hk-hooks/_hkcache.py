@@ -0,0 +1,66 @@
+"""Result caches shared by the hk gates: one JSON document per gate.
+
+Lives under ~/.cache/hk-hooks (HK_HOOKS_CACHE_DIR overrides, which the bats
+suites use to stay out of the real cache). A cache only ever makes a gate
+faster: an unreadable, corrupt or unwritable file behaves as an empty cache,
+never as a failure, so the verdict is always the one a cold run would give.
+
+Each gate keys its entries on content hashes and stores its own source's hash
+alongside them, so editing a checker invalidates everything it cached.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+def cache_path(name: str) -> Path:
+    base = os.environ.get("HK_HOOKS_CACHE_DIR") or Path.home() / ".cache" / "hk-hooks"
+    return Path(base) / f"{name}.json"
+
+
+def digest(*parts: bytes) -> str:
+    """sha256 over the parts, length-prefixed so ("ab", "c") != ("a", "bc")."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(len(part).to_bytes(8, "big"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def source_version(source: str) -> str:
+    """A gate's cache version: the hash of its own source file (pass `__file__`)."""
+    return digest(Path(source).read_bytes())
+
+
+def load(name: str, version: str) -> dict:
+    """The cached document for `name`, or {} if missing, corrupt or from another version."""
+    try:
+        data = json.loads(cache_path(name).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    return data
+
+
+def save(name: str, version: str, data: dict) -> None:
+    """Atomically replace the cache for `name`; any failure is ignored."""
+    path = cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{name}.")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({**data, "version": version}, f)
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
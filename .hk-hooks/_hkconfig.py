@@ -0,0 +1,210 @@
+"""The agent configs the parity gates compare, parsed once and reduced to rule sets.
+
+permission-parity and secret-path-parity both read .claude/settings.json, and
+between them srt's base.json, .codex/hooks.json and opencode.json. Each
+accessor here returns one config reduced to the rules a gate compares:
+Claude's `Bash(x:*)` bases, OpenCode's deny globs, srt's deny paths, and the
+few fields of the hook wiring the gates walk. A new parity check starts from
+these rather than from raw JSON.
+
+The reduced sets are cached on disk (_hkcache, document "hkconfig") under each
+file's path, mtime and size, and memoised in-process, so under run-gates.py
+the two gates share one parse and an unchanged config is not parsed at all.
+A config that cannot be read or parsed raises OSError/ValueError, as
+json.loads(read_text()) did.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import _hkcache
+import _hkio
+import _hktime
+
+CLAUDE_SETTINGS = ".claude/settings.json"
+OPENCODE_CONFIG = ".config/opencode/opencode.json"
+SRT_CONFIG = ".config/srt/base.json"
+CODEX_HOOKS = ".codex/hooks.json"
+
+CACHE = "hkconfig"
+
+_CLAUDE_BASH_RE = re.compile(r"^Bash\((.*)\)$", re.DOTALL)
+
+
+# --- normalisation ---------------------------------------------------------
+
+
+def normalise_claude(entry: str) -> str | None:
+    """Reduce a Claude `Bash(cmd:*)` rule to its bare command.
+
+    Returns None for non-Bash entries (e.g. `Read(...)`, `WebFetch`).
+    """
+    m = _CLAUDE_BASH_RE.match(entry)
+    if not m:
+        return None
+    inner = m.group(1)
+    inner = inner.removesuffix(":*")
+    return inner
+
+
+def normalise_opencode(pattern: str) -> str:
+    """Reduce an OpenCode `cmd*` glob to its bare command."""
+    return pattern.removesuffix("*")
+
+
+def claude_deny_bases(settings: dict) -> set[str]:
+    deny = settings.get("permissions", {}).get("deny", [])
+    return {b for e in deny if (b := normalise_claude(e)) is not None}
+
+
+def claude_allow_bases(settings: dict) -> set[str]:
+    allow = settings.get("permissions", {}).get("allow", [])
+    return {b for e in allow if (b := normalise_claude(e)) is not None}
+
+
+def _opencode_bash(config: dict) -> dict:
+    return config.get("permission", {}).get("bash", {})
+
+
+def opencode_deny_bases(config: dict) -> set[str]:
+    return {normalise_opencode(k) for k, v in _opencode_bash(config).items() if v == "deny"}
+
+
+def opencode_deny_globs(config: dict) -> list[str]:
+    return [k for k, v in _opencode_bash(config).items() if v == "deny"]
+
+
+def pre_tool_use(config: dict) -> list[dict]:
+    """`hooks.PreToolUse` cut down to each entry's matcher and hook commands."""
+    return [
+        {
+            "matcher": entry.get("matcher"),
+            "hooks": [{"command": hook.get("command", "")} for hook in entry.get("hooks", [])],
+        }
+        for entry in config.get("hooks", {}).get("PreToolUse", [])
+    ]
+
+
+# --- rule sets -------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class ClaudeRules:
+    """settings.json as the parity gates see it.
+
+    `wiring` keeps settings.json's shape for the wiring and deny checks, but
+    only what they read: the non-Bash deny rules (the Bash ones are
+    `deny_bases`) and the `hooks.PreToolUse` matchers and commands.
+    """
+
+    deny_bases: frozenset[str]
+    allow_bases: frozenset[str]
+    wiring: dict
+
+
+@dataclass(frozen=True, slots=True)
+class OpencodeRules:
+    deny_bases: frozenset[str]
+    deny_globs: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SrtRules:
+    deny_read: tuple[str, ...]
+    deny_write: tuple[str, ...]
+
+
+def reduce_claude(settings: dict) -> dict:
+    deny = settings.get("permissions", {}).get("deny", [])
+    return {
+        "deny_bases": sorted(claude_deny_bases(settings)),
+        "allow_bases": sorted(claude_allow_bases(settings)),
+        "wiring": {
+            "permissions": {"deny": [e for e in deny if normalise_claude(e) is None]},
+            "hooks": {"PreToolUse": pre_tool_use(settings)},
+        },
+    }
+
+
+def reduce_opencode(config: dict) -> dict:
+    return {
+        "deny_bases": sorted(opencode_deny_bases(config)),
+        "deny_globs": opencode_deny_globs(config),
+    }
+
+
+def reduce_srt(srt: dict) -> dict:
+    return {
+        "deny_read": srt["filesystem"]["denyRead"],
+        "deny_write": srt["filesystem"]["denyWrite"],
+    }
+
+
+def reduce_codex(hooks: dict) -> dict:
+    return {"hooks": {"PreToolUse": pre_tool_use(hooks)}}
+
+
+# --- loading ---------------------------------------------------------------
+
+
+_lock = threading.Lock()
+_memo: dict[str, tuple[list, dict]] = {}
+
+
+def resolve(rel: str) -> Path:
+    """Prefer the cwd-relative path (pre-commit runs from $HOME), else $HOME."""
+    p = Path(rel)
+    return p if p.exists() else Path.home() / rel
+
+
+def _reduced(rel: str, reduce: Callable[[dict], dict]) -> dict:
+    """`reduce` applied to the config at `rel`: from memory, disk cache, or a parse."""
+    path = resolve(rel)
+    st = path.stat()
+    stamp = [str(path.absolute()), st.st_mtime_ns, st.st_size]
+    # One lock for the lot: two gates asking for the same file wait for one
+    # parse, and cache writes never interleave.
+    with _lock:
+        hit = _memo.get(rel)
+        if hit and hit[0] == stamp:
+            return hit[1]
+        version = _hkcache.source_version(__file__)
+        document = _hkcache.load(CACHE, version)
+        entry = document.get("configs", {}).get(rel)
+        if entry and entry.get("stamp") == stamp:
+            rules = entry["rules"]
+        else:
+            with _hktime.phase("read"):
+                text = _hkio.read_text(path)
+            with _hktime.phase("parse"):
+                rules = reduce(json.loads(text))
+            configs = {**document.get("configs", {}), rel: {"stamp": stamp, "rules": rules}}
+            _hkcache.save(CACHE, version, {"configs": configs})
+        _memo[rel] = (stamp, rules)
+        return rules
+
+
+def claude() -> ClaudeRules:
+    r = _reduced(CLAUDE_SETTINGS, reduce_claude)
+    return ClaudeRules(frozenset(r["deny_bases"]), frozenset(r["allow_bases"]), r["wiring"])
+
+
+def opencode() -> OpencodeRules:
+    r = _reduced(OPENCODE_CONFIG, reduce_opencode)
+    return OpencodeRules(frozenset(r["deny_bases"]), tuple(r["deny_globs"]))
+
+
+def srt() -> SrtRules:
+    r = _reduced(SRT_CONFIG, reduce_srt)
+    return SrtRules(tuple(r["deny_read"]), tuple(r["deny_write"]))
+
+
+def codex_wiring() -> dict:
+    """.codex/hooks.json cut down to the `hooks.PreToolUse` matchers and commands."""
+    return _reduced(CODEX_HOOKS, reduce_codex)
@@ -0,0 +1,80 @@
+"""In-process memo for what the hk gates read: files, tree walks, git listings.
+
+Run standalone, a gate reads each input once anyway and this is a thin
+wrapper. Under run-gates.py the gates share one interpreter, and the memo is
+what stops two of them reading .claude/settings.json, walking
+.config/tmux/scripts or running `git ls-files` twice. Entries are keyed on
+absolute paths, so a cwd change never serves one tree's file for another,
+and file reads also on mtime and size, so a file rewritten since it was read
+is read again.
+
+Safe under the runner's thread pool: functools.cache may compute an entry
+twice in a race, never hand back a wrong one. Errors are not cached - a failed
+read raises every time, exactly like the call it replaces.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from functools import cache
+from pathlib import Path
+
+
+@cache
+def _read_bytes(path: Path, mtime_ns: int, size: int) -> bytes:
+    return path.read_bytes()
+
+
+def read_bytes(path: Path) -> bytes:
+    path = path.absolute()
+    st = path.stat()
+    return _read_bytes(path, st.st_mtime_ns, st.st_size)
+
+
+def read_text(path: Path, errors: str = "strict") -> str:
+    return read_bytes(path).decode("utf-8", errors)
+
+
+@cache
+def _files_under(root: Path) -> tuple[Path, ...]:
+    return tuple(p for p in sorted(root.rglob("*")) if p.is_file())
+
+
+def files_under(root: Path) -> tuple[Path, ...]:
+    """Every regular file below `root`, sorted; empty if it does not exist."""
+    return _files_under(root.absolute()) if root.is_dir() else ()
+
+
+def git_dir() -> Path:
+    """The dotfiles repository: a bare git dir whose work-tree is $HOME."""
+    return Path.home() / "git" / "dotfiles"
+
+
+@cache
+def tracked_files(*pathspecs: str) -> tuple[str, ...] | None:
+    """Tracked paths from the dotfiles work-tree (optionally only those matching
+    `pathspecs`), or None if git cannot answer."""
+    try:
+        out = subprocess.run(
+            [
+                "git",
+                f"--git-dir={git_dir()}",
+                f"--work-tree={Path.home()}",
+                "ls-files",
+                "--",
+                *pathspecs,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return tuple(out.stdout.splitlines())
+
+
+def clear() -> None:
+    """Forget everything memoised (tests that rewrite files between runs)."""
+    _read_bytes.cache_clear()
+    _files_under.cache_clear()
+    tracked_files.cache_clear()
@@ -0,0 +1,117 @@
+"""Per-phase timings for the hk gates, with an optional budget warning.
+
+A gate marks its work with `phase("read")`, `phase("parse")` and
+`phase("check")`; repeated entries into one phase add up. Outside a timed run
+(plain imports, the pytest suites) a phase costs a clock read and records
+nothing. Timings are per thread, so run-gates.py can time gates that run
+side by side.
+
+Two knobs, both off by default and both warn-only - a slow gate never fails a
+commit:
+
+  HK_HOOKS_TIMING_LOG=PATH  append one JSONL record per gate run:
+                            {"gate", "ms", "phases": {"read": ms, ...}, "exit", "at"}
+  HK_HOOKS_BUDGET_MS=N      print a warning when a gate takes longer than N ms
+
+run-gates.py takes the same two as --timing-log/--budget-ms. A gate run on
+its own reads them from the environment via `run()`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+PHASES = ("read", "parse", "check")
+
+
+@dataclass(slots=True)
+class Timing:
+    gate: str
+    ms: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    code: int = 0
+
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the current gate's `name` phase."""
+    timing: Timing | None = getattr(_local, "timing", None)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timing is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            timing.phases[name] = timing.phases.get(name, 0.0) + elapsed
+
+
+def timed(gate: str, entry: Callable[[], int | None]) -> tuple[int | None, Timing]:
+    """Call `entry` with phase timing on for this thread; an exception propagates."""
+    timing = Timing(gate)
+    _local.timing = timing
+    start = time.perf_counter()
+    try:
+        code = entry()
+    finally:
+        timing.ms = (time.perf_counter() - start) * 1000
+        _local.timing = None
+    timing.code = code or 0
+    return code, timing
+
+
+def over_budget(timing: Timing, budget_ms: float | None) -> str | None:
+    """The warning for a gate that ran past its budget, else None."""
+    if budget_ms is None or timing.ms <= budget_ms:
+        return None
+    split = ", ".join(f"{p} {timing.phases[p]:.0f}" for p in PHASES if p in timing.phases)
+    return (
+        f"hk-timing: {timing.gate} took {timing.ms:.0f} ms (budget {budget_ms:.0f} ms"
+        + (f"; {split}" if split else "")
+        + ")"
+    )
+
+
+def record(timing: Timing) -> dict:
+    return {
+        "gate": timing.gate,
+        "ms": round(timing.ms, 3),
+        "phases": {p: round(ms, 3) for p, ms in timing.phases.items()},
+        "exit": timing.code,
+        "at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_log(path: str | None, timings: list[Timing]) -> None:
+    """Append one JSONL record per timing; an unwritable log is ignored."""
+    if not path:
+        return
+    with contextlib.suppress(OSError), open(path, "a") as f:
+        f.writelines(json.dumps(record(t)) + "\n" for t in timings)
+
+
+def budget_from_env() -> float | None:
+    raw = os.environ.get("HK_HOOKS_BUDGET_MS")
+    try:
+        return float(raw) if raw else None
+    except ValueError:
+        return None
+
+
+def run(gate: str, entry: Callable[[], int | None]) -> int:
+    """A gate's `__main__` entry: time `entry`, then log and warn per the env."""
+    code, timing = timed(gate, entry)
+    warning = over_budget(timing, budget_from_env())
+    if warning:
+        print(warning, file=sys.stderr)
+    write_log(os.environ.get("HK_HOOKS_TIMING_LOG"), [timing])
+    return code or 0
@@ -20,6 +20,10 @@ here are genuinely POSIX-clean) except for libs, which key on the directory
   3. A `sh`-shebang file -> must NOT contain the preamble (an sh script that
      re-execs itself into bash is a mistake, not a hardening).
 
+Only the first line is read to classify a file; the full text is read only
+for files a rule applies to. Files are scanned on a thread pool, and the
+report keeps the sorted walk order.
+
 Exit codes: 0 = every file conforms, 1 = at least one violation.
 
 Tests:
@@ -30,8 +34,13 @@ from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
+
+import _hkio
+import _hktime
 
 SCRIPT_DIRS: tuple[str, ...] = (
     ".config/tmux/scripts",
@@ -67,6 +76,9 @@ ASSERT_MARKERS: tuple[str, ...] = (
 
 PREAMBLE_HEAD = PREAMBLE_MARKERS[0]
 
+# A shebang longer than this is not one of ours; the rest of the line is ignored.
+FIRST_LINE_LIMIT = 256
+
 
 # --- functional core -------------------------------------------------------
 
@@ -126,37 +138,52 @@ def _root() -> Path:
     return cwd if (cwd / SCRIPT_DIRS[0]).is_dir() else Path.home()
 
 
-def main() -> int:
+def _first_line(path: Path) -> str:
+    with path.open("rb") as f:
+        head = f.readline(FIRST_LINE_LIMIT)
+    return head.decode("utf-8", "replace").rstrip()
+
+
+def load(root: Path, path: Path) -> tuple[str, str, str]:
+    """(rel, kind, text) for one file; kind 'unreadable' carries the error as text."""
+    rel = path.relative_to(root).as_posix()
+    try:
+        # Libs are classified by directory alone; skip even the shebang read.
+        first_line = "" if rel.startswith(LIB_DIR + "/") else _first_line(path)
+        kind = classify(rel, os.access(path, os.X_OK), first_line)
+        if kind == "ignore":
+            return rel, kind, ""
+        return rel, kind, _hkio.read_text(path, errors="replace")
+    except OSError as e:
+        return rel, "unreadable", str(e)
+
+
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     root = _root()
+    with _hktime.phase("read"):
+        paths = [path for d in SCRIPT_DIRS for path in _hkio.files_under(root / d)]
+        with ThreadPoolExecutor() as pool:
+            # map() yields in submission order, so the report stays in walk order.
+            loaded = list(pool.map(lambda path: load(root, path), paths))
+
     violations: list[Violation] = []
     seen = 0
-    for d in SCRIPT_DIRS:
-        base = root / d
-        if not base.is_dir():
-            continue
-        for path in sorted(base.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(root).as_posix()
-            try:
-                text = path.read_text(encoding="utf-8", errors="replace")
-            except OSError as e:
-                violations.append(Violation(rel, f"cannot read ({e})"))
-                continue
-            first_line = text.split("\n", 1)[0].rstrip()
-            kind = classify(rel, os.access(path, os.X_OK), first_line)
-            if kind == "ignore":
-                continue
-            seen += 1
-            violations.extend(check(rel, kind, text))
+    with _hktime.phase("check"):
+        for rel, kind, text in loaded:
+            if kind == "unreadable":
+                violations.append(Violation(rel, f"cannot read ({text})"))
+            elif kind != "ignore":
+                seen += 1
+                violations.extend(check(rel, kind, text))
 
     for v in violations:
-        print(f"bash5-preamble: {render(v)}", file=sys.stderr)
+        print(f"bash5-preamble: {render(v)}", file=err)
     if not seen:
-        print("bash5-preamble: found no files to check", file=sys.stderr)
+        print("bash5-preamble: found no files to check", file=err)
         return 1
     return 1 if violations else 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("bash5-preamble", main))
@@ -0,0 +1,259 @@
+"""Benchmark the Python hk gates against a synthetic, large dotfiles tree.
+
+Builds a throwaway $HOME-shaped tree, runs run-gates.py over it with every
+gate selected, and prints each gate's wall time and per-phase split (read,
+parse, check) from the timing log - so a gate that stops scaling shows up
+here before it shows up as a slow commit.
+
+Those are in-process numbers: no interpreter start, and inputs the gates
+share are read once. Each run then also spawns every gate on its own, as
+`python3 .hk-hooks/<gate>.py` (one step each, as `hk run gates` has it), and
+times the process from outside, with its own cache dir; the run-gates row
+there is the pre-commit `py-gates` step spawned the same way. Those "spawn"
+columns are what a commit waits for.
+
+The tree copies the small configs the gates read (hk.pkl, the agent settings,
+the quarantine configs, ...) from the real $HOME, and generates the trees
+they walk at `--scale` times roughly today's size: tmux scripts with and
+without the bash5 preamble, zsh functions calling fzf, and a long tmux.conf.
+Verdicts are beside the point - a copied config may well fail its parity gate
+in a tree without the rest of $HOME - and each run's exit code is shown only
+for reference.
+
+The first run starts from empty cache dirs (cold); the rest reuse them (warm).
+
+Usage: python3 .hk-hooks/bench-gates.py [--scale N] [--runs R] [--keep DIR]
+                                          [--source DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# Real files copied into the synthetic tree when present.
+COPIED = (
+    "hk.pkl",
+    ".claude/settings.json",
+    ".claude/hooks/_secretpaths.py",
+    ".claude/hooks/guard-mutating-api.py",
+    ".claude/hooks/guard-secret-paths.py",
+    ".claude/hooks/guard-secret-paths-codex.py",
+    ".codex/hooks.json",
+    ".config/opencode/opencode.json",
+    ".config/srt/base.json",
+    ".pi/agent/extensions/agent-guard/guard.ts",
+    ".pi/agent/extensions/agent-guard/index.ts",
+    ".npmrc",
+    ".config/pnpm/config.yaml",
+    ".config/pnpm/rc",
+    ".bunfig.toml",
+    ".config/uv/uv.toml",
+    ".config/pip/pip.conf",
+    ".yarnrc.yml",
+    ".config/mise/config.toml",
+    ".config/aube/config.toml",
+    ".hk-hooks/ts-tests.sh",
+    ".hk-hooks/bats-tests.sh",
+)
+
+PREAMBLE = """\
+# --- bash5 re-exec preamble: see docs/adr/0001 ---
+if [ "${BASH_VERSINFO[0]:-0}" -lt 5 ]; then
+  if [ -n "${TMUX_BASH5_REEXEC:-}" ]; then
+    echo "bash >= 5 required" >&2
+    exit 1
+  fi
+  for _b5 in "$HOME/.nix-profile/bin/bash" /opt/homebrew/bin/bash; do
+    [ -x "$_b5" ] && TMUX_BASH5_REEXEC=1 exec "$_b5" "$0" ${1+"$@"}
+  done
+fi
+unset TMUX_BASH5_REEXEC _b5
+# --- end bash5 preamble ---
+"""
+
+LIB_ASSERT = """\
+if [ -n "${BASH_VERSION:-}" ] && [ "${BASH_VERSINFO[0]:-0}" -lt 5 ]; then
+  echo "requires bash >= 5" >&2
+  return 1
+fi
+"""
+
+FILLER = "".join(f'echo "line {i}" | sed -e "s/a/b/" >/dev/null\n' for i in range(150))
+
+KEYS = [f"{mod}{c}" for mod in ("M-", "C-", "") for c in "abcdefghjklmnopqrsuvwxyz"]
+
+
+def _write(path: Path, text: str, executable: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if executable:
+        path.chmod(0o755)
+
+
+def build_tree(root: Path, scale: int, source: Path) -> None:
+    """Lay a synthetic $HOME out under `root`."""
+    for rel in COPIED:
+        src = source / rel
+        if src.is_file():
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, root / rel)
+
+    scripts = root / ".config/tmux/scripts"
+    for i in range(30 * scale):
+        fzf = "fzf --expect=ctrl-o --bind 'ctrl-y:execute-silent(echo {})'\n" if i % 3 else ""
+        _write(
+            scripts / f"tool-{i}.sh",
+            "#!/usr/bin/env bash\n" + PREAMBLE + fzf + FILLER,
+            executable=True,
+        )
+        _write(scripts / "lib" / f"lib-{i}.sh", LIB_ASSERT + FILLER)
+        _write(scripts / f"posix-{i}.sh", "#!/bin/sh\n" + FILLER, executable=True)
+        _write(scripts / "data" / f"table-{i}.tsv", "name\tcommand\n" * 200)
+    for sub in ("strategies", "save_command_strategies"):
+        for i in range(5 * scale):
+            _write(
+                root / ".config/tmux" / sub / f"s-{i}.sh",
+                "#!/usr/bin/env bash\n" + PREAMBLE + FILLER,
+                executable=True,
+            )
+
+    functions = root / ".config/zsh/functions"
+    for i in range(50 * scale):
+        body = "".join(
+            f"  fzf --expect=ctrl-{k} --bind 'alt-{k}:accept' --prompt '{i}> '\n"
+            for k in "abcdefgh"
+        )
+        _write(functions / f"fn-{i}", f"# fn-{i}: synthetic picker\nfn-{i}() {{\n{body}}}\n")
+    _write(root / "src/skl/bin/pick", "#!/usr/bin/env bash\nfzf --expect=ctrl-t\n", True)
+
+    binds = [
+        f"bind-key -T table-{t} {key} run-shell 'true {t}'"
+        for t in range(4 * scale)
+        for key in KEYS
+    ]
+    _write(root / ".config/tmux/tmux.conf", "\n".join(binds) + "\n")
+
+
+def gate_scripts(root: Path) -> dict[str, Path]:
+    """step -> gate script, for the gates run-gates would run in `root`."""
+    spec = importlib.util.spec_from_file_location("hk_run_gates", HERE / "run-gates.py")
+    assert spec and spec.loader
+    run_gates = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = run_gates  # slots=True dataclasses resolve their module by name
+    spec.loader.exec_module(run_gates)
+    parse = run_gates.load_gate(".hk-hooks/gate-coverage.py").parse_hk_steps
+    steps = parse((root / "hk.pkl").read_text())
+    return {g.step: HERE / Path(g.source).name for g in run_gates.gates_from_steps(steps)}
+
+
+def spawn(script: Path, root: Path, cache: Path, log: Path | None = None) -> float:
+    """Wall ms of `python3 script` run in `root`, interpreter start included."""
+    env = {**os.environ, "HOME": str(root), "HK_HOOKS_CACHE_DIR": str(cache)}
+    env.pop("HK_HOOKS_BUDGET_MS", None)
+    env.pop("HK_HOOKS_TIMING_LOG", None)
+    if log is not None:
+        env["HK_HOOKS_TIMING_LOG"] = str(log)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(script)], cwd=root, env=env, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_once(root: Path, cache: Path, log: Path, scripts: dict[str, Path]) -> dict[str, float]:
+    """One run under run-gates (timing log to `log`), then each gate spawned alone.
+
+    Returns each gate's spawned wall ms, and run-gates' own under "run-gates".
+    """
+    spawned = {"run-gates": spawn(HERE / "run-gates.py", root, cache / "run-gates", log)}
+    for step, script in scripts.items():
+        spawned[step] = spawn(script, root, cache / "spawned")
+    return spawned
+
+
+def summarise(runs: list[list[dict]], spawned: list[dict[str, float]]) -> list[str]:
+    """One table row per gate: cold ms, warm median ms, warm median per phase,
+    and the same cold/warm pair for the gate spawned as its own process."""
+    cold = {r["gate"]: r for r in runs[0]}
+    warm: dict[str, list[dict]] = {}
+    for run in runs[1:]:
+        for r in run:
+            warm.setdefault(r["gate"], []).append(r)
+
+    def spawned_ms(gate: str) -> str:
+        if gate not in spawned[0]:
+            return f"{'-':>9}{'-':>9}"
+        w = [s[gate] for s in spawned[1:]]
+        return f"{spawned[0][gate]:>9.1f}" + (f"{statistics.median(w):>9.1f}" if w else f"{'-':>9}")
+
+    def med(records: list[dict], key: str | None = None) -> str:
+        if not records:
+            return "-"
+        values = [r["ms"] if key is None else r["phases"].get(key, 0.0) for r in records]
+        return f"{statistics.median(values):.1f}"
+
+    rows = [
+        f"{'gate':<28}{'cold':>9}{'warm':>9}{'read':>9}{'parse':>9}{'check':>9}"
+        f"{'spawn':>9}{'spawn-w':>9}  exit"
+    ]
+    for gate in sorted(cold, key=lambda g: (g == "run-gates", g)):
+        w = warm.get(gate, [])
+        rows.append(
+            f"{gate:<28}{cold[gate]['ms']:>9.1f}{med(w):>9}"
+            f"{med(w, 'read'):>9}{med(w, 'parse'):>9}{med(w, 'check'):>9}"
+            f"{spawned_ms(gate)}  {cold[gate]['exit']}"
+        )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="bench-gates.py", description=__doc__.split("\n")[0])
+    parser.add_argument("--scale", type=int, default=10, help="tree size multiplier")
+    parser.add_argument("--runs", type=int, default=5, help="runs, the first one cold")
+    parser.add_argument("--keep", type=Path, metavar="DIR", help="build the tree here and keep it")
+    parser.add_argument(
+        "--source", type=Path, default=Path.home(), metavar="DIR", help="copy configs from here"
+    )
+    args = parser.parse_args()
+    if args.scale < 1 or args.runs < 1:
+        parser.error("--scale and --runs must be positive")
+    if not (args.source / "hk.pkl").is_file():
+        parser.error(f"no hk.pkl under {args.source} (see --source)")
+
+    with tempfile.TemporaryDirectory(prefix="hk-bench-") as tmp:
+        root = args.keep or Path(tmp) / "home"
+        root.mkdir(parents=True, exist_ok=True)
+        build_tree(root, args.scale, args.source)
+        cache, log = Path(tmp) / "cache", Path(tmp) / "timing.jsonl"
+        scripts = gate_scripts(root)
+
+        runs: list[list[dict]] = []
+        spawned: list[dict[str, float]] = []
+        for _ in range(args.runs):
+            log.unlink(missing_ok=True)
+            spawned.append(run_once(root, cache, log, scripts))
+            try:
+                runs.append([json.loads(line) for line in log.read_text().splitlines()])
+            except (OSError, ValueError) as e:
+                print(f"bench-gates: no timing log from run-gates ({e})", file=sys.stderr)
+                return 1
+
+    files = sum(1 for p in root.rglob("*") if p.is_file()) if args.keep else None
+    print(f"scale {args.scale}, {args.runs} run(s)" + (f", {files} files" if files else ""))
+    for row in summarise(runs, spawned):
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,9 @@ from __future__ import annotations
 import re
 import subprocess
 import sys
+from typing import TextIO
+
+import _hktime
 
 PATH_DENY = [
     re.compile(r"(^|/)\.zshrc\.local$"),
@@ -35,32 +38,86 @@ ALLOW_PATTERN_PATHS = {
     ".zshrc.local.example",
 }
 
-TOKEN_RE = re.compile(r"sk-ant-[A-Za-z0-9_-]+")
-AUTH_ENV_RE = re.compile(
-    r"\b(?:ANTHROPIC_API_KEY|ANTHROPIC_AUTH_TOKEN|CLAUDE_CODE_OAUTH_TOKEN|"
-    r"CLAUDE_CODE_USE_(?:BEDROCK|VERTEX|FOUNDRY))\b"
-)
-AUTH_ASSIGN_RE = re.compile(
-    r"\b(?:export\s+)?(?:ANTHROPIC_API_KEY|ANTHROPIC_AUTH_TOKEN|"
-    r"CLAUDE_CODE_OAUTH_TOKEN|CLAUDE_CODE_USE_(?:BEDROCK|VERTEX|FOUNDRY))\s*="
-)
-CONCRETE_PROFILE_PATH_RE = re.compile(
-    r"\.claude-profiles/(?:desktop|code)/(?![$<{])([A-Za-z0-9][A-Za-z0-9._-]*)"
-)
-PROFILE_ALIAS_RE = re.compile(
-    r"\bclaude-(?:desktop|code)-profile\s+(?![$<{])([A-Za-z0-9][A-Za-z0-9._-]*)"
+# Line checks, scanned in one pass: each alternative sits in a lookahead, so
+# finditer tries every one at every position and overlapping hits (a token
+# passed as a profile name) are all reported, exactly as separate searches
+# would. Order matters only at a shared start: `assign` before `auth_env`.
+LINE_CHECKS = {
+    "token": r"sk-ant-[A-Za-z0-9_-]+",
+    "assign": (
+        r"\b(?:export\s+)?(?:ANTHROPIC_API_KEY|ANTHROPIC_AUTH_TOKEN|"
+        r"CLAUDE_CODE_OAUTH_TOKEN|CLAUDE_CODE_USE_(?:BEDROCK|VERTEX|FOUNDRY))\s*="
+    ),
+    "auth_env": (
+        r"\b(?:ANTHROPIC_API_KEY|ANTHROPIC_AUTH_TOKEN|CLAUDE_CODE_OAUTH_TOKEN|"
+        r"CLAUDE_CODE_USE_(?:BEDROCK|VERTEX|FOUNDRY))\b"
+    ),
+    "profile_path": r"\.claude-profiles/(?:desktop|code)/(?![$<{])[A-Za-z0-9][A-Za-z0-9._-]*",
+    "profile_alias": r"\bclaude-(?:desktop|code)-profile\s+(?![$<{])[A-Za-z0-9][A-Za-z0-9._-]*",
+}
+SCAN_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{name}>{rx})" for name, rx in LINE_CHECKS.items()) + ")"
 )
+GENERIC_CHECKS = frozenset({"token", "assign", "auth_env"})
+
+
+def scan_line(line: str) -> set[str]:
+    """Names of the LINE_CHECKS that match anywhere in `line`."""
+    return {m.lastgroup for m in SCAN_RE.finditer(line) if m.lastgroup}
 
 
 def git_bytes(*args: str) -> bytes:
     return subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL)
 
 
+# --no-renames: a renamed file is scanned whole, as a new file, so moving a
+# leak to another path does not slip it past the guard.
+_DIFF_FILTER = ("--no-renames", "--diff-filter=ACMR")
+
+
 def staged_paths() -> list[str]:
-    raw = git_bytes("diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR")
+    raw = git_bytes("diff", "--cached", "--name-only", "-z", *_DIFF_FILTER)
     return [p.decode("utf-8", "surrogateescape") for p in raw.split(b"\0") if p]
 
 
+def split_patch(raw: bytes) -> list[list[tuple[int, str]]]:
+    """Added lines of each file section of a multi-file patch, in patch order.
+
+    Line numbers count from the section's `diff --git` header, so a failure
+    names the same diff-line as `git diff --cached -- <path>` would show.
+    """
+    sections: list[list[tuple[int, str]]] = []
+    idx = 0
+    for raw_line in raw.decode("utf-8", "replace").splitlines():
+        if raw_line.startswith("diff --git "):
+            sections.append([])
+            idx = 0
+        idx += 1
+        # added content, not the +++ file header
+        if sections and raw_line.startswith("+") and not raw_line.startswith("+++"):
+            sections[-1].append((idx, raw_line[1:]))
+    return sections
+
+
+def added_lines_by_path(paths: list[str]) -> dict[str, list[tuple[int, str]]]:
+    """Every staged path's added lines, from a single `git diff --cached`.
+
+    The patch and `staged_paths` walk the same diff queue with the same
+    filter, so section N belongs to path N - which sidesteps parsing the
+    (possibly quoted) names out of the headers.
+    """
+    try:
+        raw = git_bytes(
+            "diff", "--cached", "--unified=0", "--no-ext-diff", "--no-color", *_DIFF_FILTER
+        )
+    except subprocess.CalledProcessError:
+        return {}
+    sections = split_patch(raw)
+    if len(sections) != len(paths):  # should not happen; never mis-attribute a line
+        return {path: added_lines(path) for path in paths}
+    return dict(zip(paths, sections, strict=True))
+
+
 def added_lines(path: str) -> list[tuple[int, str]]:
     try:
         raw = git_bytes(
@@ -68,21 +125,17 @@ def added_lines(path: str) -> list[tuple[int, str]]:
         )
     except subprocess.CalledProcessError:
         return []
-
-    lines: list[tuple[int, str]] = []
-    for idx, raw_line in enumerate(raw.decode("utf-8", "replace").splitlines(), start=1):
-        if raw_line.startswith("+") and not raw_line.startswith(
-            "+++"
-        ):  # added content, not diff header
-            lines.append((idx, raw_line[1:]))
-    return lines
+    sections = split_patch(raw)
+    return sections[0] if sections else []
 
 
-def main() -> int:
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     failures: list[str] = []
 
     try:
-        paths = staged_paths()
+        with _hktime.phase("read"):
+            paths = staged_paths()
     except (subprocess.CalledProcessError, FileNotFoundError):
         # If git is unavailable, let hk/gitleaks report the environment problem.
         return 0
@@ -93,31 +146,35 @@ def main() -> int:
                 failures.append(f"staged local-only path: {path}")
                 break
 
-    for path in paths:
-        allow_generic_patterns = path in ALLOW_PATTERN_PATHS or path.startswith(
-            VENDORED_SKILL_PREFIXES
-        )
-        allow_profile_patterns = path in ALLOW_PATTERN_PATHS
-        for diff_line, line in added_lines(path):
-            where = f"{path}:diff-line-{diff_line}"
-            if TOKEN_RE.search(line) and not allow_generic_patterns:
-                failures.append(f"{where}: staged Anthropic token pattern (sk-ant-...)")
-            if AUTH_ASSIGN_RE.search(line) and not allow_generic_patterns:
-                failures.append(f"{where}: staged Claude auth env assignment")
-            elif AUTH_ENV_RE.search(line) and not allow_generic_patterns:
-                failures.append(f"{where}: staged Claude auth env name")
-            if CONCRETE_PROFILE_PATH_RE.search(line) and not allow_profile_patterns:
-                failures.append(f"{where}: staged concrete .claude-profiles path")
-            if PROFILE_ALIAS_RE.search(line) and not allow_profile_patterns:
-                failures.append(f"{where}: staged concrete Claude profile alias/call")
+    messages = {
+        "token": "staged Anthropic token pattern (sk-ant-...)",
+        "assign": "staged Claude auth env assignment",
+        "auth_env": "staged Claude auth env name",
+        "profile_path": "staged concrete .claude-profiles path",
+        "profile_alias": "staged concrete Claude profile alias/call",
+    }
+    with _hktime.phase("read"):
+        added = added_lines_by_path(paths)
+    with _hktime.phase("check"):
+        for path, lines in added.items():
+            if path in ALLOW_PATTERN_PATHS:
+                continue
+            skip = GENERIC_CHECKS if path.startswith(VENDORED_SKILL_PREFIXES) else frozenset()
+            for diff_line, line in lines:
+                hits = scan_line(line) - skip
+                if "assign" in hits:  # an assignment is also a mention; report it once
+                    hits.discard("auth_env")
+                for name in LINE_CHECKS:
+                    if name in hits:
+                        failures.append(f"{path}:diff-line-{diff_line}: {messages[name]}")
 
     if failures:
-        print("Claude profile leak guard blocked staged content:", file=sys.stderr)
+        print("Claude profile leak guard blocked staged content:", file=err)
         for failure in failures:
-            print(f"  - {failure}", file=sys.stderr)
+            print(f"  - {failure}", file=err)
         print(
             "Keep real Claude profile names/aliases in ~/.zshrc.local or other ignored local state.",
-            file=sys.stderr,
+            file=err,
         )
         return 1
 
@@ -125,4 +182,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(_hktime.run("claude-profile-leak-guard", main))
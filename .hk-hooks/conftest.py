@@ -0,0 +1,13 @@
+"""Keep the gate caches out of the work tree while the .hk-hooks tests run.
+
+Several gates cache to ~/.cache/hk-hooks (_hkcache), and $HOME is the
+dotfiles work tree; every test - and every gate a live test spawns - writes
+to a per-test HK_HOOKS_CACHE_DIR instead.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _hk_cache_dir(tmp_path_factory, monkeypatch) -> None:
+    monkeypatch.setenv("HK_HOOKS_CACHE_DIR", str(tmp_path_factory.mktemp("hk-cache")))
@@ -18,6 +18,13 @@ each backslash-continued invocation into one logical command, and flags a pair
 whose two members both appear in that invocation's key set. `enter` alone (no
 `ctrl-m`) is legitimate and never flags - the check requires *both* members.
 
+Given paths (hk passes the staged files), only those under ROOTS are checked;
+with none - or when the checker itself is among them - the whole set of roots
+is. Either way a file is parsed only if it mentions `fzf` and its content hash
+has no cached result (~/.cache/hk-hooks/fzf-bind-lint.json, see _hkcache.py),
+so a full-tree run over unchanged files is a read and a hash per file. The
+cache holds one result per file that still exists, keyed by its content hash.
+
 Exit codes: 0 = clean, 1 = at least one alias collision.
 
 Tests:
@@ -29,8 +36,14 @@ from __future__ import annotations
 
 import re
 import sys
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import astuple, dataclass
 from pathlib import Path
+from typing import TextIO
+
+import _hkcache
+import _hkio
+import _hktime
 
 # Roots scanned for fzf invocations (cwd-relative first, then $HOME - hk checks
 # run from $HOME). Every fzf call in the repo lives under one of these.
@@ -206,27 +219,87 @@ def _display(path: Path) -> str:
         return str(path)
 
 
-def main() -> int:
-    findings: list[tuple[Path, Collision]] = []
+def _tree() -> Iterator[Path]:
+    """Every file under the scanned roots."""
     for rel in ROOTS:
-        root = _resolve(rel)
-        if not root.exists():
+        yield from _hkio.files_under(_resolve(rel))
+
+
+def _staged(files: list[str]) -> list[Path]:
+    """The given paths that fall under a scanned root."""
+    return [
+        Path(f)
+        for f in sorted(set(files))
+        if any(f == root or f.startswith(root + "/") for root in ROOTS) and Path(f).is_file()
+    ]
+
+
+def lint_bytes(data: bytes, cached: dict[str, list]) -> tuple[str, list[Collision]]:
+    """Collisions in one file's content, from `cached` when its hash is known."""
+    key = _hkcache.digest(data)
+    if key in cached:
+        return key, [Collision(*c) for c in cached[key]]
+    try:
+        text = data.decode()
+    except UnicodeDecodeError:
+        return key, []
+    with _hktime.phase("parse"):
+        invocations = parse_invocations(text)
+    with _hktime.phase("check"):
+        return key, find_conflicts(invocations)
+
+
+def main(argv: list[str] | None = None, err: TextIO | None = None) -> int:
+    err = err or sys.stderr
+    files = sys.argv[1:] if argv is None else argv
+    full = not files or any(Path(f).name == "fzf-bind-lint.py" for f in files)
+    version = _hkcache.source_version(__file__)
+    with _hktime.phase("read"):
+        document = _hkcache.load("fzf-bind-lint", version)
+    cached: dict[str, list] = document.get("results", {})
+    # path -> hash of its last-linted content; a full run rebuilds it.
+    paths: dict[str, str] = {} if full else document.get("paths", {})
+
+    seen: dict[str, list] = {}
+    findings: list[tuple[Path, Collision]] = []
+    for path in _tree() if full else _staged(files):
+        try:
+            with _hktime.phase("read"):
+                data = _hkio.read_bytes(path)
+        except OSError:
             continue
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
+        if b"fzf" not in data:
+            continue
+        key, collisions = lint_bytes(data, cached)
+        seen[key] = [astuple(c) for c in collisions]
+        paths[str(path.absolute())] = key
+        findings += [(path, c) for c in collisions]
+
+    # Keep only the hashes of files that still exist, as last linted: deleted,
+    # renamed and since-edited files drop out on the next run, staged or full.
+    kept: dict[str, str] = {}
+    results: dict[str, list] = {}
+    for name, key in paths.items():
+        if not Path(name).exists():
+            continue
+        hit = seen.get(key, cached.get(key))
+        if hit is None:
+            # A path whose hash has no result (a torn or hand-edited cache):
+            # lint it again rather than trust the path map.
             try:
-                text = path.read_text()
-            except (OSError, UnicodeDecodeError):
-                continue
-            if "fzf" not in text:
+                with _hktime.phase("read"):
+                    data = _hkio.read_bytes(Path(name))
+            except OSError:
                 continue
-            for collision in find_conflicts(parse_invocations(text)):
-                findings.append((path, collision))
+            key, collisions = lint_bytes(data, cached)
+            hit = [astuple(c) for c in collisions]
+        kept[name] = key
+        results[key] = hit
+    _hkcache.save("fzf-bind-lint", version, {"results": results, "paths": kept})
     for path, collision in findings:
-        print(render(_display(path), collision), file=sys.stderr)
+        print(render(_display(path), collision), file=err)
     return 1 if findings else 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("fzf-bind-lint", main))
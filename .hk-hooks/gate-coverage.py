@@ -27,6 +27,13 @@ Three assertions, in value order:
       for its whole life. Roots deliberately outside the first-party gates are
       listed in UNGATED with a reason.
 
+Discovery is cached (~/.cache/hk-hooks, see _hkcache.py) against the
+dotfiles index checksum: while the index is unchanged, (c) reuses the
+discovered roots. A changed index re-lists only the manifests (`git
+ls-files` with a pathspec), never the whole $HOME work-tree. The (b)
+literals are stat'ed on every run - a path can vanish without the index
+changing.
+
 Exit codes: 0 = every assertion holds, 1 = drift (printed to stderr).
 
 Tests: uv run --with pytest pytest ~/.hk-hooks/test_gate_coverage.py -v
@@ -34,12 +41,17 @@ Tests: uv run --with pytest pytest ~/.hk-hooks/test_gate_coverage.py -v
 
 from __future__ import annotations
 
+import os
 import re
-import subprocess
 import sys
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
+
+import _hkcache
+import _hkio
+import _hktime
 
 HK_PKL = "hk.pkl"
 MISE_CONFIG = ".config/mise/config.toml"
@@ -355,6 +367,10 @@ UNGATED: dict[str, str] = {
 }
 
 
+# `git ls-files` pathspecs selecting every manifest, at any depth.
+MANIFEST_PATHSPECS = tuple(f":(glob)**/{name}" for name in MANIFESTS)
+
+
 def discover_projects(tracked: Iterable[str]) -> dict[str, str]:
     """Map every non-vendored manifest to its project root and language."""
     projects: dict[str, str] = {}
@@ -430,79 +446,102 @@ def _resolve(rel: str) -> Path:
 
 def _read(rel: str) -> str | None:
     try:
-        return _resolve(rel).read_text()
-    except OSError:
+        with _hktime.phase("read"):
+            return _hkio.read_text(_resolve(rel))
+    except (OSError, UnicodeDecodeError):
         return None
 
 
-def tracked_files() -> list[str] | None:
-    """Tracked paths from the dotfiles work-tree, or None if git cannot answer."""
-    home = Path.home()
+CACHE = "gate-coverage"
+
+
+def index_key() -> str | None:
+    """Identity of the dotfiles index: the checksum git appends to it.
+
+    With index.skipHash the trailer is all zeroes, so fall back to the file's
+    mtime and size. None if the index cannot be read (no caching then).
+    """
+    index = _hkio.git_dir() / "index"
     try:
-        out = subprocess.run(
-            [
-                "git",
-                f"--git-dir={home / 'git' / 'dotfiles'}",
-                f"--work-tree={home}",
-                "ls-files",
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (OSError, subprocess.CalledProcessError):
+        with index.open("rb") as f:
+            st = os.fstat(f.fileno())
+            f.seek(-20, os.SEEK_END)
+            trailer = f.read(20)
+    except OSError:
         return None
-    return out.stdout.splitlines()
+    if trailer.strip(b"\0"):
+        return trailer.hex()
+    return f"{st.st_mtime_ns}:{st.st_size}"
 
 
-def main() -> int:
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     hk_text = _read(HK_PKL)
     if hk_text is None:
-        print(f"gate-coverage: cannot read {HK_PKL}", file=sys.stderr)
+        print(f"gate-coverage: cannot read {HK_PKL}", file=err)
         return 1
-    steps = parse_hk_steps(hk_text)
+    with _hktime.phase("parse"):
+        steps = parse_hk_steps(hk_text)
 
     sources = {pair.source: _read(pair.source) for pair in PAIRS}
-    errors = check_pairs(steps, {k: v for k, v in sources.items() if v is not None})
-
-    literals = hk_path_literals(steps)
-    for pair in PAIRS:
-        text = sources.get(pair.source)
-        if text is None:
-            continue
-        extractor = {
-            "shell_roots": shell_roots,
-            "python_roots": python_roots,
-            "case_arm_roots": case_arm_roots,
-        }[pair.extract]
-        literals += [(pair.source, 0, root) for root in extractor(text)]
-    bats = sources.get(".hk-hooks/bats-tests.sh")
-    if bats:
-        td = re.search(r"^TESTS_DIR=(\S+)", bats, re.MULTILINE)
-        if td:
-            literals.append((".hk-hooks/bats-tests.sh", 0, td.group(1).strip('"')))
     mise_text = _read(MISE_CONFIG)
-    if mise_text is not None:
-        literals += mise_path_literals(mise_text)
-    errors += check_paths_exist(literals)
-
-    tracked = tracked_files()
-    if tracked is None:
+    with _hktime.phase("check"):
+        errors = check_pairs(steps, {k: v for k, v in sources.items() if v is not None})
+
+    with _hktime.phase("parse"):
+        literals = hk_path_literals(steps)
+        for pair in PAIRS:
+            text = sources.get(pair.source)
+            if text is None:
+                continue
+            extractor = {
+                "shell_roots": shell_roots,
+                "python_roots": python_roots,
+                "case_arm_roots": case_arm_roots,
+            }[pair.extract]
+            literals += [(pair.source, 0, root) for root in extractor(text)]
+        bats = sources.get(".hk-hooks/bats-tests.sh")
+        if bats:
+            td = re.search(r"^TESTS_DIR=(\S+)", bats, re.MULTILINE)
+            if td:
+                literals.append((".hk-hooks/bats-tests.sh", 0, td.group(1).strip('"')))
+        if mise_text is not None:
+            literals += mise_path_literals(mise_text)
+
+    with _hktime.phase("read"):
+        key = index_key()
+        version = _hkcache.source_version(__file__)
+        cached = _hkcache.load(CACHE, version) if key else {}
+    if cached.get("index") != key:
+        cached = {}
+    with _hktime.phase("check"):
+        errors += check_paths_exist(literals)
+
+    projects = cached.get("projects")
+    if projects is None:
+        with _hktime.phase("read"):
+            tracked = _hkio.tracked_files(*MANIFEST_PATHSPECS)
+        with _hktime.phase("parse"):
+            projects = None if tracked is None else discover_projects(tracked)
+    if projects is None:
         print(
             "gate-coverage: warning: cannot list tracked files;"
             " skipping project discovery (run 'mise run gate-coverage')",
-            file=sys.stderr,
+            file=err,
         )
     else:
-        errors += check_projects(discover_projects(tracked), steps)
+        with _hktime.phase("check"):
+            errors += check_projects(projects, steps)
+        if key:
+            _hkcache.save(CACHE, version, {"index": key, "projects": projects})
 
     if errors:
-        print("gate-coverage: gate path lists have drifted:", file=sys.stderr)
+        print("gate-coverage: gate path lists have drifted:", file=err)
         for e in errors:
-            print(f"  - {e}", file=sys.stderr)
+            print(f"  - {e}", file=err)
         return 1
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("gate-coverage", main))
@@ -17,6 +17,9 @@ are security-relevant and must not silently drift apart. This checker asserts:
 Add new dangerous commands to CANONICAL_DANGEROUS; both tools must then cover
 them or this check fails.
 
+The normalised rule sets come from _hkconfig, which caches them by each
+config's mtime; secret-path-parity reads settings.json through it too.
+
 Exit codes: 0 = parity holds, 1 = a breach (printed to stderr).
 
 Tests: uv run --with pytest pytest ~/.hk-hooks/test_permission_parity.py -v
@@ -24,11 +27,13 @@ Tests: uv run --with pytest pytest ~/.hk-hooks/test_permission_parity.py -v
 
 from __future__ import annotations
 
-import json
-import re
 import sys
+from collections.abc import Set
 from fnmatch import fnmatch
-from pathlib import Path
+from typing import TextIO
+
+import _hkconfig
+import _hktime
 
 # Commands dangerous enough that BOTH tools must deny them. The reason is the
 # standing justification, kept beside the rule so future edits stay honest.
@@ -44,50 +49,8 @@ CANONICAL_DANGEROUS: list[tuple[str, str]] = [
     ("git push -f", "overwrites remote history (force shorthand)"),
 ]
 
-_CLAUDE_BASH_RE = re.compile(r"^Bash\((.*)\)$", re.DOTALL)
-
-
-def normalise_claude(entry: str) -> str | None:
-    """Reduce a Claude `Bash(cmd:*)` rule to its bare command.
-
-    Returns None for non-Bash entries (e.g. `Read(...)`, `WebFetch`).
-    """
-    m = _CLAUDE_BASH_RE.match(entry)
-    if not m:
-        return None
-    inner = m.group(1)
-    inner = inner.removesuffix(":*")
-    return inner
-
-
-def normalise_opencode(pattern: str) -> str:
-    """Reduce an OpenCode `cmd*` glob to its bare command."""
-    return pattern.removesuffix("*")
-
-
-def claude_deny_bases(settings: dict) -> set[str]:
-    deny = settings.get("permissions", {}).get("deny", [])
-    return {b for e in deny if (b := normalise_claude(e)) is not None}
-
 
-def claude_allow_bases(settings: dict) -> set[str]:
-    allow = settings.get("permissions", {}).get("allow", [])
-    return {b for e in allow if (b := normalise_claude(e)) is not None}
-
-
-def _opencode_bash(config: dict) -> dict:
-    return config.get("permission", {}).get("bash", {})
-
-
-def opencode_deny_bases(config: dict) -> set[str]:
-    return {normalise_opencode(k) for k, v in _opencode_bash(config).items() if v == "deny"}
-
-
-def opencode_deny_globs(config: dict) -> list[str]:
-    return [k for k, v in _opencode_bash(config).items() if v == "deny"]
-
-
-def check_canonical_denies(claude_bases: set[str], opencode_bases: set[str]) -> list[str]:
+def check_canonical_denies(claude_bases: Set[str], opencode_bases: Set[str]) -> list[str]:
     errors = []
     for cmd, reason in CANONICAL_DANGEROUS:
         if cmd not in claude_bases:
@@ -97,7 +60,7 @@ def check_canonical_denies(claude_bases: set[str], opencode_bases: set[str]) ->
     return errors
 
 
-def check_allow_not_denied(claude_allow: set[str], opencode_deny_glob_list: list[str]) -> list[str]:
+def check_allow_not_denied(claude_allow: Set[str], opencode_deny_glob_list: list[str]) -> list[str]:
     errors = []
     for base in sorted(claude_allow):
         for glob in opencode_deny_glob_list:
@@ -121,40 +84,36 @@ def check_gh_api_gate(settings: dict, hook_exists: bool) -> list[str]:
     return errors
 
 
-def _resolve(rel: str) -> Path:
-    """Prefer the cwd-relative path (pre-commit runs from $HOME), else $HOME."""
-    p = Path(rel)
-    return p if p.exists() else Path.home() / rel
-
-
-def main() -> int:
-    settings_path = _resolve(".claude/settings.json")
-    opencode_path = _resolve(".config/opencode/opencode.json")
-    hook_path = _resolve(".claude/hooks/guard-mutating-api.py")
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
+    hook_path = _hkconfig.resolve(".claude/hooks/guard-mutating-api.py")
 
     try:
-        settings = json.loads(settings_path.read_text())
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"permission-parity: cannot read {settings_path}: {e}", file=sys.stderr)
+        claude = _hkconfig.claude()
+    except (OSError, ValueError) as e:
+        path = _hkconfig.resolve(_hkconfig.CLAUDE_SETTINGS)
+        print(f"permission-parity: cannot read {path}: {e}", file=err)
         return 1
     try:
-        opencode = json.loads(opencode_path.read_text())
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"permission-parity: cannot read {opencode_path}: {e}", file=sys.stderr)
+        opencode = _hkconfig.opencode()
+    except (OSError, ValueError) as e:
+        path = _hkconfig.resolve(_hkconfig.OPENCODE_CONFIG)
+        print(f"permission-parity: cannot read {path}: {e}", file=err)
         return 1
 
     errors = []
-    errors += check_canonical_denies(claude_deny_bases(settings), opencode_deny_bases(opencode))
-    errors += check_allow_not_denied(claude_allow_bases(settings), opencode_deny_globs(opencode))
-    errors += check_gh_api_gate(settings, hook_path.exists())
+    with _hktime.phase("check"):
+        errors += check_canonical_denies(claude.deny_bases, opencode.deny_bases)
+        errors += check_allow_not_denied(claude.allow_bases, list(opencode.deny_globs))
+        errors += check_gh_api_gate(claude.wiring, hook_path.exists())
 
     if errors:
-        print("permission-parity: security parity breaches:", file=sys.stderr)
+        print("permission-parity: security parity breaches:", file=err)
         for e in errors:
-            print(f"  - {e}", file=sys.stderr)
+            print(f"  - {e}", file=err)
         return 1
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("permission-parity", main))
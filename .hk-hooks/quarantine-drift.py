@@ -24,6 +24,10 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
+from typing import TextIO
+
+import _hkio
+import _hktime
 
 EXPECTED_DAYS = 4
 
@@ -66,11 +70,13 @@ def check_configs() -> list[str]:
     for rel, key, pattern, unit in CHECKS:
         path = _resolve(rel)
         try:
-            text = path.read_text()
-        except OSError as e:
+            with _hktime.phase("read"):
+                text = _hkio.read_text(path)
+        except (OSError, UnicodeDecodeError) as e:
             errors.append(f"{rel}: cannot read ({e})")
             continue
-        m = re.search(pattern, text, re.MULTILINE)
+        with _hktime.phase("parse"):
+            m = re.search(pattern, text, re.MULTILINE)
         if not m:
             errors.append(f"{rel}: {key} not found (regex {pattern!r} matched nothing)")
             continue
@@ -84,7 +90,7 @@ def check_configs() -> list[str]:
     return errors
 
 
-def warn_doc_cites() -> None:
+def warn_doc_cites(err: TextIO) -> None:
     spellings = [
         str(EXPECTED_DAYS * UNIT_PER_DAY["minutes"]),
         str(EXPECTED_DAYS * UNIT_PER_DAY["seconds"]),
@@ -93,32 +99,35 @@ def warn_doc_cites() -> None:
     for rel in DOC_CITES:
         path = _resolve(rel)
         try:
-            text = path.read_text()
-        except OSError:
-            print(f"quarantine-drift: warning: doc {rel} unreadable", file=sys.stderr)
+            with _hktime.phase("read"):
+                text = _hkio.read_text(path)
+        except (OSError, UnicodeDecodeError):
+            print(f"quarantine-drift: warning: doc {rel} unreadable", file=err)
             continue
-        missing = [s for s in spellings if s not in text]
+        with _hktime.phase("check"):
+            missing = [s for s in spellings if s not in text]
         if missing:
             print(
                 f"quarantine-drift: warning: {rel} no longer cites {', '.join(missing)}"
                 " - doc likely stale (warn-only)",
-                file=sys.stderr,
+                file=err,
             )
 
 
-def main() -> int:
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     errors = check_configs()
-    warn_doc_cites()
+    warn_doc_cites(err)
     if errors:
         print(
             f"quarantine-drift: quarantine values disagree (expected {EXPECTED_DAYS} days):",
-            file=sys.stderr,
+            file=err,
         )
         for e in errors:
-            print(f"  - {e}", file=sys.stderr)
+            print(f"  - {e}", file=err)
         return 1
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("quarantine-drift", main))
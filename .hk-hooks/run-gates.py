@@ -0,0 +1,224 @@
+"""Run the Python hk gates in one interpreter, concurrently.
+
+Each gate under .hk-hooks/ is a standalone script with a `main()` and an exit
+code (0 clean, 1 blocked), and still runs that way on its own. Spawned one
+per hk step, though, every gate pays its own interpreter start and re-reads
+the inputs it shares with its siblings - .claude/settings.json, the tmux
+script tree, `git ls-files`. This runner imports them as modules instead,
+runs them on a thread pool over one shared memo (_hkio.py), and reports per
+gate, so a commit waits roughly as long as its slowest gate.
+
+hk.pkl stays the one place a gate is declared. Every step whose check is
+`python3 .hk-hooks/<gate>.py [{{files}}]` belongs to the runner, and a gate
+runs when one of the given files matches its step's glob (always, for a step
+without one). With no files, every gate runs. A step that takes `{{files}}`
+gets the matching files as its argv.
+
+Each gate reports to its own buffer, passed to `main(err=...)`; the runner
+prints them in step order once all are done, so concurrent gates never
+interleave, and a failing gate is named with its own exit code.
+
+Usage: python3 .hk-hooks/run-gates.py [--budget-ms N] [--timing-log PATH] [FILE...]
+
+Each gate is timed per phase (see _hktime.py): --budget-ms warns about any
+gate slower than N ms, and --timing-log appends a JSONL record per gate, plus
+one for the run as a whole (gate "run-gates"). Both default to
+HK_HOOKS_BUDGET_MS / HK_HOOKS_TIMING_LOG.
+
+Exit codes: 0 = every gate passed, 1 = at least one gate failed (its output is
+printed under a `run-gates: <step> failed` line).
+
+Tests (manual): uv run --with pytest pytest ~/.hk-hooks/test_run_gates.py -v
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import os
+import re
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+import _hktime
+
+HERE = Path(__file__).resolve().parent
+HK_PKL = "hk.pkl"
+
+_GATE_CHECK_RE = re.compile(r"^python3 (\.hk-hooks/[\w.-]+\.py)( \{\{files\}\})?$")
+
+
+@dataclass(frozen=True, slots=True)
+class Gate:
+    """One hk step the runner owns: its glob, its script, and whether it takes files."""
+
+    step: str
+    globs: tuple[str, ...]
+    source: str
+    takes_files: bool
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    step: str
+    code: int
+    output: str
+    timing: _hktime.Timing
+
+
+# --- pure core -------------------------------------------------------------
+
+
+def glob_regex(pattern: str) -> re.Pattern[str]:
+    """hk glob -> regex: `**/` spans directories, `*` and `?` stay within one."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+def gates_from_steps(steps: dict) -> list[Gate]:
+    """The steps whose check is a plain `python3 .hk-hooks/<gate>.py`, by name."""
+    gates = []
+    for name in sorted(steps):
+        step = steps[name]
+        m = _GATE_CHECK_RE.match(step.check)
+        if m and m.group(1) != f".hk-hooks/{Path(__file__).name}":
+            gates.append(Gate(name, tuple(step.globs), m.group(1), bool(m.group(2))))
+    return gates
+
+
+def select(gates: list[Gate], files: list[str]) -> list[tuple[Gate, list[str]]]:
+    """Each gate a commit of `files` triggers, with the files its glob matched."""
+    if not files:
+        return [(gate, []) for gate in gates]
+    chosen = []
+    for gate in gates:
+        if not gate.globs:
+            chosen.append((gate, files))
+            continue
+        patterns = [glob_regex(g) for g in gate.globs]
+        matched = [f for f in files if any(p.match(f) for p in patterns)]
+        if matched:
+            chosen.append((gate, matched))
+    return chosen
+
+
+# --- imperative shell ------------------------------------------------------
+
+
+def load_gate(source: str) -> ModuleType:
+    """Import a gate script by path (the file names carry hyphens)."""
+    path = HERE / Path(source).name
+    name = "hk_gate_" + path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # slots=True dataclasses resolve their module by name
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_gate(gate: Gate, files: list[str]) -> Result:
+    """Run one gate with its report going to a buffer of its own."""
+    main = load_gate(gate.source).main
+    err = io.StringIO()
+
+    def guarded() -> int:
+        try:
+            return (main(files, err=err) if gate.takes_files else main(err=err)) or 0
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=err)
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            traceback.print_exc(file=err)
+            return 1
+
+    code, timing = _hktime.timed(gate.step, guarded)
+    return Result(gate.step, code or 0, err.getvalue(), timing)
+
+
+def run(selected: list[tuple[Gate, list[str]]]) -> list[Result]:
+    """Run the gates concurrently; results come back in `selected` order."""
+    with ThreadPoolExecutor(max_workers=max(1, len(selected))) as pool:
+        return list(pool.map(lambda chosen: run_gate(*chosen), selected))
+
+
+def _resolve(rel: str) -> Path:
+    """Prefer the cwd-relative path (pre-commit runs from $HOME), else $HOME."""
+    p = Path(rel)
+    return p if p.exists() else Path.home() / rel
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="run-gates.py", description=__doc__.split("\n")[0])
+    parser.add_argument("files", nargs="*", metavar="FILE")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=_hktime.budget_from_env(),
+        metavar="N",
+        help="warn about any gate that takes longer than N ms",
+    )
+    parser.add_argument(
+        "--timing-log",
+        default=os.environ.get("HK_HOOKS_TIMING_LOG"),
+        metavar="PATH",
+        help="append per-gate, per-phase timings to PATH as JSONL",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results: list[Result] = []
+
+    def run_all() -> int:
+        try:
+            with _hktime.phase("read"):
+                hk_text = _resolve(HK_PKL).read_text()
+        except OSError as e:
+            print(f"run-gates: cannot read {HK_PKL} ({e})", file=sys.stderr)
+            return 1
+        with _hktime.phase("parse"):
+            steps = load_gate(".hk-hooks/gate-coverage.py").parse_hk_steps(hk_text)
+            selected = select(gates_from_steps(steps), args.files)
+        with _hktime.phase("check"):
+            results.extend(run(selected))
+        return 1 if any(r.code for r in results) else 0
+
+    code, overall = _hktime.timed("run-gates", run_all)
+    for result in results:
+        if result.code:
+            print(f"run-gates: {result.step} failed (exit {result.code})", file=sys.stderr)
+        sys.stderr.write(result.output)
+        warning = _hktime.over_budget(result.timing, args.budget_ms)
+        if warning:
+            print(warning, file=sys.stderr)
+    _hktime.write_log(args.timing_log, [r.timing for r in results] + [overall])
+    return code or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,9 @@ it. It asserts:
      .codex/hooks.json PreToolUse, and the pi agent-guard extension files
      present.
 
+The srt, settings.json and .codex/hooks.json rules come from _hkconfig, which
+caches them by each file's mtime and shares them with permission-parity.
+
 Exit codes: 0 = parity holds, 1 = a breach (printed to stderr).
 
 Tests: uv run --with pytest pytest ~/.hk-hooks/test_secret_path_parity.py -v
@@ -27,10 +30,14 @@ Tests: uv run --with pytest pytest ~/.hk-hooks/test_secret_path_parity.py -v
 from __future__ import annotations
 
 import importlib.util
-import json
 import re
 import sys
 from pathlib import Path
+from typing import TextIO
+
+import _hkconfig
+import _hkio
+import _hktime
 
 # srt paths that are single files: the contents glob (path/**) is meaningless
 # for them, so only the bare deny rule is required. Everything else is treated
@@ -114,63 +121,64 @@ def _resolve(rel: str) -> Path:
     return p if p.exists() else Path.home() / rel
 
 
-def main() -> int:
-    srt_path = _resolve(".config/srt/base.json")
-    settings_path = _resolve(".claude/settings.json")
-    codex_hooks_path = _resolve(".codex/hooks.json")
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     secretpaths_path = _resolve(".claude/hooks/_secretpaths.py")
     pi_guard_path = _resolve(".pi/agent/extensions/agent-guard/guard.ts")
 
     try:
-        srt = json.loads(srt_path.read_text())
-        settings = json.loads(settings_path.read_text())
-        codex_hooks = json.loads(codex_hooks_path.read_text())
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"secret-path-parity: cannot read config: {e}", file=sys.stderr)
+        srt = _hkconfig.srt()
+        claude = _hkconfig.claude()
+        codex_wiring = _hkconfig.codex_wiring()
+    except (OSError, ValueError) as e:
+        print(f"secret-path-parity: cannot read config: {e}", file=err)
         return 1
 
-    deny_read = srt["filesystem"]["denyRead"]
-    deny_write = srt["filesystem"]["denyWrite"]
-    srt_relative = {p.removeprefix("~/") for p in deny_read}
+    srt_relative = {p.removeprefix("~/") for p in srt.deny_read}
 
     errors = []
-    errors += check_claude_deny(settings, deny_read, deny_write)
-
-    if secretpaths_path.exists():
-        errors += check_covers(
-            "_secretpaths.py SECRET_PATHS", python_secret_paths(secretpaths_path), srt_relative
+    with _hktime.phase("check"):
+        errors += check_claude_deny(claude.wiring, list(srt.deny_read), list(srt.deny_write))
+
+        if secretpaths_path.exists():
+            errors += check_covers(
+                "_secretpaths.py SECRET_PATHS", python_secret_paths(secretpaths_path), srt_relative
+            )
+        else:
+            errors.append(f"_secretpaths.py is missing ({secretpaths_path})")
+
+        if pi_guard_path.exists():
+            errors += check_covers(
+                "pi guard.ts SECRET_PATHS",
+                ts_secret_paths(_hkio.read_text(pi_guard_path)),
+                srt_relative,
+            )
+        else:
+            errors.append(f"pi guard.ts is missing ({pi_guard_path})")
+
+        errors += check_wiring(
+            claude.wiring,
+            codex_wiring,
+            {
+                "Claude hook guard-secret-paths.py": _resolve(
+                    ".claude/hooks/guard-secret-paths.py"
+                ),
+                "Codex hook guard-secret-paths-codex.py": _resolve(
+                    ".claude/hooks/guard-secret-paths-codex.py"
+                ),
+                "pi agent-guard extension index.ts": _resolve(
+                    ".pi/agent/extensions/agent-guard/index.ts"
+                ),
+            },
         )
-    else:
-        errors.append(f"_secretpaths.py is missing ({secretpaths_path})")
-
-    if pi_guard_path.exists():
-        errors += check_covers(
-            "pi guard.ts SECRET_PATHS", ts_secret_paths(pi_guard_path.read_text()), srt_relative
-        )
-    else:
-        errors.append(f"pi guard.ts is missing ({pi_guard_path})")
-
-    errors += check_wiring(
-        settings,
-        codex_hooks,
-        {
-            "Claude hook guard-secret-paths.py": _resolve(".claude/hooks/guard-secret-paths.py"),
-            "Codex hook guard-secret-paths-codex.py": _resolve(
-                ".claude/hooks/guard-secret-paths-codex.py"
-            ),
-            "pi agent-guard extension index.ts": _resolve(
-                ".pi/agent/extensions/agent-guard/index.ts"
-            ),
-        },
-    )
 
     if errors:
-        print("secret-path-parity: drift from srt denyRead/denyWrite:", file=sys.stderr)
+        print("secret-path-parity: drift from srt denyRead/denyWrite:", file=err)
         for e in errors:
-            print(f"  - {e}", file=sys.stderr)
+            print(f"  - {e}", file=err)
         return 1
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("secret-path-parity", main))
@@ -141,3 +141,74 @@ def test_render_names_file_line_and_both_keys() -> None:
     msg = _mod.render("src/skl/bin/pick", c)
     assert msg.startswith("fzf-bind-lint: src/skl/bin/pick:36 ")
     assert "ctrl-i" in msg and "tab" in msg
+
+
+# --- content-hash cache ----------------------------------------------------
+
+
+class TestLintBytes:
+    BAD = b"fzf --bind 'enter:accept' --expect 'ctrl-m'\n"
+
+    def test_uncached_content_is_parsed(self) -> None:
+        key, found = _mod.lint_bytes(self.BAD, {})
+        assert [(c.key, c.alias) for c in found] == [("ctrl-m", "enter")]
+        assert key == _mod._hkcache.digest(self.BAD)
+
+    def test_a_cached_hash_skips_the_parse(self) -> None:
+        key = _mod._hkcache.digest(self.BAD)
+        _, found = _mod.lint_bytes(self.BAD, {key: [[7, "ctrl-i", "tab"]]})
+        assert found == [_mod.Collision(line=7, key="ctrl-i", alias="tab")]
+
+    def test_undecodable_content_has_no_findings(self) -> None:
+        assert _mod.lint_bytes(b"fzf \xff\xfe", {})[1] == []
+
+
+def test_main_staged_mode_ignores_paths_outside_roots(tmp_path, monkeypatch, capsys) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HK_HOOKS_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "elsewhere").mkdir()
+    (tmp_path / "elsewhere" / "x.sh").write_bytes(TestLintBytes.BAD)
+    assert _mod.main(["elsewhere/x.sh"]) == 0
+
+    (tmp_path / "src/skl/bin").mkdir(parents=True)
+    (tmp_path / "src/skl/bin/pick").write_bytes(TestLintBytes.BAD)
+    assert _mod.main(["src/skl/bin/pick"]) == 1
+    assert "src/skl/bin/pick:1" in capsys.readouterr().err
+
+
+def test_staged_runs_drop_cache_entries_of_deleted_files(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HK_HOOKS_CACHE_DIR", str(tmp_path / "cache"))
+    bin_dir = tmp_path / "src/skl/bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "pick").write_bytes(TestLintBytes.BAD)
+    (bin_dir / "other").write_bytes(b"fzf --expect ctrl-o\n")
+    _mod.main(["src/skl/bin/pick", "src/skl/bin/other"])
+
+    (bin_dir / "pick").unlink()
+    _mod.main(["src/skl/bin/other"])
+
+    version = _mod._hkcache.source_version(_mod.__file__)
+    document = _mod._hkcache.load("fzf-bind-lint", version)
+    assert list(document["paths"]) == [str(bin_dir / "other")]
+    assert list(document["results"]) == [_mod._hkcache.digest(b"fzf --expect ctrl-o\n")]
+
+
+def test_staged_runs_relint_a_path_whose_result_is_missing(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HK_HOOKS_CACHE_DIR", str(tmp_path / "cache"))
+    bin_dir = tmp_path / "src/skl/bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "pick").write_bytes(TestLintBytes.BAD)
+    (bin_dir / "other").write_bytes(b"fzf --expect ctrl-o\n")
+    _mod.main(["src/skl/bin/pick", "src/skl/bin/other"])
+    # A torn document: the path map names a hash with no result.
+    version = _mod._hkcache.source_version(_mod.__file__)
+    document = _mod._hkcache.load("fzf-bind-lint", version)
+    del document["results"][_mod._hkcache.digest(TestLintBytes.BAD)]
+    _mod._hkcache.save("fzf-bind-lint", version, document)
+
+    assert _mod.main(["src/skl/bin/other"]) == 0
+
+    document = _mod._hkcache.load("fzf-bind-lint", version)
+    assert document["results"][_mod._hkcache.digest(TestLintBytes.BAD)] == [[1, "ctrl-m", "enter"]]
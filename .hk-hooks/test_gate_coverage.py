@@ -5,6 +5,7 @@
 """Tests for the gate-coverage pre-commit guard."""
 
 import importlib.util
+import io
 import subprocess
 import sys
 from pathlib import Path
@@ -203,6 +204,30 @@ class TestPathLiterals:
         ]
 
 
+class TestCachedRun:
+    def test_a_vanished_literal_fails_while_the_index_is_unchanged(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        (tmp_path / "hk.pkl").write_text(
+            'x {\n    ["lint"] {\n        glob = List("src/lint/**")\n'
+            '        check = "lint"\n    }\n}\n'
+        )
+        (tmp_path / "src/lint").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(_mod, "index_key", lambda: "unchanged")
+        monkeypatch.setattr(_mod._hkio, "tracked_files", lambda *_: [])
+
+        def report() -> str:
+            err = io.StringIO()
+            _mod.main(err)
+            return err.getvalue()
+
+        assert "src/lint" not in report()
+        (tmp_path / "src/lint").rmdir()
+        assert "keys on 'src/lint', which does not exist" in report()
+
+
 class TestDiscoverProjects:
     def test_manifest_resolves_to_its_root_and_language(self) -> None:
         assert _mod.discover_projects(
@@ -223,6 +248,23 @@ class TestDiscoverProjects:
         )
 
 
+class TestManifestPathspecs:
+    def test_select_manifests_at_any_depth_and_nothing_else(self, tmp_path: Path) -> None:
+        for rel in ["package.json", "src/a/pyproject.toml", "src/a/main.py", "b/c/tsconfig.json"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+        out = subprocess.run(
+            ["git", "ls-files", "--", *_mod.MANIFEST_PATHSPECS],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        assert sorted(out) == ["b/c/tsconfig.json", "package.json", "src/a/pyproject.toml"]
+
+
 class TestCheckProjects:
     STEPS = _mod.parse_hk_steps(
         'x {\n    ["ts-tests-scoped"] {\n        glob = List("src/pin-audit/**")\n'
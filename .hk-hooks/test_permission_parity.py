@@ -5,6 +5,7 @@
 """Tests for the permission-parity pre-commit guard."""
 
 import importlib.util
+import json
 from pathlib import Path
 
 import pytest
@@ -34,11 +35,11 @@ class TestNormaliseClaude:
         ],
     )
     def test_strips_wrapper_and_arg_suffix(self, entry: str, expected: str) -> None:
-        assert _mod.normalise_claude(entry) == expected
+        assert _mod._hkconfig.normalise_claude(entry) == expected
 
     @pytest.mark.parametrize("entry", ["WebFetch", "Read(//tmp/**)", "Edit(/tmp/**)"])
     def test_non_bash_returns_none(self, entry: str) -> None:
-        assert _mod.normalise_claude(entry) is None
+        assert _mod._hkconfig.normalise_claude(entry) is None
 
 
 class TestNormaliseOpencode:
@@ -52,7 +53,7 @@ class TestNormaliseOpencode:
         ],
     )
     def test_strips_trailing_glob(self, pattern: str, expected: str) -> None:
-        assert _mod.normalise_opencode(pattern) == expected
+        assert _mod._hkconfig.normalise_opencode(pattern) == expected
 
 
 # --- extraction ---
@@ -72,11 +73,11 @@ def _opencode(bash: dict) -> dict:
 class TestExtraction:
     def test_claude_deny_bases(self) -> None:
         settings = _claude(deny=["Bash(eval:*)", "Bash(rm -rf /)", "WebFetch"])
-        assert _mod.claude_deny_bases(settings) == {"eval", "rm -rf /"}
+        assert _mod._hkconfig.claude_deny_bases(settings) == {"eval", "rm -rf /"}
 
     def test_opencode_deny_bases_only_deny_values(self) -> None:
         config = _opencode({"eval*": "deny", "aws lambda invoke*": "ask", "ls*": "allow"})
-        assert _mod.opencode_deny_bases(config) == {"eval"}
+        assert _mod._hkconfig.opencode_deny_bases(config) == {"eval"}
 
 
 # --- canonical deny coverage ---
@@ -168,3 +169,54 @@ class TestGhApiGate:
         }
         errors = _mod.check_gh_api_gate(settings, hook_exists=True)
         assert any("not wired" in e for e in errors)
+
+
+# --- parsed-config cache ---
+
+
+class TestConfigCache:
+    @pytest.fixture
+    def home(self, tmp_path, monkeypatch) -> Path:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("HK_HOOKS_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(_mod._hkconfig, "_memo", {})
+        (tmp_path / ".claude").mkdir()
+        return tmp_path
+
+    def _write(self, home: Path, deny: list[str], hooks: dict | None = None) -> None:
+        settings = json.dumps(_claude(deny=deny, allow=["Bash(ls:*)"], hooks=hooks))
+        (home / _mod._hkconfig.CLAUDE_SETTINGS).write_text(settings)
+
+    def test_reduces_settings_to_bases_and_wiring(self, home: Path) -> None:
+        hook = {"type": "command", "command": "guard-mutating-api.py", "timeout": 5}
+        hooks = {"PreToolUse": [{"matcher": "Bash", "hooks": [hook]}], "Stop": []}
+        self._write(home, ["Bash(eval:*)", "Read(~/.ssh)"], hooks)
+        claude = _mod._hkconfig.claude()
+        assert claude.deny_bases == {"eval"}
+        assert claude.allow_bases == {"ls"}
+        # Only what the wiring and deny checks read is kept.
+        assert claude.wiring == {
+            "permissions": {"deny": ["Read(~/.ssh)"]},
+            "hooks": {
+                "PreToolUse": [{"matcher": "Bash", "hooks": [{"command": "guard-mutating-api.py"}]}]
+            },
+        }
+        assert _mod.check_gh_api_gate(claude.wiring, hook_exists=True) == []
+
+    def test_unchanged_config_is_not_reparsed(self, home: Path, monkeypatch) -> None:
+        self._write(home, ["Bash(eval:*)"])
+        _mod._hkconfig.claude()
+        monkeypatch.setattr(_mod._hkconfig, "_memo", {})
+        monkeypatch.setattr(_mod._hkconfig, "reduce_claude", pytest.fail)
+        assert _mod._hkconfig.claude().deny_bases == {"eval"}
+
+    def test_edited_config_is_reparsed(self, home: Path, monkeypatch) -> None:
+        self._write(home, ["Bash(eval:*)"])
+        _mod._hkconfig.claude()
+        self._write(home, ["Bash(eval:*)", "Bash(rm -rf:*)"])
+        assert _mod._hkconfig.claude().deny_bases == {"eval", "rm -rf"}
+
+    def test_missing_config_raises_oserror(self, home: Path) -> None:
+        with pytest.raises(OSError):
+            _mod._hkconfig.opencode()
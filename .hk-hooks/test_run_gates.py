@@ -0,0 +1,207 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["pytest"]
+# ///
+"""Tests for the shared Python-gate runner.
+
+Manual-only, like the other .hk-hooks tests:
+`uv run --with pytest pytest ~/.hk-hooks/test_run_gates.py -v`.
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location("run_gates", Path(__file__).parent / "run-gates.py")
+assert _spec and _spec.loader
+_mod = importlib.util.module_from_spec(_spec)
+sys.modules["run_gates"] = _mod
+_spec.loader.exec_module(_mod)
+
+_HK = """\
+local py_gates = new Mapping<String, Step> {
+    ["lint-a"] {
+        glob = List(".config/tmux/tmux.conf", ".hk-hooks/lint-a.py")
+        check = "python3 .hk-hooks/lint-a.py"
+    }
+    ["lint-b"] {
+        glob = List(".config/zsh/functions/**/*")
+        check = "python3 .hk-hooks/lint-b.py {{files}}"
+    }
+    ["always"] {
+        check = "python3 .hk-hooks/always.py"
+    }
+}
+local fast_steps = new Mapping<String, Step> {
+    ["py-gates"] {
+        check = "python3 .hk-hooks/run-gates.py {{files}}"
+    }
+    ["shell"] {
+        glob = List("**/*.sh")
+        check = "bash .hk-hooks/shell.sh"
+    }
+}
+"""
+
+
+def _gates() -> list:
+    gc = _mod.load_gate(".hk-hooks/gate-coverage.py")
+    return _mod.gates_from_steps(gc.parse_hk_steps(_HK))
+
+
+# --- glob_regex ------------------------------------------------------------
+
+
+class TestGlobRegex:
+    @pytest.mark.parametrize(
+        ("glob", "path", "hit"),
+        [
+            ("**/*.py", "a.py", True),
+            ("**/*.py", "x/y/a.py", True),
+            ("**/*.py", "a.pyi", False),
+            (".config/zsh/functions/**/*", ".config/zsh/functions/fzf/pick", True),
+            (".config/zsh/functions/**/*", ".config/zsh/functions/pick", True),
+            (".config/tmux/*.conf", ".config/tmux/sub/x.conf", False),
+            ("hk.pkl", "hk.pkl", True),
+            ("hk.pkl", "hkxpkl", False),
+            ("?.md", "a.md", True),
+        ],
+    )
+    def test_matches_like_hk(self, glob: str, path: str, hit: bool) -> None:
+        assert bool(_mod.glob_regex(glob).match(path)) is hit
+
+
+# --- gates_from_steps / select ---------------------------------------------
+
+
+def test_only_plain_python_gates_are_owned() -> None:
+    gates = _gates()
+    assert [g.step for g in gates] == ["always", "lint-a", "lint-b"]
+    assert [g.takes_files for g in gates] == [False, False, True]
+
+
+class TestSelect:
+    def test_no_files_runs_every_gate(self) -> None:
+        assert [g.step for g, _ in _mod.select(_gates(), [])] == ["always", "lint-a", "lint-b"]
+
+    def test_only_matching_gates_with_their_files(self) -> None:
+        files = [".config/zsh/functions/fzf/pick", "README.md"]
+        chosen = {g.step: f for g, f in _mod.select(_gates(), files)}
+        assert chosen == {"always": files, "lint-b": [".config/zsh/functions/fzf/pick"]}
+
+
+# --- run: per-gate output --------------------------------------------------
+
+
+def _write_gate(tmp_path: Path, name: str, body: str, takes_files: bool = False) -> _mod.Gate:
+    (tmp_path / f"{name}.py").write_text(f"import sys\n\n{body}")
+    return _mod.Gate(name, (), f".hk-hooks/{name}.py", takes_files)
+
+
+def test_each_gate_output_and_exit_stay_its_own(tmp_path, monkeypatch, capsys) -> None:
+    monkeypatch.setattr(_mod, "HERE", tmp_path)
+    ok = _write_gate(tmp_path, "ok", "def main(err=None):\n    return 0\n")
+    bad = _write_gate(
+        tmp_path, "bad", "def main(err=None):\n    print('nope', file=err)\n    return 1\n"
+    )
+    boom = _write_gate(tmp_path, "boom", "def main(err=None):\n    raise ValueError('kaput')\n")
+    exits = _write_gate(tmp_path, "exits", "def main(err=None):\n    sys.exit(3)\n")
+
+    results = _mod.run([(ok, []), (bad, []), (boom, []), (exits, [])])
+
+    assert [(r.step, r.code) for r in results] == [("ok", 0), ("bad", 1), ("boom", 1), ("exits", 3)]
+    assert results[0].output == ""
+    assert results[1].output == "nope\n"
+    assert "ValueError: kaput" in results[2].output
+    assert capsys.readouterr() == ("", "")
+
+
+def test_gate_taking_files_gets_them_as_argv(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(_mod, "HERE", tmp_path)
+    body = "def main(argv=None, err=None):\n    print(repr(argv), file=err)\n"
+    gate = _write_gate(tmp_path, "echo", body, takes_files=True)
+
+    [full] = _mod.run([(gate, [])])
+    [staged] = _mod.run([(gate, ["a", "b"])])
+
+    assert full.output == "[]\n"
+    assert staged.output == "['a', 'b']\n"
+
+
+# --- timing ----------------------------------------------------------------
+
+
+def test_each_gate_is_timed_per_phase(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(_mod, "HERE", tmp_path)
+    body = (
+        "import _hktime\n\n"
+        "def main(err=None):\n"
+        "    with _hktime.phase('read'):\n        pass\n"
+        "    with _hktime.phase('check'):\n        pass\n"
+        "    with _hktime.phase('check'):\n        pass\n"
+        "    return 0\n"
+    )
+    gate = _write_gate(tmp_path, "phased", body)
+
+    [result] = _mod.run([(gate, [])])
+
+    assert result.timing.gate == "phased"
+    assert set(result.timing.phases) == {"read", "check"}
+    assert result.timing.ms >= sum(result.timing.phases.values())
+
+
+def test_over_budget_names_the_gate_and_its_phases() -> None:
+    timing = _mod._hktime.Timing("slow", ms=250.0, phases={"parse": 200.0, "read": 40.0})
+    assert _mod._hktime.over_budget(timing, 100) == (
+        "hk-timing: slow took 250 ms (budget 100 ms; read 40, parse 200)"
+    )
+    assert _mod._hktime.over_budget(timing, 300) is None
+    assert _mod._hktime.over_budget(timing, None) is None
+
+
+def test_main_logs_a_record_per_gate_and_warns_over_budget(tmp_path, monkeypatch, capsys) -> None:
+    monkeypatch.setattr(_mod, "HERE", tmp_path)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "gate-coverage.py").write_text(
+        (Path(__file__).parent / "gate-coverage.py").read_text()
+    )
+    _write_gate(tmp_path, "quick", "def main(err=None):\n    return 0\n")
+    (tmp_path / "hk.pkl").write_text(
+        '    ["quick"] {\n        check = "python3 .hk-hooks/quick.py"\n    }\n'
+    )
+    log = tmp_path / "timing.jsonl"
+
+    assert _mod.main(["--budget-ms", "-1", "--timing-log", str(log)]) == 0
+
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [r["gate"] for r in records] == ["quick", "run-gates"]
+    assert records[0]["exit"] == 0
+    assert "hk-timing: quick took" in capsys.readouterr().err
+
+
+def test_main_runs_the_gates_the_staged_files_trigger(tmp_path, monkeypatch, capsys) -> None:
+    monkeypatch.setattr(_mod, "HERE", tmp_path)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "gate-coverage.py").write_text(
+        (Path(__file__).parent / "gate-coverage.py").read_text()
+    )
+    _write_gate(tmp_path, "always", "def main(err=None):\n    return 0\n")
+    _write_gate(tmp_path, "lint-a", "def main(err=None):\n    return 0\n")
+    _write_gate(
+        tmp_path,
+        "lint-b",
+        "def main(argv=None, err=None):\n    print(*argv, file=err)\n    return 1\n",
+    )
+    (tmp_path / "hk.pkl").write_text(_HK)
+    log = tmp_path / "timing.jsonl"
+
+    assert _mod.main(["--timing-log", str(log), ".config/tmux/tmux.conf"]) == 0
+    assert _mod.main(["--timing-log", str(log), ".config/zsh/functions/x", "README.md"]) == 1
+
+    gates = [json.loads(line)["gate"] for line in log.read_text().splitlines()]
+    assert gates == ["always", "lint-a", "run-gates", "always", "lint-b", "run-gates"]
+    err = capsys.readouterr().err
+    assert "run-gates: lint-b failed (exit 1)\n.config/zsh/functions/x\n" in err
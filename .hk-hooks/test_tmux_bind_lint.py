@@ -138,3 +138,62 @@ class TestFindConflicts:
     def test_clean_config_no_findings(self) -> None:
         text = "bind n next-window\nbind p previous-window\nbind -n C-h select-pane -L"
         assert _mod.find_conflicts(_mod.parse_conf(text)) == []
+
+    def test_duplicate_across_sourced_files_one_finding(self) -> None:
+        bindings = _mod.parse_conf("bind -n M-x a\nbind n next-window") + _mod.parse_conf(
+            "bind n other-cmd", "extra.conf"
+        )
+        [f] = _mod.find_conflicts(bindings)
+        assert isinstance(f, _mod.Duplicate)
+        assert (f.key, f.lines, f.sources) == ("n", (2, 1), ("", "extra.conf"))
+        assert _mod.render(f) == (
+            "duplicate bind: key 'n' in table 'prefix' bound at"
+            " .config/tmux/tmux.conf:2, extra.conf:1 - tmux keeps only the last"
+        )
+
+    def test_alias_collision_across_sourced_files_one_finding(self) -> None:
+        bindings = _mod.parse_conf("bind Tab last-window") + _mod.parse_conf(
+            "bind C-i next-window", "extra.conf"
+        )
+        [f] = _mod.find_conflicts(bindings)
+        assert isinstance(f, _mod.AliasCollision)
+        assert "(.config/tmux/tmux.conf:1)" in _mod.render(f)
+        assert "(extra.conf:1)" in _mod.render(f)
+
+    def test_finding_inside_one_sourced_file_is_prefixed_with_it(self) -> None:
+        [f] = _mod.find_conflicts(_mod.parse_conf("bind n a\nbind n b", "extra.conf"))
+        assert _mod.render(f).startswith("extra.conf: duplicate bind: key 'n'")
+        assert "bound on lines 1, 2" in _mod.render(f)
+
+
+# --- sourced_paths: what tmux.conf pulls in ---------------------------------
+
+
+class TestSourcedPaths:
+    def test_home_forms_flags_and_quotes(self, tmp_path: Path) -> None:
+        text = (
+            "source-file ~/.config/tmux/a.conf\n"
+            'source -q "$HOME/b.conf"\n'
+            "source-file -F -q ${HOME}/c.conf\n"
+            "source-file rel.conf\n"
+        )
+        assert _mod.sourced_paths(text, tmp_path) == [
+            tmp_path / ".config/tmux/a.conf",
+            tmp_path / "b.conf",
+            tmp_path / "c.conf",
+            tmp_path / "rel.conf",
+        ]
+
+    def test_globs_expand_sorted(self, tmp_path: Path) -> None:
+        for name in ("z.conf", "a.conf", "skip.txt"):
+            (tmp_path / name).write_text("")
+        assert _mod.sourced_paths("source-file ~/*.conf\n", tmp_path) == [
+            tmp_path / "a.conf",
+            tmp_path / "z.conf",
+        ]
+
+    def test_binds_and_formats_are_not_sources(self, tmp_path: Path) -> None:
+        text = (
+            "bind r source-file ~/.config/tmux/tmux.conf\nsource-file '#{d:current_file}/x.conf'\n"
+        )
+        assert _mod.sourced_paths(text, tmp_path) == []
@@ -15,6 +15,14 @@ Two conflicts block the commit:
 The same key in *different* tables (C-l in prefix/root/copy-mode-vi) is
 legitimate and never flagged - conflicts key on (table, key).
 
+Files tmux.conf pulls in with a top-level `source-file` are linted too, as
+part of one key space: tmux loads them into the same tables, so a key bound in
+tmux.conf and again in a sourced file is a duplicate (a finding names the
+files). The gate sits on every commit, so a
+clean verdict is cached (~/.cache/hk-hooks, see _hkcache.py) under the hash of
+all those sources together: while none of them changes, a run reads and
+hashes them and skips the parse entirely.
+
 Exit codes: 0 = no conflicts, 1 = a duplicate or alias collision.
 
 Tests:
@@ -24,11 +32,16 @@ Tests:
 
 from __future__ import annotations
 
+import glob
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import assert_never
+from typing import TextIO, assert_never
+
+import _hkcache
+import _hkio
+import _hktime
 
 CONF_REL = ".config/tmux/tmux.conf"
 
@@ -52,13 +65,17 @@ class Binding:
     table: str
     key: str
     line: int
+    source: str = ""  # the sourced file it is in; "" for tmux.conf itself
 
 
 @dataclass(frozen=True, slots=True)
 class Duplicate:
+    """`lines[i]` is in `sources[i]`, in the order tmux loads them."""
+
     table: str
     key: str
     lines: tuple[int, ...]
+    sources: tuple[str, ...]
 
 
 @dataclass(frozen=True, slots=True)
@@ -68,6 +85,8 @@ class AliasCollision:
     key_b: str
     line_a: int
     line_b: int
+    source_a: str = ""
+    source_b: str = ""
 
 
 Finding = Duplicate | AliasCollision
@@ -124,8 +143,11 @@ def normalise_key(raw: str) -> str:
     return raw
 
 
-def parse_conf(text: str) -> list[Binding]:
-    """Parse tmux.conf text into typed Bindings (ignores unbind/unbind-key)."""
+def parse_conf(text: str, source: str = "") -> list[Binding]:
+    """Parse tmux.conf text into typed Bindings (ignores unbind/unbind-key).
+
+    `source` names the sourced file the text came from, for the findings.
+    """
     bindings: list[Binding] = []
     for line, content in _join_continuations(text):
         head = _BIND_HEAD.match(content)
@@ -160,26 +182,31 @@ def parse_conf(text: str) -> list[Binding]:
         token = rest.split(None, 1)[0] if rest.split(None, 1) else ""
         if not token:
             continue
-        bindings.append(Binding(table=table, key=normalise_key(token), line=line))
+        bindings.append(Binding(table, normalise_key(token), line, source))
     return bindings
 
 
 def find_conflicts(bindings: list[Binding]) -> list[Finding]:
-    """Report duplicate (table, key) binds and same-table alias collisions."""
+    """Report duplicate (table, key) binds and same-table alias collisions.
+
+    `bindings` is every loaded file's binds in load order, so binds from
+    different files collide exactly as they do in the server.
+    """
     findings: list[Finding] = []
 
     # Duplicates: >=2 bindings sharing (table, key).
-    seen: dict[tuple[str, str], list[int]] = {}
+    seen: dict[tuple[str, str], list[Binding]] = {}
     for b in bindings:
-        seen.setdefault((b.table, b.key), []).append(b.line)
-    for (table, key), lines in seen.items():
-        if len(lines) > 1:
-            findings.append(Duplicate(table=table, key=key, lines=tuple(sorted(lines))))
+        seen.setdefault((b.table, b.key), []).append(b)
+    for (table, key), binds in seen.items():
+        if len(binds) > 1:
+            lines = tuple(b.line for b in binds)
+            findings.append(Duplicate(table, key, lines, tuple(b.source for b in binds)))
 
     # Alias collisions: a table binds both members of a pair via different keys.
-    by_table: dict[str, dict[str, int]] = {}
+    by_table: dict[str, dict[str, Binding]] = {}
     for b in bindings:
-        by_table.setdefault(b.table, {}).setdefault(b.key, b.line)
+        by_table.setdefault(b.table, {}).setdefault(b.key, b)
     for table, keys in by_table.items():
         for a, z in ALIAS_PAIRS:
             if a in keys and z in keys:
@@ -188,31 +215,80 @@ def find_conflicts(bindings: list[Binding]) -> list[Finding]:
                         table=table,
                         key_a=a,
                         key_b=z,
-                        line_a=keys[a],
-                        line_b=keys[z],
+                        line_a=keys[a].line,
+                        line_b=keys[z].line,
+                        source_a=keys[a].source,
+                        source_b=keys[z].source,
                     )
                 )
     return findings
 
 
+def _origin(sources: tuple[str, ...]) -> str | None:
+    """The one file every site is in ("" for tmux.conf), or None if several."""
+    return sources[0] if len(set(sources)) == 1 else None
+
+
+def _site(source: str, line: int) -> str:
+    return f"{source or CONF_REL}:{line}"
+
+
 def render(finding: Finding) -> str:
     """Render one finding to a single-line diagnostic message."""
     match finding:
-        case Duplicate(table, key, lines):
-            locs = ", ".join(str(n) for n in lines)
+        case Duplicate(table, key, lines, sources):
+            origin = _origin(sources)
+            if origin is None:
+                where = "at " + ", ".join(_site(s, n) for s, n in zip(sources, lines, strict=True))
+            else:
+                where = "on lines " + ", ".join(str(n) for n in lines)
             return (
-                f"duplicate bind: key {key!r} in table {table!r} bound on lines {locs}"
-                f" - tmux keeps only the last"
+                f"{f'{origin}: ' if origin else ''}duplicate bind: key {key!r} in table"
+                f" {table!r} bound {where} - tmux keeps only the last"
             )
-        case AliasCollision(table, key_a, key_b, line_a, line_b):
+        case AliasCollision(table, key_a, key_b, line_a, line_b, source_a, source_b):
+            origin = _origin((source_a, source_b))
+            if origin is None:
+                at_a, at_b = _site(source_a, line_a), _site(source_b, line_b)
+            else:
+                at_a, at_b = f"line {line_a}", f"line {line_b}"
             return (
-                f"alias collision: {key_a!r} (line {line_a}) and {key_b!r} (line {line_b})"
-                f" in table {table!r} send the same byte - the second shadows the first"
+                f"{f'{origin}: ' if origin else ''}alias collision: {key_a!r} ({at_a}) and"
+                f" {key_b!r} ({at_b}) in table {table!r} send the same byte"
+                f" - the second shadows the first"
             )
         case _:
             assert_never(finding)
 
 
+_SOURCE_HEAD = re.compile(r"^\s*source(?:-file)?\s+(?:-[A-Za-z]+\s+)*(\S+)")
+
+
+def sourced_paths(text: str, home: Path) -> list[Path]:
+    """Files a config pulls in with top-level `source-file`, globs expanded.
+
+    A path built from a tmux format (`#{...}`) only resolves in the server, so
+    it is skipped; relative paths resolve against `home`.
+    """
+    paths: list[Path] = []
+    for _, content in _join_continuations(text):
+        m = _SOURCE_HEAD.match(content)
+        if not m:
+            continue
+        raw = normalise_key(m.group(1))  # one layer of quotes, as for keys
+        if "#{" in raw:
+            continue
+        raw = raw.replace("${HOME}", str(home)).replace("$HOME", str(home))
+        if raw == "~" or raw.startswith("~/"):
+            raw = str(home) + raw[1:]
+        raw = str(home / raw)  # no-op for an absolute path
+        if any(c in raw for c in "*?["):
+            paths += [Path(p) for p in sorted(glob.glob(raw))]
+        else:
+            paths.append(Path(raw))
+    return paths
+
+
 # --- imperative shell ------------------------------------------------------
 
 
@@ -222,18 +298,66 @@ def _resolve(rel: str) -> Path:
     return p if p.exists() else Path.home() / rel
 
 
-def main() -> int:
+def _display(path: Path) -> str:
+    home = Path.home()
+    return path.relative_to(home).as_posix() if path.is_relative_to(home) else str(path)
+
+
+def read_sources(conf_text: str) -> list[tuple[str, str]]:
+    """(name, text) for each file tmux.conf source-files, depth-first, each once.
+
+    A missing or unreadable sourced file is left out: tmux reports that at load
+    time, and this gate is about binds.
+    """
+    sources: list[tuple[str, str]] = []
+    seen: set[Path] = set()
+
+    def walk(text: str) -> None:
+        for path in sourced_paths(text, Path.home()):
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                sourced = _hkio.read_text(path)
+            except (OSError, UnicodeDecodeError):
+                continue
+            sources.append((_display(path), sourced))
+            walk(sourced)
+
+    walk(conf_text)
+    return sources
+
+
+def main(err: TextIO | None = None) -> int:
+    err = err or sys.stderr
     path = _resolve(CONF_REL)
     try:
-        text = path.read_text()
-    except OSError as e:
-        print(f"tmux-bind-lint: cannot read {CONF_REL} ({e})", file=sys.stderr)
+        with _hktime.phase("read"):
+            text = _hkio.read_text(path)
+            sources = [(CONF_REL, text), *read_sources(text)]
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"tmux-bind-lint: cannot read {CONF_REL} ({e})", file=err)
         return 1
-    findings = find_conflicts(parse_conf(text))
+
+    version = _hkcache.source_version(__file__)
+    key = _hkcache.digest(*(part.encode() for source in sources for part in source))
+    if _hkcache.load("tmux-bind-lint", version).get("clean") == key:
+        return 0
+
+    with _hktime.phase("parse"):
+        bindings = [
+            binding
+            for name, source_text in sources
+            for binding in parse_conf(source_text, "" if name == CONF_REL else name)
+        ]
+    with _hktime.phase("check"):
+        findings = find_conflicts(bindings)
     for finding in findings:
-        print(f"tmux-bind-lint: {render(finding)}", file=sys.stderr)
+        print(f"tmux-bind-lint: {render(finding)}", file=err)
+    if not findings:
+        _hkcache.save("tmux-bind-lint", version, {"clean": key})
     return 1 if findings else 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_hktime.run("tmux-bind-lint", main))